@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: adaptive_timeout.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Адаптивный таймаут чтения по наблюдаемому времени ответа
+#           (сглаженное среднее и разброс, как RTO в TCP, RFC 6298).
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import math
+import threading
+
+# Шаг сетки значений таймаута порта
+TIMEOUT_STEP = 1.25
+
+
+class RttEstimator:
+    """
+    Класс оценки времени ответа устройства.
+    Таймаут равен srtt + k * rttvar и ограничен снизу floor и сверху
+    ceiling. После таймаута значение удваивается (до ceiling), первый
+    успешный ответ возвращает расчёт по оценке.
+    """
+
+    def __init__(self, initial: float = 1.0, floor: float = 0.05,
+                 ceiling: float = 5.0, alpha: float = 1 / 8,
+                 beta: float = 1 / 4, k: float = 4.0):
+        """
+        initial: таймаут до первого измерения
+        floor, ceiling: нижняя и верхняя граница таймаута
+        alpha, beta: веса сглаживания среднего и разброса
+        k: множитель разброса
+        """
+        if not 0 < floor <= ceiling:
+            raise ValueError(
+                f"Invalid timeout bounds: floor={floor}, ceiling={ceiling}")
+
+        self.floor = floor
+        self.ceiling = ceiling
+        self.alpha = alpha
+        self.beta = beta
+        self.k = k
+        self.srtt = None
+        self.rttvar = None
+        self.samples = 0
+        self.timeouts = 0
+        self._rto = self._clamp(initial)
+        self._lock = threading.Lock()
+
+    def _clamp(self, value: float) -> float:
+        """
+        Ограничивает таймаут границами.
+        """
+        return min(max(value, self.floor), self.ceiling)
+
+    @property
+    def timeout(self) -> float:
+        """
+        Текущий таймаут чтения.
+        """
+        return self._rto
+
+    def port_timeout(self, current: float = None) -> float:
+        """
+        Возвращает таймаут, который следует установить порту или сокету,
+        если сейчас установлен current. Смена таймаута - системный вызов,
+        поэтому значение меняется с гистерезисом: растёт сразу, как только
+        оценка превысит current, уменьшается - когда оценка станет меньше
+        половины current. Новое значение округляется вверх до сетки
+        TIMEOUT_STEP ** n. В остальных случаях возвращается current.
+        """
+        timeout = self._rto
+        if (
+            current is not None
+            and current / 2 <= timeout <= current <= self.ceiling
+        ):
+            return current
+        step = TIMEOUT_STEP ** math.ceil(math.log(timeout, TIMEOUT_STEP))
+        return min(step, self.ceiling)
+
+    def observe(self, rtt: float):
+        """
+        Учитывает измеренное время ответа.
+        """
+        with self._lock:
+            if self.srtt is None:
+                self.srtt = rtt
+                self.rttvar = rtt / 2
+            else:
+                self.rttvar = ((1 - self.beta) * self.rttvar
+                               + self.beta * abs(self.srtt - rtt))
+                self.srtt = (1 - self.alpha) * self.srtt + self.alpha * rtt
+            self.samples += 1
+            self._rto = self._clamp(self.srtt + self.k * self.rttvar)
+
+    def on_timeout(self):
+        """
+        Учитывает таймаут: удваивает текущий таймаут.
+        """
+        with self._lock:
+            self.timeouts += 1
+            self._rto = self._clamp(self._rto * 2)
+
+    def __repr__(self):
+        return (f"RttEstimator(timeout={self._rto:.4f}, srtt={self.srtt}, "
+                f"rttvar={self.rttvar})")
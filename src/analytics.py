@@ -0,0 +1,115 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: analytics.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Векторные вычисления над историей измерений парка устройств:
+#           скользящие min/max/mean/std и выход за допустимый диапазон.
+# Примечание: Требует numpy.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from src.measurement import MEASUREMENT_UNITS
+
+
+def parse_values(responses: list, response_type: str) -> np.ndarray:
+    """
+    Извлекает числа из ответов вида V_<n>V или A_<n>A.
+    Возвращает массив float64, некорректные ответы заменяются на NaN.
+    """
+    unit = MEASUREMENT_UNITS.get(response_type)
+    if unit is None:
+        raise ValueError(
+            f"Invalid measurement type: {response_type}. \
+Valid types are: {list(MEASUREMENT_UNITS)}"
+        )
+
+    raw = np.asarray(responses)
+    if raw.dtype.kind == 'U':
+        raw = np.char.encode(raw, 'ascii', 'replace')
+    elif raw.dtype.kind != 'S':
+        raw = raw.astype(np.bytes_)
+    digits = np.char.rstrip(np.char.lstrip(raw, unit + b'_'), unit)
+    valid = (np.char.startswith(raw, unit + b'_')
+             & np.char.endswith(raw, unit)
+             & np.char.isdigit(digits)
+             & (np.char.str_len(raw) == np.char.str_len(digits) + 3))
+
+    values = np.full(raw.shape, np.nan)
+    values[valid] = digits[valid].astype(np.int64)
+    return values
+
+
+def history_matrix(store, response_type: str, length: int,
+                   device_ids: list = None) -> tuple:
+    """
+    Собирает последние length отсчётов рядов TelemetryStore в матрицу
+    (устройства x отсчёты). Короткие ряды дополняются NaN слева.
+    Возвращает (список устройств, матрица float64).
+    """
+    if device_ids is None:
+        device_ids = [device_id for device_id, kind in store.keys()
+                      if kind == response_type]
+
+    matrix = np.full((len(device_ids), length), np.nan)
+    for row, device_id in enumerate(device_ids):
+        segments = store.series(device_id, response_type).window(length)
+        end = length
+        for _, values in reversed(segments):
+            start = end - len(values)
+            matrix[row, start:end] = np.frombuffer(values, dtype=np.int64)
+            end = start
+    return device_ids, matrix
+
+
+def rolling_stats(matrix: np.ndarray, window: int) -> dict:
+    """
+    Скользящие min, max, mean и std по строкам матрицы.
+    Возвращает словарь массивов формы (устройства, отсчёты - window + 1).
+    Окна, содержащие NaN, дают NaN.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    if not 0 < window <= matrix.shape[-1]:
+        raise ValueError(
+            f"Invalid window: {window}. Window must be in "
+            f"1..{matrix.shape[-1]}")
+
+    windows = sliding_window_view(matrix, window, axis=-1)
+    return {
+        'min': windows.min(axis=-1),
+        'max': windows.max(axis=-1),
+        'mean': windows.mean(axis=-1),
+        'std': windows.std(axis=-1)
+    }
+
+
+def out_of_range(matrix: np.ndarray, low, high) -> np.ndarray:
+    """
+    Маска отсчётов вне диапазона [low, high].
+    low и high - числа или массивы по устройствам. NaN не считается
+    выходом за диапазон.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    low = np.asarray(low, dtype=np.float64)
+    high = np.asarray(high, dtype=np.float64)
+    if low.ndim == 1:
+        low = low[:, np.newaxis]
+    if high.ndim == 1:
+        high = high[:, np.newaxis]
+    return (matrix < low) | (matrix > high)
+
+
+def alarms(matrix: np.ndarray, low, high, min_count: int = 1) -> np.ndarray:
+    """
+    Индексы устройств, у которых не меньше min_count отсчётов
+    вне диапазона [low, high].
+    """
+    counts = out_of_range(matrix, low, high).sum(axis=-1)
+    return np.flatnonzero(counts >= min_count)
@@ -0,0 +1,282 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: async_device_controller.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Асинхронный класс для работы с устройством по serial-интерфейсу.
+# Примечание: Требует цикла событий с поддержкой add_reader (POSIX).
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import os
+import serial
+from src.device_controller import DeviceController
+from src.line_reader import LineReader
+
+
+class AsyncDeviceController:
+    """
+    Класс вызова команд по serial-интерфейсу на asyncio.
+    Порт открывается в неблокирующем режиме, чтение и запись выполняются
+    циклом событий через add_reader и add_writer на файловом дескрипторе
+    порта.
+    """
+
+    COMMANDS = DeviceController.COMMANDS
+
+    RESPONSE_PATTERNS = DeviceController.RESPONSE_PATTERNS
+
+    REQUEST_FRAMES = DeviceController.REQUEST_FRAMES
+
+    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 1.0):
+        self.port = port
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.serial_connection = None
+        self.line_reader = LineReader()
+        self._loop = None
+        self._lock = asyncio.Lock()
+        self._data_ready = asyncio.Event()
+        self._read_error = None
+
+    async def open_connection(self):
+        """
+        Устанавливает serial соединение и регистрирует порт в цикле событий.
+        Открытое ранее соединение сначала закрывается.
+        """
+        self.close()
+        self.line_reader.clear()
+        try:
+            self.serial_connection = serial.Serial(
+                port=self.port,
+                baudrate=self.baudrate,
+                timeout=0
+            )
+        except serial.SerialException as e:
+            raise serial.SerialException(
+                f"Failed to open port {self.port}: {str(e)}")
+
+        self._loop = asyncio.get_running_loop()
+        self._read_error = None
+        self._loop.add_reader(self.serial_connection.fileno(),
+                              self._on_readable)
+
+    def _on_readable(self):
+        """
+        Забирает из порта всё, что в нём накопилось.
+        """
+        try:
+            chunk = self.serial_connection.read(
+                self.serial_connection.in_waiting or 1)
+        except serial.SerialException as e:
+            self._read_error = e
+            self._remove_reader()
+        else:
+            if chunk:
+                self.line_reader.feed(chunk)
+        self._data_ready.set()
+
+    def _remove_reader(self):
+        """
+        Снимает порт с наблюдения цикла событий.
+        """
+        if self._loop is not None and self.serial_connection is not None:
+            self._loop.remove_reader(self.serial_connection.fileno())
+            self._loop = None
+
+    async def _write(self, data: bytes):
+        """
+        Записывает data в порт, не блокируя цикл событий: при полном
+        буфере передачи ждёт готовности порта через add_writer, но не
+        дольше timeout. Пишет в дескриптор напрямую: Serial.write с
+        write_timeout=0 крутится в цикле, пока буфер полон.
+        """
+        loop = asyncio.get_running_loop()
+        fd = self.serial_connection.fileno()
+        deadline = loop.time() + self.timeout
+        view = memoryview(data)
+        while view:
+            try:
+                view = view[os.write(fd, view):]
+            except BlockingIOError:
+                pass
+            except OSError as e:
+                raise serial.SerialException(
+                    f"Write to port {self.port} failed: {str(e)}")
+            if not view:
+                return
+
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise serial.SerialTimeoutException("Write timeout occurred")
+            writable = loop.create_future()
+            loop.add_writer(fd, lambda: writable.done()
+                            or writable.set_result(None))
+            try:
+                await asyncio.wait_for(writable, remaining)
+            except asyncio.TimeoutError:
+                raise serial.SerialTimeoutException(
+                    "Write timeout occurred") from None
+            finally:
+                loop.remove_writer(fd)
+
+    async def _read_line(self) -> bytes:
+        """
+        Ожидает одну строку ответа не дольше timeout.
+        """
+        deadline = asyncio.get_running_loop().time() + self.timeout
+
+        while True:
+            line = self.line_reader.next_line()
+            if line is not None:
+                return line
+
+            if self._read_error is not None:
+                raise serial.SerialException(
+                    f"Read from port {self.port} failed: "
+                    f"{str(self._read_error)}")
+
+            self._data_ready.clear()
+            remaining = deadline - asyncio.get_running_loop().time()
+            if remaining <= 0:
+                return self.line_reader.flush()
+            try:
+                await asyncio.wait_for(self._data_ready.wait(), remaining)
+            except asyncio.TimeoutError:
+                return self.line_reader.flush()
+
+    async def send_command(self, command: str) -> str:
+        """
+        Отправляет команду устройству и возвращает ответ.
+        """
+        return (await self.send_commands([command]))[0]
+
+    async def send_commands(self, commands: list) -> list:
+        """
+        Отправляет несколько команд одной записью в порт и возвращает
+        ответы в порядке отправки команд.
+        """
+        if (
+            self.serial_connection is None
+            or not self.serial_connection.is_open
+        ):
+            raise RuntimeError("Serial connection is not open")
+
+        for command in commands:
+            if not self.is_valid_command(command):
+                raise ValueError(
+                    f"Invalid command: {command}. \
+Valid commands are: {list(self.COMMANDS.values())}"
+                )
+
+        if not commands:
+            return []
+
+        async with self._lock:
+            self.serial_connection.reset_input_buffer()
+            self.line_reader.clear()
+            await self._write(
+                b"".join([self.REQUEST_FRAMES[command]
+                          for command in commands]))
+
+            responses = []
+            for _ in commands:
+                response = await self._read_line()
+
+                if not response:
+                    raise serial.SerialTimeoutException(
+                        "Read timeout occurred")
+
+                responses.append(response.decode('utf-8').strip())
+            return responses
+
+    def is_valid_command(self, cmd: str) -> bool:
+        """
+        Проверяет, является ли команда допустимой
+        """
+        return cmd in self.REQUEST_FRAMES
+
+    def validate_response(self, response_type: str, response: str) -> bool:
+        """
+        Валидирует формат ответа от устройства.
+        """
+        pattern = self.RESPONSE_PATTERNS.get(response_type)
+        return pattern.match(response) is not None if pattern else False
+
+    async def get_batch(self, response_types: list) -> dict:
+        """
+        Запрашивает несколько величин за один обмен с устройством.
+        Возвращает словарь {тип ответа: ответ}.
+        """
+        for response_type in response_types:
+            if response_type not in self.COMMANDS:
+                raise ValueError(
+                    f"Invalid response type: {response_type}. \
+Valid types are: {list(self.COMMANDS)}"
+                )
+
+        responses = await self.send_commands(
+            [self.COMMANDS[response_type] for response_type in response_types])
+
+        result = {}
+        for response_type, response in zip(response_types, responses):
+            if not self.validate_response(response_type, response):
+                raise ValueError(
+                    f"Invalid {response_type.lower()} "
+                    f"response format: {response}")
+            result[response_type] = response
+        return result
+
+    async def get_voltage(self) -> str:
+        """
+        Запрашивает напряжение.
+        """
+        response = await self.send_command(self.COMMANDS['VOLTAGE'])
+        if not self.validate_response('VOLTAGE', response):
+            raise ValueError(f"Invalid voltage response format: {response}")
+        return response
+
+    async def get_ampere(self) -> str:
+        """
+        Запрашивает ток.
+        """
+        response = await self.send_command(self.COMMANDS['AMPERE'])
+        if not self.validate_response('AMPERE', response):
+            raise ValueError(f"Invalid ampere response format: {response}")
+        return response
+
+    async def get_serial(self) -> str:
+        """
+        Запрашивает серийный номер.
+        """
+        response = await self.send_command(self.COMMANDS['SERIAL'])
+        if not self.validate_response('SERIAL', response):
+            raise ValueError(f"Invalid serial response format: {response}")
+        return response
+
+    def close(self):
+        """
+        Закрывает соединение.
+        """
+        self._remove_reader()
+        if self.serial_connection and self.serial_connection.is_open:
+            self.serial_connection.close()
+
+    async def __aenter__(self):
+        """
+        Поддерживает асинхронный контекстный менеджер.
+        """
+        await self.open_connection()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        """
+        Автоматически закрывает соединения.
+        """
+        self.close()
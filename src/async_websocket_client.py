@@ -0,0 +1,270 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: async_websocket_client.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Асинхронный WebSocket-клиент для взаимодействия с сервером.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import itertools
+import logging
+from collections import deque
+from src import json_codec, ws_protocol
+from src.websocket_client import WebsocketClient, match_response
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncWebsocketClient:
+    """
+    Класс асинхронного WebSocket-клиента.
+    Все соединения обслуживаются одним циклом событий: ответы читает
+    фоновая задача и сопоставляет их ожидающим запросам так же, как
+    WebsocketClient (match_response); запоздавшие ответы отбрасываются.
+    """
+
+    COMMANDS = WebsocketClient.COMMANDS
+
+    RESPONSE_PATTERNS = WebsocketClient.RESPONSE_PATTERNS
+
+    REQUEST_FRAMES = WebsocketClient.REQUEST_FRAMES
+
+    def __init__(self, url: str = "ws://localhost:8765", timeout: float = 2.0,
+                 request_ids: bool = False):
+        """
+        url: адрес WebSocket-сервера
+        timeout: таймаут на установку соединения и ожидание ответа
+        request_ids: добавлять в запросы поле id для сопоставления ответов
+        """
+        self.url = url
+        self.timeout = timeout
+        self.request_ids = request_ids
+        self.ws = None
+        self._reader_task = None
+        self._request_counter = itertools.count(1)
+        self._pending = {}
+        self._pending_by_cmd = {}
+        self.unmatched_responses = 0
+
+    async def open(self):
+        """
+        Устанавливает соединение
+        """
+        await self.close()
+        self.ws = await asyncio.wait_for(ws_protocol.connect(self.url),
+                                         self.timeout)
+        self._reader_task = asyncio.create_task(self._read_loop(self.ws))
+
+    async def _read_loop(self, ws):
+        """
+        Читает ответы сервера и разрешает ожидающие запросы.
+        """
+        try:
+            while True:
+                message = await ws.recv()
+                try:
+                    response = json_codec.loads(message)
+                except ValueError as e:
+                    # Без request_ids ответы приходят по порядку, и
+                    # нечитаемый ответ относится к самому старому запросу
+                    if self._pending and not self.request_ids:
+                        future = self._resolve(next(iter(self._pending)))
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                self._dispatch(response)
+        except Exception as e:
+            self._fail_pending(e)
+
+    async def send_command(self, cmd: str) -> dict:
+        """
+        Отправляет команду устройству и возвращает ответ (dict).
+        """
+        return (await self.send_commands([cmd]))[0]
+
+    async def send_commands(self, cmds: list) -> list:
+        """
+        Отправляет несколько команд подряд, не дожидаясь ответов,
+        и возвращает ответы в порядке отправки команд.
+        """
+        for cmd in cmds:
+            self._check_command(cmd)
+
+        futures = [await self.submit(cmd) for cmd in cmds]
+        try:
+            return await asyncio.wait_for(asyncio.gather(*futures),
+                                          self.timeout)
+        finally:
+            self._discard(futures)
+
+    async def submit(self, cmd: str) -> asyncio.Future:
+        """
+        Отправляет команду без ожидания ответа и возвращает Future ответа.
+        """
+        self._check_command(cmd)
+
+        request_id = next(self._request_counter)
+        frame = self.REQUEST_FRAMES[cmd]
+        if self.request_ids:
+            frame = json_codec.encode_request(frame, request_id)
+
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = (cmd, future)
+        self._pending_by_cmd.setdefault(cmd, deque()).append(request_id)
+        try:
+            await self.ws.send(frame)
+        except Exception as e:
+            self._resolve(request_id).set_exception(e)
+            raise
+        return future
+
+    def _check_command(self, cmd: str):
+        """
+        Проверяет готовность соединения и допустимость команды.
+        """
+        if self.ws is None or self.ws.closed:
+            raise RuntimeError("WebSocket connection is not open")
+
+        if not self.is_valid_command(cmd):
+            raise ValueError(
+                f"Invalid command: {cmd}. \
+Valid commands are: {list(self.COMMANDS.values())}"
+            )
+
+    def _dispatch(self, response):
+        """
+        Сопоставляет ответ ожидающему запросу (см. match_response).
+        Ответ, не относящийся ни к одному запросу, отбрасывается.
+        """
+        request_id = match_response(response, self._pending,
+                                    self._pending_by_cmd, self.request_ids)
+        if request_id is None:
+            self.unmatched_responses += 1
+            logger.debug("Dropped unmatched response from %s: %r",
+                         self.url, response)
+            return
+
+        future = self._resolve(request_id)
+        if not future.done():
+            future.set_result(response)
+
+    def _resolve(self, request_id: int) -> asyncio.Future:
+        """
+        Снимает запрос с ожидания и возвращает его Future.
+        """
+        cmd, future = self._pending.pop(request_id)
+        ids = self._pending_by_cmd[cmd]
+        ids.remove(request_id)
+        if not ids:
+            del self._pending_by_cmd[cmd]
+        return future
+
+    def _discard(self, futures: list):
+        """
+        Снимает с ожидания запросы, ответ на которые уже не нужен.
+        """
+        futures = set(futures)
+        for request_id, (_, future) in list(self._pending.items()):
+            if future in futures:
+                self._resolve(request_id)
+
+    def _fail_pending(self, error: Exception):
+        """
+        Завершает все ожидающие запросы ошибкой.
+        """
+        pending = self._pending
+        self._pending = {}
+        self._pending_by_cmd = {}
+        for _, future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    def is_valid_command(self, cmd: str) -> bool:
+        """
+        Проверяет, является ли команда допустимой
+        """
+        return cmd in self.REQUEST_FRAMES
+
+    def validate_response(self, response_type: str, response: dict) -> bool:
+        """
+        Валидирует формат ответа от WebSocket сервера.
+        """
+        if (
+            not isinstance(response, dict)
+            or 'cmd' not in response
+            or 'payload' not in response
+        ):
+            return False
+
+        if response['cmd'] != self.COMMANDS[response_type]:
+            return False
+
+        pattern = self.RESPONSE_PATTERNS.get(response_type)
+
+        if not pattern:
+            return False
+
+        return pattern.match(response['payload']) is not None
+
+    async def get_voltage(self) -> str:
+        """
+        Запрашивает напряжение.
+        """
+        response = await self.send_command(self.COMMANDS['VOLTAGE'])
+        if not self.validate_response('VOLTAGE', response):
+            raise ValueError(f"Invalid voltage response format: {response}")
+        return response["payload"]
+
+    async def get_ampere(self) -> str:
+        """
+        Запрашивает ток.
+        """
+        response = await self.send_command(self.COMMANDS['AMPERE'])
+        if not self.validate_response('AMPERE', response):
+            raise ValueError(f"Invalid ampere response format: {response}")
+        return response["payload"]
+
+    async def get_serial(self) -> str:
+        """
+        Запрашивает серийный номер.
+        """
+        response = await self.send_command(self.COMMANDS['SERIAL'])
+        if not self.validate_response('SERIAL', response):
+            raise ValueError(f"Invalid serial response format: {response}")
+        return response["payload"]
+
+    async def close(self):
+        """
+        Закрывает соединение.
+        """
+        self._fail_pending(RuntimeError("WebSocket connection is closed"))
+        ws, self.ws = self.ws, None
+        reader_task, self._reader_task = self._reader_task, None
+        if ws is not None:
+            await ws.close()
+        if reader_task is not None:
+            reader_task.cancel()
+            try:
+                await reader_task
+            except asyncio.CancelledError:
+                pass
+
+    async def __aenter__(self):
+        """
+        Поддерживает асинхронный контекстный менеджер.
+        """
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """
+        Автоматически закрывает соединения.
+        """
+        await self.close()
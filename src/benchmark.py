@@ -0,0 +1,279 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: benchmark.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Замеры DeviceController и WebsocketClient на эмуляторах:
+#           перцентили задержки, команды в секунду, CPU и выделения
+#           памяти на команду. Результаты сохраняются в JSON.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import argparse
+import json
+import math
+import os
+import platform
+import signal
+import subprocess
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import ExitStack, contextmanager
+from datetime import datetime, timezone
+from src import json_codec
+from src.device_controller import DeviceController
+from src.websocket_client import WebsocketClient
+
+FORMAT_VERSION = 1
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+WORKLOADS = {
+    'single': ['GET_V'],
+    'sequential': ['GET_V', 'GET_A', 'GET_S'],
+    'concurrent': ['GET_V']
+}
+
+
+def percentile(values: list, p: float) -> float:
+    """
+    Возвращает p-й перцентиль отсортированного списка (метод
+    ближайшего ранга).
+    """
+    if not values:
+        return None
+    return values[max(0, math.ceil(p / 100 * len(values)) - 1)]
+
+
+def summarize(latencies: list, wall: float, cpu: float,
+              allocations: float = None) -> dict:
+    """
+    Сводка замера: задержки в миллисекундах, команды в секунду,
+    CPU в микросекундах и выделенные байты на команду.
+    """
+    latencies = sorted(latencies)
+    count = len(latencies)
+    return {
+        "commands": count,
+        "latency_ms": {
+            "p50": percentile(latencies, 50) * 1e3,
+            "p95": percentile(latencies, 95) * 1e3,
+            "p99": percentile(latencies, 99) * 1e3,
+            "mean": sum(latencies) / count * 1e3,
+            "max": latencies[-1] * 1e3
+        },
+        "commands_per_second": count / wall,
+        "cpu_us_per_command": cpu / count * 1e6,
+        "alloc_bytes_per_command": allocations
+    }
+
+
+def run_commands(client, commands: list, iterations: int) -> list:
+    """
+    Выполняет iterations команд по кругу и возвращает задержки.
+    """
+    latencies = []
+    for index in range(iterations):
+        started = time.perf_counter()
+        client.send_command(commands[index % len(commands)])
+        latencies.append(time.perf_counter() - started)
+    return latencies
+
+
+def trace_allocations(client, commands: list, iterations: int) -> float:
+    """
+    Возвращает средний пик памяти, выделенной за одну команду.
+    Выполняется отдельным проходом: tracemalloc замедляет обмен.
+    """
+    total = 0
+    tracemalloc.start()
+    try:
+        for index in range(iterations):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            client.send_command(commands[index % len(commands)])
+            total += tracemalloc.get_traced_memory()[1] - before
+    finally:
+        tracemalloc.stop()
+    return total / iterations
+
+
+def run_workload(clients: list, commands: list, iterations: int,
+                 warmup: int = 20, allocations: bool = True) -> dict:
+    """
+    Выполняет замер: каждый клиент в своём потоке выполняет iterations
+    команд. Выделения памяти замеряются только для одного клиента.
+    """
+    for client in clients:
+        run_commands(client, commands, warmup)
+
+    results = [None] * len(clients)
+
+    def worker(index):
+        results[index] = run_commands(clients[index], commands, iterations)
+
+    threads = [threading.Thread(target=worker, args=(index,))
+               for index in range(len(clients))]
+    cpu = time.process_time()
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    wall = time.perf_counter() - started
+    cpu = time.process_time() - cpu
+
+    allocated = None
+    if allocations and len(clients) == 1:
+        allocated = trace_allocations(clients[0], commands,
+                                      min(iterations, 200))
+    return summarize([latency for latencies in results
+                      for latency in latencies], wall, cpu, allocated)
+
+
+@contextmanager
+def emulator_process(kind: str, *options):
+    """
+    Запускает эмулятор в отдельном процессе, чтобы его работа не
+    учитывалась в CPU и памяти клиента. Возвращает путь к порту или URL.
+    """
+    process = subprocess.Popen(
+        [sys.executable, "-m", "src.emulator", kind, *options],
+        stdout=subprocess.PIPE, text=True, cwd=ROOT)
+    try:
+        address = process.stdout.readline().strip()
+        if not address:
+            raise RuntimeError(f"Emulator {kind} failed to start")
+        yield address
+    finally:
+        process.send_signal(signal.SIGINT)
+        try:
+            process.wait(5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        process.stdout.close()
+
+
+def benchmark_transport(transport: str, iterations: int, workers: int,
+                        baudrate: int, emulator_options: list) -> list:
+    """
+    Выполняет все замеры для одного транспорта.
+    """
+    results = []
+    for workload, commands in WORKLOADS.items():
+        count = workers if workload == 'concurrent' else 1
+        with ExitStack() as stack:
+            if transport == 'serial':
+                clients = [
+                    stack.enter_context(DeviceController(
+                        stack.enter_context(emulator_process(
+                            'serial', '--baudrate', str(baudrate),
+                            *emulator_options)),
+                        baudrate=baudrate))
+                    for _ in range(count)
+                ]
+            else:
+                url = stack.enter_context(emulator_process(
+                    'ws', '--port', '0', *emulator_options))
+                clients = [stack.enter_context(WebsocketClient(url))
+                           for _ in range(count)]
+
+            result = run_workload(clients, commands, iterations)
+        result.update(transport=transport, workload=workload,
+                      clients=count)
+        results.append(result)
+    return results
+
+
+def compare(baseline: dict, current: dict) -> list:
+    """
+    Сравнивает два файла результатов. Возвращает строки отчёта
+    с изменением p50 и команд в секунду.
+    """
+    previous = {(result['transport'], result['workload']): result
+                for result in baseline['results']}
+    lines = []
+    for result in current['results']:
+        old = previous.get((result['transport'], result['workload']))
+        if old is None:
+            continue
+        p50 = result['latency_ms']['p50']
+        old_p50 = old['latency_ms']['p50']
+        rate = result['commands_per_second']
+        old_rate = old['commands_per_second']
+        lines.append(
+            f"{result['transport']}/{result['workload']}: "
+            f"p50 {old_p50:.3f} -> {p50:.3f} ms "
+            f"({(p50 / old_p50 - 1) * 100:+.1f}%), "
+            f"{old_rate:.0f} -> {rate:.0f} cmd/s "
+            f"({(rate / old_rate - 1) * 100:+.1f}%)")
+    return lines
+
+
+def main(argv: list = None):
+    """
+    Запуск замеров:
+    python -m src.benchmark --output results.json --compare baseline.json
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--transports", nargs="+",
+                        choices=["serial", "websocket"],
+                        default=["serial", "websocket"])
+    parser.add_argument("--baudrate", type=int, default=115200)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--compare", metavar="BASELINE", default=None)
+    args = parser.parse_args(argv)
+
+    emulator_options = ["--latency", str(args.latency),
+                        "--jitter", str(args.jitter)]
+    report = {
+        "format_version": FORMAT_VERSION,
+        "created": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "json_backend": json_codec.BACKEND,
+        "config": {
+            "iterations": args.iterations,
+            "workers": args.workers,
+            "baudrate": args.baudrate,
+            "latency": args.latency,
+            "jitter": args.jitter
+        },
+        "results": []
+    }
+    for transport in args.transports:
+        report["results"].extend(benchmark_transport(
+            transport, args.iterations, args.workers, args.baudrate,
+            emulator_options))
+
+    with open(args.output, "w") as output:
+        json.dump(report, output, indent=2)
+
+    for result in report["results"]:
+        latency = result['latency_ms']
+        print(f"{result['transport']}/{result['workload']}: "
+              f"p50 {latency['p50']:.3f} ms, p95 {latency['p95']:.3f} ms, "
+              f"p99 {latency['p99']:.3f} ms, "
+              f"{result['commands_per_second']:.0f} cmd/s, "
+              f"{result['cpu_us_per_command']:.1f} us CPU/cmd")
+
+    if args.compare:
+        with open(args.compare) as baseline:
+            for line in compare(json.load(baseline), report):
+                print(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: cached_reader.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Кэш показаний напряжения и тока с фоновым обновлением
+#           (stale-while-revalidate).
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class CachedReader:
+    """
+    Класс кэша показаний перед DeviceController или WebsocketClient.
+    Значение не старше max_age отдаётся сразу. Значение не старше
+    stale_age тоже отдаётся сразу, но запускает фоновое обновление.
+    Более старое значение или его отсутствие заставляет дождаться
+    обмена с устройством; одновременные запросы делят один обмен.
+    Все обмены выполняет один фоновый поток, поэтому клиент
+    не используется из нескольких потоков одновременно.
+    """
+
+    READERS = {
+        'VOLTAGE': 'get_voltage',
+        'AMPERE': 'get_ampere'
+    }
+
+    def __init__(self, client, max_age: float = 1.0, stale_age: float = None,
+                 refresh_interval: float = None, clock=time.monotonic):
+        """
+        client: объект с методами get_voltage/get_ampere
+        max_age: срок, в течение которого значение считается свежим
+        stale_age: срок, в течение которого устаревшее значение ещё
+                   отдаётся без ожидания (по умолчанию 10 * max_age)
+        refresh_interval: период фонового обновления запрошенных величин
+                          (None - обновление только по запросу)
+        """
+        self.client = client
+        self.max_age = max_age
+        self.stale_age = 10 * max_age if stale_age is None else stale_age
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+        self._entries = {}
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1,
+                                            thread_name_prefix="cached-reader")
+        self._stop = threading.Event()
+        self._refresher = None
+        if refresh_interval:
+            self._refresher = threading.Thread(target=self._refresh_loop,
+                                               daemon=True)
+            self._refresher.start()
+
+    def get(self, response_type: str) -> str:
+        """
+        Возвращает показание величины с учётом кэша.
+        """
+        if response_type not in self.READERS:
+            raise ValueError(
+                f"Invalid response type: {response_type}. \
+Valid types are: {list(self.READERS)}"
+            )
+
+        with self._lock:
+            entry = self._entries.get(response_type)
+        if entry is not None:
+            value, timestamp = entry
+            age = self.clock() - timestamp
+            if age <= self.max_age:
+                return value
+            if age <= self.stale_age:
+                self._schedule(response_type)
+                return value
+
+        return self._schedule(response_type).result()
+
+    def get_voltage(self) -> str:
+        """
+        Возвращает напряжение с учётом кэша.
+        """
+        return self.get('VOLTAGE')
+
+    def get_ampere(self) -> str:
+        """
+        Возвращает ток с учётом кэша.
+        """
+        return self.get('AMPERE')
+
+    def _schedule(self, response_type: str):
+        """
+        Запускает обновление величины или возвращает уже запущенное.
+        """
+        with self._lock:
+            future = self._inflight.get(response_type)
+            if future is None:
+                future = self._executor.submit(self._refresh, response_type)
+                self._inflight[response_type] = future
+            return future
+
+    def _refresh(self, response_type: str) -> str:
+        """
+        Запрашивает величину у клиента и обновляет кэш.
+        """
+        try:
+            value = getattr(self.client, self.READERS[response_type])()
+            with self._lock:
+                self._entries[response_type] = (value, self.clock())
+            return value
+        finally:
+            with self._lock:
+                self._inflight.pop(response_type, None)
+
+    def _refresh_loop(self):
+        """
+        Периодически обновляет величины, которые уже запрашивались.
+        """
+        while not self._stop.wait(self.refresh_interval):
+            with self._lock:
+                response_types = list(self._entries)
+            for response_type in response_types:
+                self._schedule(response_type)
+
+    def invalidate(self):
+        """
+        Сбрасывает кэш.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def close(self):
+        """
+        Останавливает фоновое обновление.
+        """
+        self._stop.set()
+        if self._refresher is not None:
+            self._refresher.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Останавливает фоновое обновление.
+        """
+        self.close()
@@ -0,0 +1,232 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: circuit_breaker.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Автомат защиты (circuit breaker) для неотвечающих устройств:
+#           после серии сбоев обращения отклоняются сразу, через
+#           recovery_timeout пробный обмен решает, вернуть ли устройство.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import threading
+import time
+import serial
+import websocket
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+FAILURES = (serial.SerialException,
+            websocket.WebSocketException,
+            OSError,
+            TimeoutError)
+
+
+class CircuitOpenError(Exception):
+    """
+    Обращение отклонено: автомат защиты разомкнут.
+    """
+
+
+class CircuitBreaker:
+    """
+    Класс автомата защиты одного устройства.
+    CLOSED - обмены разрешены, подряд идущие сбои считаются;
+    OPEN - после failure_threshold сбоев обмены сразу завершаются
+    CircuitOpenError; HALF_OPEN - через recovery_timeout разрешается
+    half_open_probes пробных обменов: успех замыкает автомат, сбой
+    снова размыкает его.
+    Сбоями считаются исключения из failures; прочие исключения
+    (например, ошибка формата ответа) означают, что устройство отвечает.
+    """
+
+    def __init__(self, name: str = None, failure_threshold: int = 5,
+                 recovery_timeout: float = 30.0, half_open_probes: int = 1,
+                 failures: tuple = FAILURES, clock=time.monotonic):
+        """
+        name: имя устройства для сообщений об ошибках
+        failure_threshold: число сбоев подряд для размыкания
+        recovery_timeout: время в разомкнутом состоянии до пробы, с
+        half_open_probes: число одновременных пробных обменов
+        failures: типы исключений, считающиеся сбоем
+        """
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_probes = half_open_probes
+        self.failures = failures
+        self.clock = clock
+        self.consecutive_failures = 0
+        self.trips = 0
+        self.opened_at = None
+        self.listeners = []
+        self._state = CLOSED
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener):
+        """
+        Добавляет обработчик listener(breaker, old_state, new_state),
+        вызываемый при смене состояния.
+        """
+        self.listeners.append(listener)
+
+    def _set_state(self, state: str) -> tuple:
+        """
+        Меняет состояние. Вызывается под блокировкой; возвращает
+        (старое, новое) состояние или None, если оно не изменилось.
+        """
+        if state == self._state:
+            return None
+        change = (self._state, state)
+        self._state = state
+        if state == OPEN:
+            self.opened_at = self.clock()
+            self.trips += 1
+        self._probes = 0
+        return change
+
+    def _notify(self, change: tuple):
+        """
+        Сообщает обработчикам о смене состояния.
+        """
+        if change is not None:
+            for listener in self.listeners:
+                listener(self, *change)
+
+    def _refresh(self) -> tuple:
+        """
+        Переводит автомат в HALF_OPEN по истечении recovery_timeout.
+        Вызывается под блокировкой.
+        """
+        if (
+            self._state == OPEN
+            and self.clock() - self.opened_at >= self.recovery_timeout
+        ):
+            return self._set_state(HALF_OPEN)
+        return None
+
+    @property
+    def state(self) -> str:
+        """
+        Текущее состояние: CLOSED, OPEN или HALF_OPEN.
+        """
+        with self._lock:
+            change = self._refresh()
+            state = self._state
+        self._notify(change)
+        return state
+
+    def before_call(self):
+        """
+        Разрешает обмен или завершает его CircuitOpenError.
+        В состоянии HALF_OPEN обмен занимает место пробы.
+        """
+        with self._lock:
+            change = self._refresh()
+            state = self._state
+            allowed = state == CLOSED
+            if state == HALF_OPEN and self._probes < self.half_open_probes:
+                self._probes += 1
+                allowed = True
+            retry_in = self._retry_in()
+        self._notify(change)
+        if not allowed:
+            raise self._error(state, retry_in)
+
+    def check(self):
+        """
+        Завершает обращение CircuitOpenError, если автомат разомкнут.
+        Место пробы не занимает: используется перед открытием
+        соединения, успех которого ещё не говорит, что устройство отвечает.
+        """
+        with self._lock:
+            change = self._refresh()
+            state = self._state
+            retry_in = self._retry_in()
+        self._notify(change)
+        if state == OPEN:
+            raise self._error(state, retry_in)
+
+    def _error(self, state: str, retry_in: float) -> CircuitOpenError:
+        """
+        Формирует исключение об отклонённом обращении.
+        """
+        return CircuitOpenError(
+            f"Circuit for {self.name} is {state}, retry in {retry_in:.1f}s")
+
+    def _retry_in(self) -> float:
+        """
+        Время до перехода в HALF_OPEN. Вызывается под блокировкой.
+        """
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self.opened_at + self.recovery_timeout - self.clock())
+
+    def record_success(self):
+        """
+        Учитывает успешный обмен.
+        """
+        with self._lock:
+            self.consecutive_failures = 0
+            change = self._set_state(CLOSED)
+        self._notify(change)
+
+    def record_failure(self):
+        """
+        Учитывает сбой обмена.
+        """
+        with self._lock:
+            self.consecutive_failures += 1
+            change = None
+            if (
+                self._state == HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                change = self._set_state(OPEN)
+        self._notify(change)
+
+    def call(self, function, *args, **kwargs):
+        """
+        Выполняет function(*args, **kwargs) под защитой автомата.
+        """
+        self.before_call()
+        try:
+            result = function(*args, **kwargs)
+        except self.failures:
+            self.record_failure()
+            raise
+        except Exception:
+            self.record_success()
+            raise
+        self.record_success()
+        return result
+
+    def reset(self):
+        """
+        Принудительно замыкает автомат.
+        """
+        self.record_success()
+
+    def snapshot(self) -> dict:
+        """
+        Возвращает состояние автомата для мониторинга.
+        """
+        with self._lock:
+            change = self._refresh()
+            snapshot = {
+                "name": self.name,
+                "state": self._state,
+                "consecutive_failures": self.consecutive_failures,
+                "trips": self.trips,
+                "retry_in": self._retry_in()
+            }
+        self._notify(change)
+        return snapshot
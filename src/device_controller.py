@@ -14,6 +14,12 @@
 # ============================================================================
 import serial
 import re
+import threading
+import time
+from src.identity_cache import IdentityCache
+from src.line_reader import LineReader
+from src.measurement import MEASUREMENT_UNITS, Measurement, parse_measurement
+from src.sampler import Sampler
 
 
 class DeviceController:
@@ -33,24 +39,64 @@ class DeviceController:
         'SERIAL': re.compile(r'^S_[A-Z0-9]+$')
     }
 
-    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 1.0):
+    # Кадры запросов кодируются один раз при загрузке класса
+    REQUEST_FRAMES = {command: f"{command}\r\n".encode()
+                      for command in COMMANDS.values()}
+
+    # Шаблоны для проверки ответа без перевода в str
+    RESPONSE_PATTERNS_BYTES = {
+        response_type: re.compile(pattern.pattern.encode('ascii'))
+        for response_type, pattern in RESPONSE_PATTERNS.items()
+    }
+
+    def __init__(self, port: str, baudrate: int = 9600, timeout: float = 1.0,
+                 metrics=None, rtt_estimator=None, circuit_breaker=None,
+                 connection_factory=None):
+        """
+        metrics: набор метрик src.metrics.Metrics (None - не собирать)
+        rtt_estimator: оценка времени ответа
+                       src.adaptive_timeout.RttEstimator; если задана,
+                       таймаут чтения берётся из неё, а не из timeout
+        circuit_breaker: автомат защиты src.circuit_breaker.CircuitBreaker
+                         для открытия порта и обменов
+        connection_factory: фабрика соединений вместо serial.Serial
+                            (например, запись или воспроизведение
+                            src.traffic_recorder)
+        """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.metrics = metrics
+        self.rtt = rtt_estimator
+        self.circuit_breaker = circuit_breaker
+        self.connection_factory = connection_factory
         self.serial_connection = None
+        self._port_timeout = None
+        self.line_reader = LineReader()
+        self.identity = IdentityCache()
+        self._lock = threading.RLock()
         self.open_connection()
 
     def open_connection(self):
         """
         Устанавливает serial соединение.
         """
+        self.identity.invalidate()
+        if self.metrics is not None and self.serial_connection is not None:
+            self.metrics.increment('reconnects', self.port)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.check()
         try:
-            self.serial_connection = serial.Serial(
+            factory = self.connection_factory or serial.Serial
+            self.serial_connection = factory(
                 port=self.port,
                 baudrate=self.baudrate,
                 timeout=self.timeout
             )
+            self._port_timeout = self.timeout
         except serial.SerialException as e:
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.record_failure()
             raise serial.SerialException(
                 f"Failed to open port {self.port}: {str(e)}")
 
@@ -58,75 +104,252 @@ class DeviceController:
         """
         Отправляет команду устройству и возвращает ответ.
         """
+        return self.send_commands([command])[0]
+
+    def send_commands(self, commands: list) -> list:
+        """
+        Отправляет несколько команд одной записью в порт и возвращает
+        ответы в порядке отправки команд.
+        """
+        return [response.decode('utf-8').strip()
+                for response in self._exchange(commands)]
+
+    def _exchange(self, commands: list) -> list:
+        """
+        Выполняет обмен с устройством и возвращает сырые строки ответов.
+        """
         if (
             self.serial_connection is None
             or not self.serial_connection.is_open
         ):
             raise RuntimeError("Serial connection is not open")
 
-        if not self.is_valid_command(command):
-            raise ValueError(
-                f"Invalid command: {command}. \
+        for command in commands:
+            if not self.is_valid_command(command):
+                raise ValueError(
+                    f"Invalid command: {command}. \
 Valid commands are: {list(self.COMMANDS.values())}"
-            )
+                )
 
+        if not commands:
+            return []
+
+        request = b"".join([self.REQUEST_FRAMES[command]
+                            for command in commands])
+        if self.circuit_breaker is not None:
+            return self.circuit_breaker.call(self._send_request, request,
+                                             commands)
+        return self._send_request(request, commands)
+
+    def _send_request(self, request: bytes, commands: list) -> list:
+        """
+        Выполняет обмен под блокировкой соединения с записью метрик.
+        """
+        with self._lock:
+            if self.metrics is None:
+                return self._transfer(request, len(commands))
+
+            started = self.metrics.start(self.port, commands)
+            self.metrics.increment('bytes_sent', self.port, len(request))
+            try:
+                responses = self._transfer(request, len(commands))
+            except Exception as e:
+                self.metrics.finish(self.port, commands, started, e)
+                raise
+            self.metrics.finish(self.port, commands, started)
+            self.metrics.increment('bytes_received', self.port,
+                                   sum(map(len, responses)))
+            return responses
+
+    def _transfer(self, request: bytes, count: int) -> list:
+        """
+        Записывает запрос в порт и читает count строк ответа.
+        Вызывается под блокировкой соединения.
+        """
         self.serial_connection.reset_input_buffer()
-        self.serial_connection.write(f"{command}\r\n".encode())
+        self.line_reader.clear()
+
+        timeout = self.timeout
+        if self.rtt is not None:
+            # Таймаут меняется с гистерезисом: установка timeout
+            # перенастраивает порт (tcsetattr)
+            timeout = self.rtt.port_timeout(self._port_timeout)
+            if timeout != self._port_timeout:
+                self.serial_connection.timeout = self._port_timeout = timeout
+            started = time.monotonic()
+
+        self.serial_connection.write(request)
 
-        response = self.serial_connection.readline()
+        responses = []
+        for _ in range(count):
+            response = self.line_reader.read_line(self.serial_connection,
+                                                  timeout)
 
-        if not response:
-            raise serial.SerialTimeoutException("Read timeout occurred")
+            if not response:
+                if self.rtt is not None:
+                    self.rtt.on_timeout()
+                raise serial.SerialTimeoutException("Read timeout occurred")
 
-        decoded_response = response.decode('utf-8').strip()
-        return decoded_response
+            # Время ответа - до первой строки: остальные строки пакета
+            # приходят следом и занизили бы оценку
+            if self.rtt is not None and not responses:
+                self.rtt.observe(time.monotonic() - started)
+            responses.append(response)
+        return responses
 
     def is_valid_command(self, cmd: str) -> bool:
         """
         Проверяет, является ли команда допустимой
         """
-        return cmd in self.COMMANDS.values()
+        return cmd in self.REQUEST_FRAMES
 
-    def validate_response(self, response_type: str, response: str) -> bool:
+    def validate_response(self, response_type: str, response) -> bool:
         """
-        Валидирует формат ответа от устройства.
+        Валидирует формат ответа от устройства (str или bytes).
         """
-        pattern = self.RESPONSE_PATTERNS.get(response_type)
-        return pattern.match(response) is not None if pattern else False
+        if isinstance(response, bytes):
+            pattern = self.RESPONSE_PATTERNS_BYTES.get(response_type)
+        else:
+            pattern = self.RESPONSE_PATTERNS.get(response_type)
+        valid = pattern.match(response) is not None if pattern else False
+        if not valid and self.metrics is not None:
+            self.metrics.increment('validation_failures', self.port)
+        return valid
+
+    def _request(self, response_type: str) -> bytes:
+        """
+        Запрашивает одну величину и возвращает ответ в bytes без
+        перевода строки; формат ответа проверяется до декодирования.
+        """
+        response = self._exchange([self.COMMANDS[response_type]])[0].strip()
+        if not self.validate_response(response_type, response):
+            if response_type != 'SERIAL':
+                self.identity.invalidate()
+            raise ValueError(
+                f"Invalid {response_type.lower()} response format: "
+                f"{response.decode('utf-8', 'replace')}")
+        return response
 
     def get_voltage(self) -> str:
         """
         Запрашивает напряжение.
         """
-        response = self.send_command(self.COMMANDS['VOLTAGE'])
-        if not self.validate_response('VOLTAGE', response):
-            raise ValueError(f"Invalid voltage response format: {response}")
-        return response
+        return self._request('VOLTAGE').decode('ascii')
 
     def get_ampere(self) -> str:
         """
         Запрашивает ток.
         """
-        response = self.send_command(self.COMMANDS['AMPERE'])
-        if not self.validate_response('AMPERE', response):
-            raise ValueError(f"Invalid ampere response format: {response}")
-        return response
+        return self._request('AMPERE').decode('ascii')
 
     def get_serial(self) -> str:
         """
-        Запрашивает серийный номер.
+        Запрашивает серийный номер. В пределах соединения номер
+        запрашивается у устройства один раз.
         """
-        response = self.send_command(self.COMMANDS['SERIAL'])
-        if not self.validate_response('SERIAL', response):
-            raise ValueError(f"Invalid serial response format: {response}")
+        cached_serial = self.identity.get()
+        if cached_serial is not None:
+            return cached_serial
+
+        response = self._request('SERIAL').decode('ascii')
+        self.identity.set(response)
         return response
 
+    def get_batch(self, response_types: list) -> dict:
+        """
+        Запрашивает несколько величин за один обмен с устройством.
+        Возвращает словарь {тип ответа: ответ}.
+        """
+        for response_type in response_types:
+            if response_type not in self.COMMANDS:
+                raise ValueError(
+                    f"Invalid response type: {response_type}. \
+Valid types are: {list(self.COMMANDS)}"
+                )
+
+        cached_serial = self.identity.get()
+        requested = [response_type for response_type in response_types
+                     if response_type != 'SERIAL' or cached_serial is None]
+        responses = self._exchange(
+            [self.COMMANDS[response_type] for response_type in requested])
+
+        received = {}
+        for response_type, response in zip(requested, responses):
+            response = response.strip()
+            if not self.validate_response(response_type, response):
+                self.identity.invalidate()
+                raise ValueError(
+                    f"Invalid {response_type.lower()} "
+                    f"response format: {response.decode('utf-8', 'replace')}")
+            received[response_type] = response.decode('ascii')
+
+        if 'SERIAL' in received:
+            self.identity.set(received['SERIAL'])
+        elif 'SERIAL' in response_types:
+            received['SERIAL'] = cached_serial
+        return {response_type: received[response_type]
+                for response_type in response_types}
+
+    def measure(self, response_types: list) -> dict:
+        """
+        Запрашивает величины за один обмен и возвращает словарь
+        {тип ответа: Measurement}. Ответы разбираются без перевода в str.
+        """
+        for response_type in response_types:
+            if response_type not in MEASUREMENT_UNITS:
+                raise ValueError(
+                    f"Invalid measurement type: {response_type}. \
+Valid types are: {list(MEASUREMENT_UNITS)}"
+                )
+
+        responses = self._exchange(
+            [self.COMMANDS[response_type] for response_type in response_types])
+        timestamp = time.monotonic()
+
+        result = {}
+        for response_type, response in zip(response_types, responses):
+            response = response.strip()
+            measurement = parse_measurement(
+                response, MEASUREMENT_UNITS[response_type], self.port,
+                timestamp)
+            if measurement is None:
+                self.identity.invalidate()
+                if self.metrics is not None:
+                    self.metrics.increment('validation_failures', self.port)
+                raise ValueError(
+                    f"Invalid {response_type.lower()} response format: "
+                    f"{response.decode('utf-8', 'replace')}")
+            result[response_type] = measurement
+        return result
+
+    def measure_voltage(self) -> Measurement:
+        """
+        Запрашивает напряжение как Measurement.
+        """
+        return self.measure(['VOLTAGE'])['VOLTAGE']
+
+    def measure_ampere(self) -> Measurement:
+        """
+        Запрашивает ток как Measurement.
+        """
+        return self.measure(['AMPERE'])['AMPERE']
+
+    def stream(self, response_types: list, hz: float,
+               count: int = None) -> Sampler:
+        """
+        Возвращает итератор измерений с частотой hz:
+        for m in device.stream(['VOLTAGE', 'AMPERE'], hz=50).
+        Пропущенные моменты опроса учитываются в missed_deadlines.
+        """
+        return Sampler(self.measure, response_types, hz, count)
+
     def close(self):
         """
         Закрывает соединение.
         """
-        if self.serial_connection and self.serial_connection.is_open:
-            self.serial_connection.close()
+        with self._lock:
+            if self.serial_connection and self.serial_connection.is_open:
+                self.serial_connection.close()
 
     def __enter__(self):
         """
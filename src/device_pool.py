@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: device_pool.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Пул устройств для параллельного опроса множества serial-портов.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+from concurrent.futures import ThreadPoolExecutor
+from typing import NamedTuple
+import serial
+from src.adaptive_timeout import RttEstimator
+from src.circuit_breaker import CircuitBreaker, HALF_OPEN
+from src.device_controller import DeviceController
+
+
+class PollResult(NamedTuple):
+    """
+    Результат опроса одного устройства за цикл.
+    values - словарь {тип ответа: ответ} или None при ошибке,
+    error  - исключение, возникшее при опросе, или None.
+    """
+    port: str
+    values: dict
+    error: Exception
+
+
+class DevicePool:
+    """
+    Класс пула устройств.
+    Держит по одному DeviceController на порт и опрашивает все порты
+    параллельно ограниченным пулом потоков. Ошибки отдельных устройств
+    не пробрасываются, а возвращаются в результатах цикла.
+    С failure_threshold у каждого порта свой автомат защиты: неотвечающее
+    устройство после failure_threshold сбоев подряд пропускается без
+    ожидания таймаута, через recovery_timeout опрашивается пробной
+    командой PROBE_TYPE.
+    """
+
+    RESPONSE_TYPES = ['VOLTAGE', 'AMPERE', 'SERIAL']
+    PROBE_TYPE = 'VOLTAGE'
+
+    def __init__(self, ports: list, baudrate: int = 9600,
+                 timeout: float = 1.0, max_workers: int = 32,
+                 adaptive_timeout: bool = False,
+                 failure_threshold: int = None,
+                 recovery_timeout: float = 30.0):
+        """
+        adaptive_timeout: подбирать таймаут чтения каждого порта по
+                          времени его ответов, не превышая timeout
+        failure_threshold: число сбоев подряд, после которого порт
+                           пропускается (None - без автоматов защиты)
+        recovery_timeout: время до пробного опроса пропускаемого порта, с
+        """
+        self.baudrate = baudrate
+        self.timeout = timeout
+        self.devices = dict.fromkeys(ports)
+        # Оценки хранятся отдельно от контроллеров и переживают
+        # переоткрытие порта
+        self.estimators = {}
+        if adaptive_timeout:
+            self.estimators = {
+                port: RttEstimator(initial=timeout,
+                                   floor=min(0.05, timeout),
+                                   ceiling=timeout)
+                for port in self.devices
+            }
+        self.circuit_breakers = {}
+        if failure_threshold is not None:
+            self.circuit_breakers = {
+                port: CircuitBreaker(port,
+                                     failure_threshold=failure_threshold,
+                                     recovery_timeout=recovery_timeout)
+                for port in self.devices
+            }
+        self.executor = ThreadPoolExecutor(
+            max_workers=max(1, min(max_workers, len(self.devices))),
+            thread_name_prefix="device-pool")
+
+    def _get_device(self, port: str) -> DeviceController:
+        """
+        Возвращает контроллер порта, открывая соединение при необходимости.
+        """
+        device = self.devices[port]
+        if device is None:
+            device = DeviceController(
+                port,
+                baudrate=self.baudrate,
+                timeout=self.timeout,
+                rtt_estimator=self.estimators.get(port),
+                circuit_breaker=self.circuit_breakers.get(port))
+            self.devices[port] = device
+        return device
+
+    def _drop_device(self, port: str):
+        """
+        Закрывает соединение порта, чтобы переоткрыть его в следующем цикле.
+        """
+        device = self.devices[port]
+        self.devices[port] = None
+        if device is not None:
+            try:
+                device.close()
+            except serial.SerialException:
+                pass
+
+    def _poll_device(self, port: str, response_types: list) -> PollResult:
+        """
+        Опрашивает одно устройство, перехватывая ошибки.
+        """
+        breaker = self.circuit_breakers.get(port)
+        try:
+            device = self._get_device(port)
+            if breaker is not None and breaker.state == HALF_OPEN:
+                device.get_batch([self.PROBE_TYPE])
+            values = device.get_batch(response_types)
+        except serial.SerialTimeoutException as e:
+            return PollResult(port, None, e)
+        except (serial.SerialException, OSError, RuntimeError) as e:
+            self._drop_device(port)
+            return PollResult(port, None, e)
+        except Exception as e:
+            return PollResult(port, None, e)
+        return PollResult(port, values, None)
+
+    def poll(self, response_types: list = None) -> dict:
+        """
+        Выполняет один цикл опроса всех устройств.
+        Возвращает словарь {порт: PollResult}.
+        """
+        if response_types is None:
+            response_types = self.RESPONSE_TYPES
+
+        results = self.executor.map(
+            lambda port: self._poll_device(port, response_types),
+            list(self.devices))
+        return {result.port: result for result in results}
+
+    def circuit_states(self) -> dict:
+        """
+        Возвращает состояние автоматов защиты {порт: snapshot()}.
+        """
+        return {port: breaker.snapshot()
+                for port, breaker in self.circuit_breakers.items()}
+
+    def close(self):
+        """
+        Закрывает все соединения и останавливает пул потоков.
+        """
+        self.executor.shutdown(wait=True)
+        for port in self.devices:
+            self._drop_device(port)
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Автоматически закрывает соединения.
+        """
+        self.close()
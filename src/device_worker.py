@@ -0,0 +1,163 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: device_worker.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Выделенный поток ввода-вывода для DeviceController с
+#           интерфейсом Future и объединением одинаковых запросов.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import queue
+import threading
+from concurrent.futures import Future
+from src.device_controller import DeviceController
+
+
+class DeviceWorker:
+    """
+    Класс потока-владельца serial-порта.
+    Команды из любых потоков ставятся в очередь и возвращают Future.
+    Одинаковые команды, ожидающие ответа, объединяются в один запрос,
+    а все накопившиеся в очереди команды уходят устройству одним
+    пакетом через send_commands.
+    """
+
+    def __init__(self, device: DeviceController):
+        self.device = device
+        self._queue = queue.Queue()
+        self._inflight = {}
+        self._lock = threading.Lock()
+        self._closed = False
+        self._thread = threading.Thread(target=self._run,
+                                        name=f"device-worker {device.port}",
+                                        daemon=True)
+        self._thread.start()
+
+    def submit(self, command: str) -> Future:
+        """
+        Ставит команду в очередь и возвращает Future ответа.
+        Если такая же команда уже ожидает ответа, возвращается её Future.
+        """
+        if not self.device.is_valid_command(command):
+            raise ValueError(
+                f"Invalid command: {command}. \
+Valid commands are: {list(self.device.COMMANDS.values())}"
+            )
+
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Device worker is closed")
+            future = self._inflight.get(command)
+            if future is None:
+                future = self._inflight[command] = Future()
+                self._queue.put(command)
+            return future
+
+    def _run(self):
+        """
+        Цикл потока: выбирает из очереди все накопившиеся команды и
+        выполняет их одним обменом.
+        """
+        while True:
+            command = self._queue.get()
+            if command is None:
+                return
+
+            batch = [command]
+            stop = False
+            while True:
+                try:
+                    command = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if command is None:
+                    stop = True
+                    break
+                batch.append(command)
+
+            try:
+                responses = self.device.send_commands(batch)
+            except Exception as e:
+                responses = None
+                error = e
+
+            with self._lock:
+                futures = [self._inflight.pop(command) for command in batch]
+            for index, future in enumerate(futures):
+                if responses is None:
+                    future.set_exception(error)
+                else:
+                    future.set_result(responses[index])
+
+            if stop:
+                return
+
+    def send_command(self, command: str, timeout: float = None) -> str:
+        """
+        Отправляет команду через поток ввода-вывода и ждёт ответ.
+        """
+        return self.submit(command).result(timeout)
+
+    def get_voltage(self, timeout: float = None) -> str:
+        """
+        Запрашивает напряжение.
+        """
+        response = self.send_command(self.device.COMMANDS['VOLTAGE'], timeout)
+        if not self.device.validate_response('VOLTAGE', response):
+            self.device.identity.invalidate()
+            raise ValueError(f"Invalid voltage response format: {response}")
+        return response
+
+    def get_ampere(self, timeout: float = None) -> str:
+        """
+        Запрашивает ток.
+        """
+        response = self.send_command(self.device.COMMANDS['AMPERE'], timeout)
+        if not self.device.validate_response('AMPERE', response):
+            self.device.identity.invalidate()
+            raise ValueError(f"Invalid ampere response format: {response}")
+        return response
+
+    def get_serial(self, timeout: float = None) -> str:
+        """
+        Запрашивает серийный номер с учётом кэша устройства.
+        """
+        cached_serial = self.device.identity.get()
+        if cached_serial is not None:
+            return cached_serial
+
+        response = self.send_command(self.device.COMMANDS['SERIAL'], timeout)
+        if not self.device.validate_response('SERIAL', response):
+            raise ValueError(f"Invalid serial response format: {response}")
+        self.device.identity.set(response)
+        return response
+
+    def close(self):
+        """
+        Дожидается выполнения поставленных команд и останавливает поток.
+        Соединение устройства не закрывается.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Останавливает поток ввода-вывода.
+        """
+        self.close()
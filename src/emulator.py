@@ -0,0 +1,381 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: emulator.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Эмуляторы устройства для тестов и нагрузочных замеров без
+#           оборудования: serial-устройство на псевдотерминале и
+#           WebSocket-сервер протокола {"cmd", "payload"}.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import argparse
+import asyncio
+import os
+import random
+import select
+import threading
+import time
+from src import json_codec, ws_protocol
+from src.line_reader import LineReader
+
+RESPONSES = {
+    'GET_V': "V_12V",
+    'GET_A': "A_5A",
+    'GET_S': "S_ABC123"
+}
+
+
+class DeviceEmulator:
+    """
+    Общая логика эмулятора: ответы на команды, задержка и сбои.
+    """
+
+    def __init__(self, responses: dict = None, latency: float = 0.0,
+                 jitter: float = 0.0, drop_rate: float = 0.0,
+                 malformed_rate: float = 0.0, seed: int = None):
+        """
+        responses: словарь {команда: ответ} (по умолчанию RESPONSES)
+        latency: задержка ответа, с
+        jitter: случайная добавка к задержке от 0 до jitter, с
+        drop_rate: доля запросов, оставляемых без ответа
+        malformed_rate: доля ответов в неверном формате
+        seed: начальное значение генератора случайных чисел
+        """
+        self.responses = dict(RESPONSES if responses is None else responses)
+        self.latency = latency
+        self.jitter = jitter
+        self.drop_rate = drop_rate
+        self.malformed_rate = malformed_rate
+        self.random = random.Random(seed)
+        self.requests = 0
+        self.dropped = 0
+        self.malformed = 0
+
+    def delay(self) -> float:
+        """
+        Возвращает задержку очередного ответа.
+        """
+        if self.jitter:
+            return self.latency + self.random.uniform(0, self.jitter)
+        return self.latency
+
+    def respond(self, cmd: str):
+        """
+        Возвращает ответ на команду или None, если ответ потерян.
+        Неизвестная команда получает ответ "ERROR". Искажённый ответ
+        никогда не проходит проверку формата клиента.
+        """
+        self.requests += 1
+        if self.drop_rate and self.random.random() < self.drop_rate:
+            self.dropped += 1
+            return None
+
+        response = self.responses.get(cmd, "ERROR")
+        if self.malformed_rate and self.random.random() < self.malformed_rate:
+            self.malformed += 1
+            return self.random.choice([
+                response.lower(),
+                response.replace("_", "", 1),
+                response.replace("_", "_1.", 1),
+                "?" + response
+            ])
+        return response
+
+
+class SerialEmulator(DeviceEmulator):
+    """
+    Класс serial-устройства на псевдотерминале (POSIX).
+    После start() путь к устройству доступен в атрибуте port, его можно
+    передавать в DeviceController. Команды обрабатываются по одной, как
+    настоящим устройством.
+    """
+
+    def __init__(self, baudrate: int = None, **options):
+        """
+        baudrate: скорость передачи ответа, бод (None - без ограничения)
+        остальные параметры - см. DeviceEmulator
+        """
+        super().__init__(**options)
+        self.baudrate = baudrate
+        self.port = None
+        self._master = None
+        self._slave = None
+        self._stop_pipe = None
+        self._thread = None
+
+    def start(self):
+        """
+        Создаёт псевдотерминал и запускает поток обработки команд.
+        """
+        import pty
+        import tty
+
+        self._master, self._slave = pty.openpty()
+        tty.setraw(self._slave)
+        self.port = os.ttyname(self._slave)
+        self._stop_pipe = os.pipe()
+        self._thread = threading.Thread(target=self._run,
+                                        name=f"serial-emulator {self.port}",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        """
+        Цикл потока: читает строки команд и пишет ответы.
+        """
+        line_reader = LineReader()
+        while True:
+            readable, _, _ = select.select(
+                [self._master, self._stop_pipe[0]], [], [])
+            if self._stop_pipe[0] in readable:
+                return
+            try:
+                line_reader.feed(os.read(self._master, 4096))
+            except OSError:
+                return
+
+            while True:
+                line = line_reader.next_line()
+                if line is None:
+                    break
+                cmd = line.strip().decode('utf-8', 'replace')
+                if not cmd:
+                    continue
+                response = self.respond(cmd)
+                delay = self.delay()
+                if delay:
+                    time.sleep(delay)
+                if response is not None:
+                    self._write(f"{response}\r\n".encode())
+
+    def _write(self, data: bytes):
+        """
+        Пишет ответ с учётом скорости передачи (10 бит на байт).
+        """
+        if self.baudrate:
+            time.sleep(len(data) * 10 / self.baudrate)
+        os.write(self._master, data)
+
+    def stop(self):
+        """
+        Останавливает поток и закрывает псевдотерминал.
+        """
+        if self._thread is None:
+            return
+        os.write(self._stop_pipe[1], b"x")
+        self._thread.join()
+        for fd in (self._master, self._slave) + self._stop_pipe:
+            os.close(fd)
+        self._thread = None
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Останавливает эмулятор.
+        """
+        self.stop()
+
+
+class WebsocketEmulator(DeviceEmulator):
+    """
+    Класс WebSocket-сервера, отвечающего на {"cmd": ...} и пакетные
+    {"cmds": [...]} запросы. Поле id запроса возвращается в ответе.
+    Сообщения одного соединения обрабатываются по очереди, разные
+    соединения - независимо. Сервер работает в отдельном потоке,
+    адрес после start() доступен в атрибуте url.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 batch: bool = True, **options):
+        """
+        host, port: адрес сервера (port=0 - любой свободный порт)
+        batch: поддерживать пакетные запросы
+        остальные параметры - см. DeviceEmulator
+        """
+        super().__init__(**options)
+        self.host = host
+        self.port = port
+        self.batch = batch
+        self.connections = 0
+        # {задача обработчика: writer или WebsocketConnection}
+        self._clients = {}
+        self._loop = None
+        self._server = None
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        """
+        Адрес сервера.
+        """
+        return f"ws://{self.host}:{self.port}"
+
+    def _reply(self, request) -> dict:
+        """
+        Формирует ответ на запрос или None, если ответ потерян.
+        """
+        if not isinstance(request, dict):
+            return {"cmd": None, "error": "Invalid request"}
+
+        if self.batch and isinstance(request.get('cmds'), list):
+            results = []
+            for cmd in request['cmds']:
+                payload = self.respond(cmd)
+                if payload is None:
+                    return None
+                results.append({"cmd": cmd, "payload": payload})
+            response = {"results": results}
+        elif isinstance(request.get('cmd'), str):
+            payload = self.respond(request['cmd'])
+            if payload is None:
+                return None
+            response = {"cmd": request['cmd'], "payload": payload}
+        else:
+            response = {"cmd": None, "error": "Invalid request"}
+
+        if 'id' in request:
+            response["id"] = request['id']
+        return response
+
+    async def _handle(self, reader, writer):
+        """
+        Обслуживает одно клиентское соединение.
+        """
+        task = asyncio.current_task()
+        self._clients[task] = writer
+        try:
+            await self._serve(reader, writer, task)
+        finally:
+            del self._clients[task]
+
+    async def _serve(self, reader, writer, task):
+        """
+        Выполняет рукопожатие и отвечает на сообщения соединения.
+        """
+        try:
+            connection, _ = await ws_protocol.accept(reader, writer)
+        except ConnectionError:
+            return
+
+        self._clients[task] = connection
+        self.connections += 1
+        try:
+            while True:
+                message = await connection.recv()
+                try:
+                    request = json_codec.loads(message)
+                except ValueError:
+                    request = None
+                response = self._reply(request)
+                delay = self.delay()
+                if delay:
+                    await asyncio.sleep(delay)
+                if response is not None:
+                    await connection.send(json_codec.dumps(response))
+        except ws_protocol.WebsocketClosedError:
+            pass
+        finally:
+            await connection.close()
+
+    def start(self):
+        """
+        Запускает сервер в отдельном потоке.
+        """
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            asyncio.start_server(self._handle, self.host, self.port))
+        self.port = self._server.sockets[0].getsockname()[1]
+        self._thread = threading.Thread(target=self._loop.run_forever,
+                                        name=f"ws-emulator {self.port}",
+                                        daemon=True)
+        self._thread.start()
+        return self
+
+    async def _shutdown(self):
+        """
+        Закрывает сервер и все клиентские соединения и дожидается
+        завершения их обработчиков.
+        """
+        self._server.close()
+        for client in list(self._clients.values()):
+            if isinstance(client, ws_protocol.WebsocketConnection):
+                await client.close()
+            else:
+                client.close()
+        await asyncio.gather(*self._clients, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def stop(self):
+        """
+        Останавливает сервер.
+        """
+        if self._thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._thread = None
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Останавливает эмулятор.
+        """
+        self.stop()
+
+
+def main(argv: list = None):
+    """
+    Запуск эмулятора из командной строки:
+    python -m src.emulator ws --port 8765 --latency 0.005
+    python -m src.emulator serial --baudrate 9600
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("kind", choices=["serial", "ws"])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--baudrate", type=int, default=None)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--drop-rate", type=float, default=0.0)
+    parser.add_argument("--malformed-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    options = dict(latency=args.latency, jitter=args.jitter,
+                   drop_rate=args.drop_rate,
+                   malformed_rate=args.malformed_rate, seed=args.seed)
+    if args.kind == "serial":
+        emulator = SerialEmulator(baudrate=args.baudrate, **options)
+    else:
+        emulator = WebsocketEmulator(args.host, args.port, **options)
+
+    with emulator:
+        print(emulator.port if args.kind == "serial" else emulator.url,
+              flush=True)
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,307 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: gateway.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Локальный шлюз: владеет соединениями с устройствами
+#           (DeviceController, WebsocketClient) и раздаёт их многим
+#           клиентам по протоколу {"cmd", "payload"} поверх WebSocket.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import argparse
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from src import json_codec, ws_protocol
+
+
+class GatewayBackend:
+    """
+    Соединение с одним устройством внутри шлюза.
+    Обмены выполняет отдельный поток; запросы, пришедшие за время
+    обмена, объединяются по команде и уходят следующим пакетом через
+    send_commands. Пакет, отклонённый с ValueError, повторяется по одной
+    команде, чтобы ошибка одной команды не досталась остальным.
+    Ответы проверяются validate_response клиента; на cache_ttl секунд
+    кэшируются только прошедшие проверку.
+    """
+
+    def __init__(self, client, cache_ttl: float = 0.2):
+        self.client = client
+        self.response_types = {cmd: response_type for response_type, cmd
+                               in client.COMMANDS.items()}
+        self.cache_ttl = cache_ttl
+        self.cache = {}
+        self.pending = {}
+        self.inflight = {}
+        self.busy = False
+        self.exchanges = 0
+        self.executor = ThreadPoolExecutor(max_workers=1,
+                                           thread_name_prefix="gateway")
+
+    async def query(self, cmd: str) -> str:
+        """
+        Возвращает payload ответа на команду.
+        """
+        entry = self.cache.get(cmd)
+        if entry is not None and time.monotonic() - entry[1] <= self.cache_ttl:
+            return entry[0]
+
+        future = self.inflight.get(cmd) or self.pending.get(cmd)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self.pending[cmd] = future
+            if not self.busy:
+                self.busy = True
+                asyncio.get_running_loop().create_task(self._drain())
+        return await asyncio.shield(future)
+
+    async def _drain(self):
+        """
+        Выполняет накопившиеся запросы пакетами, пока они есть.
+        """
+        loop = asyncio.get_running_loop()
+        try:
+            while self.pending:
+                await asyncio.sleep(0)
+                batch, self.pending = self.pending, {}
+                self.inflight = batch
+                try:
+                    await self._run(loop, batch, list(batch))
+                finally:
+                    self.inflight = {}
+        finally:
+            self.busy = False
+
+    async def _run(self, loop, batch: dict, cmds: list):
+        """
+        Выполняет обмен командами cmds и разрешает их futures из batch.
+        """
+        try:
+            responses = await loop.run_in_executor(
+                self.executor, self.client.send_commands, cmds)
+        except ValueError as e:
+            self.exchanges += 1
+            if len(cmds) > 1:
+                for cmd in cmds:
+                    await self._run(loop, batch, [cmd])
+                return
+            self._fail(batch, cmds, e)
+        except Exception as e:
+            self.exchanges += 1
+            self._fail(batch, cmds, e)
+        else:
+            self.exchanges += 1
+            now = time.monotonic()
+            for cmd, response in zip(cmds, responses):
+                response_type = self.response_types[cmd]
+                if not self.client.validate_response(response_type,
+                                                     response):
+                    self._fail(batch, [cmd], ValueError(
+                        f"Invalid {response_type.lower()} response "
+                        f"format: {response}"))
+                    continue
+                payload = (response.get('payload')
+                           if isinstance(response, dict)
+                           else response)
+                self.cache[cmd] = (payload, now)
+                if not batch[cmd].done():
+                    batch[cmd].set_result(payload)
+
+    @staticmethod
+    def _fail(batch: dict, cmds: list, error: Exception):
+        """
+        Завершает futures команд cmds ошибкой.
+        """
+        for cmd in cmds:
+            if not batch[cmd].done():
+                batch[cmd].set_exception(error)
+
+    def close(self):
+        """
+        Останавливает поток обменов и закрывает соединение с устройством.
+        """
+        self.executor.shutdown(wait=True)
+        self.client.close()
+
+
+class Gateway:
+    """
+    Класс шлюза.
+    Устройства доступны по адресу ws://host:port/<имя>; если устройство
+    одно, оно доступно и по адресу ws://host:port/. Каждое сообщение
+    клиента обрабатывается отдельно, поэтому клиенты могут отправлять
+    запросы конвейером; поле id запроса возвращается в ответе.
+    Поддерживаются пакетные запросы {"cmds": [...]}.
+    """
+
+    def __init__(self, backends: dict, host: str = "127.0.0.1",
+                 port: int = 8765, cache_ttl: float = 0.2):
+        """
+        backends: словарь {имя: DeviceController или WebsocketClient}
+        host, port: адрес, на котором шлюз принимает клиентов
+        cache_ttl: время жизни закэшированного ответа
+        """
+        self.host = host
+        self.port = port
+        self.backends = {name: GatewayBackend(client, cache_ttl)
+                         for name, client in backends.items()}
+        self.server = None
+
+    def _resolve(self, path: str) -> GatewayBackend:
+        """
+        Возвращает устройство по пути запроса.
+        """
+        name = path.split("?", 1)[0].strip("/")
+        if not name and len(self.backends) == 1:
+            return next(iter(self.backends.values()))
+        return self.backends.get(name)
+
+    async def _query(self, backend, cmd) -> dict:
+        """
+        Выполняет одну команду и возвращает ответ {"cmd", "payload"}
+        или {"cmd", "error"}.
+        """
+        response = {"cmd": cmd}
+        if backend is None:
+            response["error"] = "Unknown device"
+        elif not isinstance(cmd, str):
+            response["error"] = "Invalid request"
+        elif not backend.client.is_valid_command(cmd):
+            response["error"] = f"Invalid command: {cmd}"
+        else:
+            try:
+                response["payload"] = await backend.query(cmd)
+            except Exception as e:
+                response["error"] = f"{type(e).__name__}: {str(e)}"
+        return response
+
+    async def _respond(self, connection, backend, request):
+        """
+        Обрабатывает один запрос клиента: {"cmd": ...} или пакетный
+        {"cmds": [...]}, на который отвечает {"results": [...]}.
+        """
+        if not isinstance(request, dict):
+            response = await self._query(backend, None)
+        elif isinstance(request.get('cmds'), list):
+            response = {"results": await asyncio.gather(
+                *(self._query(backend, cmd) for cmd in request['cmds']))}
+        else:
+            response = await self._query(backend, request.get('cmd'))
+        if isinstance(request, dict) and 'id' in request:
+            response["id"] = request['id']
+
+        try:
+            await connection.send(json_codec.dumps(response))
+        except ConnectionError:
+            pass
+
+    async def _handle(self, reader, writer):
+        """
+        Обслуживает одно клиентское соединение.
+        """
+        try:
+            connection, path = await ws_protocol.accept(reader, writer)
+        except ConnectionError:
+            return
+
+        backend = self._resolve(path)
+        tasks = set()
+        code = ws_protocol.CLOSE_NORMAL
+        try:
+            while True:
+                message = await connection.recv()
+                try:
+                    request = json_codec.loads(message)
+                except ValueError:
+                    request = None
+                task = asyncio.get_running_loop().create_task(
+                    self._respond(connection, backend, request))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        except ws_protocol.WebsocketClosedError:
+            pass
+        except ValueError:
+            # Слишком большой кадр или текст не в UTF-8
+            code = ws_protocol.CLOSE_PROTOCOL_ERROR
+        finally:
+            for task in tasks:
+                task.cancel()
+            await connection.close(code)
+
+    async def start(self):
+        """
+        Начинает приём клиентов.
+        """
+        self.server = await asyncio.start_server(self._handle,
+                                                 self.host, self.port)
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def serve_forever(self):
+        """
+        Принимает клиентов до отмены.
+        """
+        if self.server is None:
+            await self.start()
+        await self.server.serve_forever()
+
+    async def close(self):
+        """
+        Останавливает приём клиентов и закрывает соединения с устройствами.
+        """
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+            self.server = None
+        for backend in self.backends.values():
+            backend.close()
+
+
+def main(argv: list = None):
+    """
+    Запуск шлюза из командной строки:
+    python -m src.gateway --device dev0=/dev/ttyUSB0 \
+                          --upstream rig=ws://192.168.1.100:8080
+    """
+    from src.device_controller import DeviceController
+    from src.websocket_client import WebsocketClient
+
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--cache-ttl", type=float, default=0.2)
+    parser.add_argument("--device", action="append", default=[],
+                        metavar="NAME=PORT")
+    parser.add_argument("--baudrate", type=int, default=9600)
+    parser.add_argument("--upstream", action="append", default=[],
+                        metavar="NAME=URL")
+    args = parser.parse_args(argv)
+
+    backends = {}
+    for spec in args.device:
+        name, port = spec.split("=", 1)
+        backends[name] = DeviceController(port, baudrate=args.baudrate)
+    for spec in args.upstream:
+        name, url = spec.split("=", 1)
+        backends[name] = WebsocketClient(url)
+    if not backends:
+        parser.error("at least one --device or --upstream is required")
+
+    gateway = Gateway(backends, args.host, args.port, args.cache_ttl)
+    try:
+        asyncio.run(gateway.serve_forever())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        for backend in gateway.backends.values():
+            backend.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: identity_cache.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Кэш серийного номера устройства в пределах одного соединения.
+# ============================================================================
+
+
+class IdentityCache:
+    """
+    Класс кэша идентичности устройства.
+    Серийный номер не меняется, пока соединение открыто, поэтому
+    запрашивается по сети один раз. Кэш сбрасывается при переоткрытии
+    соединения и при ответе, похожем на ответ другого устройства.
+    """
+
+    def __init__(self):
+        self.serial = None
+
+    def get(self):
+        """
+        Возвращает закэшированный серийный номер или None.
+        """
+        return self.serial
+
+    def set(self, serial: str):
+        """
+        Запоминает серийный номер.
+        """
+        self.serial = serial
+
+    def invalidate(self):
+        """
+        Сбрасывает кэш.
+        """
+        self.serial = None
@@ -0,0 +1,48 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: json_codec.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Разбор и сериализация JSON. Если установлен orjson,
+#           используется он, иначе стандартный модуль json.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    BACKEND = "orjson"
+
+    loads = orjson.loads
+
+    def dumps(obj) -> str:
+        """
+        Сериализует объект в строку JSON.
+        """
+        return orjson.dumps(obj).decode()
+else:
+    BACKEND = "json"
+
+    loads = json.loads
+
+    dumps = json.dumps
+
+
+def encode_request(frame, request_id: int):
+    """
+    Добавляет поле id к заранее сериализованному запросу {"cmd": ...}.
+    Принимает и возвращает str или bytes.
+    """
+    if isinstance(frame, bytes):
+        return b'%s, "id": %d}' % (frame[:-1], request_id)
+    return f'{frame[:-1]}, "id": {request_id}}}'
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: line_reader.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Буферизованное построчное чтение ответов из serial-порта.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import time
+
+
+class LineReader:
+    """
+    Класс построчного чтения из serial-порта.
+    Читает порт блоками по in_waiting в один буфер и нарезает его на
+    строки по b'\\n', сохраняя остаток для следующего ответа.
+    """
+
+    TERMINATOR = b'\n'
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._start = 0
+
+    def feed(self, data: bytes):
+        """
+        Добавляет принятые байты в буфер.
+        """
+        if self._start and self._start * 2 >= len(self._buffer):
+            del self._buffer[:self._start]
+            self._start = 0
+        self._buffer += data
+
+    def next_line(self):
+        """
+        Возвращает следующую полную строку вместе с терминатором
+        или None, если строка ещё не принята целиком.
+        """
+        end = self._buffer.find(self.TERMINATOR, self._start)
+        if end < 0:
+            return None
+
+        end += len(self.TERMINATOR)
+        with memoryview(self._buffer) as view:
+            line = bytes(view[self._start:end])
+
+        if end == len(self._buffer):
+            self.clear()
+        else:
+            self._start = end
+        return line
+
+    def flush(self) -> bytes:
+        """
+        Возвращает неполный остаток буфера и очищает его.
+        """
+        with memoryview(self._buffer) as view:
+            rest = bytes(view[self._start:])
+        self.clear()
+        return rest
+
+    def clear(self):
+        """
+        Отбрасывает содержимое буфера.
+        """
+        self._buffer.clear()
+        self._start = 0
+
+    def pending(self) -> int:
+        """
+        Возвращает количество непрочитанных байт в буфере.
+        """
+        return len(self._buffer) - self._start
+
+    def read_line(self, port, timeout: float = None) -> bytes:
+        """
+        Читает одну строку из порта. Поведение совпадает с
+        serial.Serial.readline(): по таймауту возвращается накопленный
+        остаток (возможно пустой).
+        Каждое чтение порта ждёт до port.timeout. Если строка приходит
+        частями, таймаут порта на последующие чтения уменьшается до
+        оставшегося времени, чтобы вызов не длился дольше timeout, и
+        восстанавливается перед возвратом. Первое чтение начинается
+        сразу, поэтому порт при обычном ответе не перенастраивается.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        port_timeout = lowered = None
+        first = True
+
+        try:
+            while True:
+                line = self.next_line()
+                if line is not None:
+                    return line
+
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        return self.flush()
+                    current = port.timeout if lowered is None else lowered
+                    if (
+                        current is None
+                        or (not first and remaining < current)
+                    ):
+                        if lowered is None:
+                            port_timeout = port.timeout
+                        port.timeout = lowered = remaining
+                first = False
+
+                chunk = port.read(port.in_waiting or 1)
+                if not chunk:
+                    return self.flush()
+                self.feed(chunk)
+        finally:
+            if lowered is not None:
+                port.timeout = port_timeout
@@ -0,0 +1,65 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: measurement.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Компактная запись измерения и разбор ответов V_<n>V и A_<n>A.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import time
+
+MEASUREMENT_UNITS = {
+    'VOLTAGE': b'V',
+    'AMPERE': b'A'
+}
+
+
+class Measurement:
+    """
+    Запись одного измерения.
+    value     - числовое значение (int),
+    unit      - единица измерения ('V' или 'A'),
+    device_id - идентификатор устройства (порт или URL),
+    timestamp - время получения по time.monotonic().
+    """
+
+    __slots__ = ('value', 'unit', 'device_id', 'timestamp')
+
+    def __init__(self, value: int, unit: str, device_id: str,
+                 timestamp: float):
+        self.value = value
+        self.unit = unit
+        self.device_id = device_id
+        self.timestamp = timestamp
+
+    def __repr__(self):
+        return (f"Measurement(value={self.value}, unit={self.unit!r}, "
+                f"device_id={self.device_id!r}, "
+                f"timestamp={self.timestamp})")
+
+
+def parse_measurement(data: bytes, unit: bytes, device_id: str,
+                      timestamp: float = None):
+    """
+    Разбирает ответ вида <unit>_<цифры><unit> без регулярного выражения
+    и промежуточной строки. Возвращает Measurement или None, если ответ
+    не соответствует формату.
+    """
+    digits = data[2:-1]
+    if (
+        data[:1] != unit
+        or data[1:2] != b'_'
+        or data[-1:] != unit
+        or not digits.isdigit()
+    ):
+        return None
+
+    if timestamp is None:
+        timestamp = time.monotonic()
+    return Measurement(int(digits), unit.decode(), device_id, timestamp)
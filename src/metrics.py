@@ -0,0 +1,294 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: metrics.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Метрики обмена с устройствами: гистограммы задержки команд,
+#           счётчики, хуки до и после обмена и экспорт в текстовом
+#           формате Prometheus.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import bisect
+import os
+import socket
+import socketserver
+import threading
+import time
+import serial
+import websocket
+
+PREFIX = "sw_qa"
+
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+                   0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+COUNTERS = {
+    'bytes_sent': "Bytes written to the device",
+    'bytes_received': "Bytes read from the device",
+    'timeouts': "Exchanges that ended with a read timeout",
+    'errors': "Exchanges that failed for other reasons",
+    'validation_failures': "Responses rejected by validate_response",
+    'reconnects': "Connections reopened after the first open"
+}
+
+TIMEOUT_ERRORS = (serial.SerialTimeoutException,
+                  websocket.WebSocketTimeoutException,
+                  TimeoutError)
+
+
+class Histogram:
+    """
+    Гистограмма с фиксированными границами корзин.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        """
+        Добавляет значение.
+        """
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self) -> list:
+        """
+        Возвращает пары (граница, число значений не больше границы),
+        последняя граница - бесконечность.
+        """
+        result = []
+        total = 0
+        for bound, count in zip(self.buckets + (float('inf'),),
+                                self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+def _escape(value) -> str:
+    """
+    Экранирует значение метки Prometheus.
+    """
+    return (str(value).replace('\\', '\\\\').replace('"', '\\"')
+            .replace('\n', '\\n'))
+
+
+def _format_bound(bound: float) -> str:
+    """
+    Форматирует границу корзины для метки le.
+    """
+    return "+Inf" if bound == float('inf') else repr(bound)
+
+
+class Metrics:
+    """
+    Класс набора метрик. Передаётся в DeviceController или
+    WebsocketClient параметром metrics; без него клиенты метрики
+    не собирают. Один набор можно разделять между клиентами и потоками.
+    """
+
+    def __init__(self, buckets: tuple = LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.latency = {}
+        self.counters = {}
+        self.pre_hooks = []
+        self.post_hooks = []
+        self._lock = threading.Lock()
+
+    def add_pre_hook(self, hook):
+        """
+        Добавляет хук hook(device, commands), вызываемый перед обменом.
+        """
+        self.pre_hooks.append(hook)
+
+    def add_post_hook(self, hook):
+        """
+        Добавляет хук hook(device, commands, elapsed, error), вызываемый
+        после обмена; error - исключение или None.
+        """
+        self.post_hooks.append(hook)
+
+    def start(self, device: str, commands: list) -> float:
+        """
+        Отмечает начало обмена и возвращает момент начала.
+        """
+        for hook in self.pre_hooks:
+            hook(device, commands)
+        return time.perf_counter()
+
+    def finish(self, device: str, commands: list, started: float,
+               error: Exception = None):
+        """
+        Отмечает окончание обмена: задержка записывается в гистограмму
+        каждой команды обмена, ошибка - в счётчик таймаутов или ошибок.
+        """
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            for command in commands:
+                histogram = self.latency.get((device, command))
+                if histogram is None:
+                    histogram = self.latency[(device, command)] = \
+                        Histogram(self.buckets)
+                histogram.observe(elapsed)
+            if error is not None:
+                name = ('timeouts' if isinstance(error, TIMEOUT_ERRORS)
+                        else 'errors')
+                self.counters[(name, device)] = \
+                    self.counters.get((name, device), 0) + 1
+        for hook in self.post_hooks:
+            hook(device, commands, elapsed, error)
+
+    def increment(self, name: str, device: str, amount: int = 1):
+        """
+        Увеличивает счётчик.
+        """
+        if name not in COUNTERS:
+            raise ValueError(
+                f"Invalid counter: {name}. \
+Valid counters are: {list(COUNTERS)}"
+            )
+        with self._lock:
+            self.counters[(name, device)] = \
+                self.counters.get((name, device), 0) + amount
+
+    def get(self, name: str, device: str) -> int:
+        """
+        Возвращает значение счётчика.
+        """
+        with self._lock:
+            return self.counters.get((name, device), 0)
+
+    def histogram(self, device: str, command: str) -> Histogram:
+        """
+        Возвращает гистограмму задержки команды или None.
+        """
+        with self._lock:
+            return self.latency.get((device, command))
+
+    def render(self) -> str:
+        """
+        Возвращает метрики в текстовом формате Prometheus.
+        """
+        name = f"{PREFIX}_command_duration_seconds"
+        lines = [
+            f"# HELP {name} Command round-trip time",
+            f"# TYPE {name} histogram"
+        ]
+        with self._lock:
+            for (device, command), histogram in sorted(self.latency.items()):
+                labels = (f'device="{_escape(device)}",'
+                          f'cmd="{_escape(command)}"')
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{name}_bucket{{{labels},'
+                                 f'le="{_format_bound(bound)}"}} {count}')
+                lines.append(f"{name}_sum{{{labels}}} {histogram.sum!r}")
+                lines.append(f"{name}_count{{{labels}}} {histogram.count}")
+
+            for counter, description in COUNTERS.items():
+                name = f"{PREFIX}_{counter}_total"
+                lines.append(f"# HELP {name} {description}")
+                lines.append(f"# TYPE {name} counter")
+                for (key, device), value in sorted(self.counters.items()):
+                    if key == counter:
+                        lines.append(
+                            f'{name}{{device="{_escape(device)}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+class _ScrapeHandler(socketserver.StreamRequestHandler):
+    """
+    Отвечает на любое подключение HTTP-ответом с метриками.
+    """
+
+    def handle(self):
+        self.connection.settimeout(1.0)
+        try:
+            self.rfile.readline()
+        except OSError:
+            pass
+        body = self.server.metrics.render().encode()
+        self.wfile.write(
+            b"HTTP/1.0 200 OK\r\n"
+            b"Content-Type: text/plain; version=0.0.4\r\n"
+            b"Content-Length: %d\r\n\r\n" % len(body) + body)
+
+
+class _TCPServer(socketserver.ThreadingTCPServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class _UnixServer(socketserver.ThreadingUnixStreamServer):
+    allow_reuse_address = True
+    daemon_threads = True
+
+
+class PrometheusExporter:
+    """
+    Класс экспорта метрик в текстовом формате Prometheus: в файл
+    (для textfile collector node_exporter) или по локальному сокету.
+    """
+
+    def __init__(self, metrics: Metrics):
+        self.metrics = metrics
+        self.server = None
+        self._thread = None
+
+    def write(self, path: str):
+        """
+        Атомарно записывает метрики в файл.
+        """
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w") as output:
+            output.write(self.metrics.render())
+        os.replace(temporary, path)
+
+    def serve(self, address):
+        """
+        Начинает отдавать метрики по HTTP в отдельном потоке.
+        address: (host, port) для TCP или путь к unix-сокету.
+        Возвращает фактический адрес сервера.
+        """
+        server_class = _UnixServer if isinstance(address, str) else _TCPServer
+        self.server = server_class(address, _ScrapeHandler)
+        self.server.metrics = self.metrics
+        self._thread = threading.Thread(target=self.server.serve_forever,
+                                        name="metrics-exporter",
+                                        daemon=True)
+        self._thread.start()
+        return self.server.server_address
+
+    def close(self):
+        """
+        Останавливает сервер метрик.
+        """
+        if self.server is None:
+            return
+        self.server.shutdown()
+        self.server.server_close()
+        self._thread.join()
+        if self.server.address_family == socket.AF_UNIX:
+            os.unlink(self.server.server_address)
+        self.server = None
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Останавливает сервер метрик.
+        """
+        self.close()
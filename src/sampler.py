@@ -0,0 +1,78 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: sampler.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Потоковый опрос измерений с фиксированной частотой.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import time
+from src.measurement import MEASUREMENT_UNITS
+
+
+class Sampler:
+    """
+    Итератор измерений с фиксированной частотой.
+    Моменты опроса отсчитываются от времени старта (start + n * period),
+    поэтому длительность обмена с устройством и неточность sleep не
+    накапливаются. Если опрос опоздал на целый период и более,
+    пропущенные моменты не догоняются, а учитываются в missed_deadlines.
+    """
+
+    def __init__(self, measure, response_types: list, hz: float,
+                 count: int = None, clock=time.monotonic, sleep=time.sleep):
+        """
+        measure: функция, возвращающая {тип ответа: Measurement}
+        response_types: запрашиваемые величины ('VOLTAGE', 'AMPERE')
+        hz: частота опроса
+        count: число циклов опроса (None - бесконечно)
+        """
+        if hz <= 0:
+            raise ValueError(f"Invalid rate: {hz}. Rate must be positive")
+
+        for response_type in response_types:
+            if response_type not in MEASUREMENT_UNITS:
+                raise ValueError(
+                    f"Invalid measurement type: {response_type}. \
+Valid types are: {list(MEASUREMENT_UNITS)}"
+                )
+
+        self.measure = measure
+        self.response_types = list(response_types)
+        self.period = 1.0 / hz
+        self.count = count
+        self.clock = clock
+        self.sleep = sleep
+        self.cycles = 0
+        self.missed_deadlines = 0
+        self.max_lateness = 0.0
+
+    def __iter__(self):
+        start = self.clock()
+        tick = 0
+
+        while self.count is None or self.cycles < self.count:
+            deadline = start + tick * self.period
+            now = self.clock()
+
+            if now < deadline:
+                self.sleep(deadline - now)
+            else:
+                lateness = now - deadline
+                self.max_lateness = max(self.max_lateness, lateness)
+                missed = int(lateness // self.period)
+                self.missed_deadlines += missed
+                tick += missed
+
+            values = self.measure(self.response_types)
+            self.cycles += 1
+            tick += 1
+
+            for response_type in self.response_types:
+                yield values[response_type]
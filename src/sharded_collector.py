@@ -0,0 +1,345 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: sharded_collector.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Сбор измерений пулом процессов: устройства распределяются
+#           между процессами, результаты пишутся в разделяемую память
+#           по номеру слота устройства и читаются под seqlock.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import multiprocessing
+import os
+import time
+from typing import NamedTuple
+import serial
+import websocket
+from src.device_controller import DeviceController
+from src.measurement import MEASUREMENT_UNITS
+from src.websocket_client import WebsocketClient
+
+# Состояния слота
+EMPTY = 0
+OK = 1
+TIMEOUT = 2
+INVALID = 3
+ERROR = 4
+
+STATUSES = {
+    EMPTY: "empty",
+    OK: "ok",
+    TIMEOUT: "timeout",
+    INVALID: "invalid",
+    ERROR: "error"
+}
+
+# Поля записи слота перед значениями величин
+SEQ, CYCLE, STATUS, TIMESTAMP = range(4)
+HEADER = 4
+
+TIMEOUT_ERRORS = (serial.SerialTimeoutException,
+                  websocket.WebSocketTimeoutException)
+
+CONNECTION_ERRORS = (serial.SerialException,
+                     websocket.WebSocketException,
+                     OSError,
+                     RuntimeError)
+
+
+class SlotReading(NamedTuple):
+    """
+    Согласованное состояние слота устройства.
+    status    - EMPTY, OK, TIMEOUT, INVALID или ERROR,
+    cycle     - номер последнего завершённого цикла опроса,
+    timestamp - время последнего успешного измерения (time.monotonic)
+                или None,
+    values    - словарь {тип ответа: значение} последнего успешного
+                измерения или None.
+    """
+    endpoint: str
+    status: int
+    cycle: int
+    timestamp: float
+    values: dict
+
+
+class SharedSlots:
+    """
+    Таблица слотов в разделяемой памяти (RawArray('q')).
+    Запись слота: seq, cycle, status, timestamp (нс), значения величин.
+    Писатель у слота один: перед записью делает seq нечётным, после -
+    чётным. Читатель копирует запись и повторяет чтение, если seq
+    нечётный или изменился, поэтому никогда не видит половину записи.
+    """
+
+    # Запись слота занимает микросекунды; seq, нечётный дольше этого
+    # времени, оставил завершённый посреди записи процесс
+    READ_TIMEOUT = 1.0
+
+    def __init__(self, slots: int, fields: int, array=None):
+        """
+        slots: число слотов
+        fields: число величин в слоте
+        array: существующий массив (в процессе-обработчике)
+        """
+        self.slots = slots
+        self.fields = fields
+        self.stride = HEADER + fields
+        if array is None:
+            array = multiprocessing.RawArray('q', slots * self.stride)
+        self.array = array
+
+    def write(self, slot: int, cycle: int, status: int,
+              timestamp_ns: int = None, values: list = None):
+        """
+        Записывает слот. Без values значения и время предыдущего
+        успешного измерения сохраняются.
+        """
+        array = self.array
+        base = slot * self.stride
+        array[base + SEQ] += 1
+        array[base + CYCLE] = cycle
+        array[base + STATUS] = status
+        if values is not None:
+            array[base + TIMESTAMP] = timestamp_ns
+            array[base + HEADER:base + self.stride] = values
+        array[base + SEQ] += 1
+
+    def read(self, slot: int) -> list:
+        """
+        Возвращает согласованную копию записи слота без seq.
+        Если запись не завершается за READ_TIMEOUT, выбрасывает
+        TimeoutError.
+        """
+        array = self.array
+        base = slot * self.stride
+        spins = 0
+        deadline = None
+        while True:
+            seq = array[base + SEQ]
+            if not seq & 1:
+                record = array[base + CYCLE:base + self.stride]
+                if array[base + SEQ] == seq:
+                    return record
+            spins += 1
+            if spins % 100 == 0:
+                if deadline is None:
+                    deadline = time.monotonic() + self.READ_TIMEOUT
+                elif time.monotonic() >= deadline:
+                    raise TimeoutError(
+                        f"Slot {slot} write did not complete")
+                time.sleep(0)
+
+    def reset(self, slot: int):
+        """
+        Завершает запись слота, прерванную остановкой писателя:
+        запись помечается ERROR, значения отбрасываются.
+        Вызывается, когда писатель слота уже остановлен.
+        """
+        array = self.array
+        base = slot * self.stride
+        if array[base + SEQ] & 1:
+            array[base + STATUS] = ERROR
+            array[base + TIMESTAMP] = 0
+            array[base + SEQ] += 1
+
+
+def _open_client(endpoint: str, options: dict):
+    """
+    Открывает клиент устройства: URL ws:// и wss:// - WebsocketClient,
+    остальное - serial-порт.
+    """
+    if endpoint.startswith(("ws://", "wss://")):
+        return WebsocketClient(endpoint, timeout=options['timeout'])
+    return DeviceController(endpoint, baudrate=options['baudrate'],
+                            timeout=options['timeout'])
+
+
+def _worker(shard: list, response_types: list, array, fields: int,
+            stop, options: dict):
+    """
+    Цикл процесса-обработчика: опрашивает устройства шарда по очереди
+    и пишет результаты в свои слоты. shard - список (слот, адрес).
+    """
+    slots = SharedSlots(len(array) // (HEADER + fields), fields, array)
+    clients = dict.fromkeys(slot for slot, _ in shard)
+    cycle = 0
+    try:
+        while not stop.is_set():
+            started = time.monotonic()
+            cycle += 1
+            for slot, endpoint in shard:
+                if stop.is_set():
+                    break
+                try:
+                    if clients[slot] is None:
+                        clients[slot] = _open_client(endpoint, options)
+                    result = clients[slot].measure(response_types)
+                except TIMEOUT_ERRORS:
+                    slots.write(slot, cycle, TIMEOUT)
+                    continue
+                except ValueError:
+                    slots.write(slot, cycle, INVALID)
+                    continue
+                except CONNECTION_ERRORS:
+                    client, clients[slot] = clients[slot], None
+                    if client is not None:
+                        try:
+                            client.close()
+                        except CONNECTION_ERRORS:
+                            pass
+                    slots.write(slot, cycle, ERROR)
+                    continue
+
+                timestamp = result[response_types[0]].timestamp
+                slots.write(slot, cycle, OK, int(timestamp * 1e9),
+                            [result[response_type].value
+                             for response_type in response_types])
+            stop.wait(max(0.0, options['interval']
+                          - (time.monotonic() - started)))
+    finally:
+        for client in clients.values():
+            if client is not None:
+                try:
+                    client.close()
+                except CONNECTION_ERRORS:
+                    pass
+
+
+class ShardedCollector:
+    """
+    Класс сборщика измерений на пуле процессов.
+    Устройства распределяются между processes процессами по кругу;
+    каждый процесс сам открывает свои соединения, разбирает ответы и
+    пишет числовые значения в разделяемую память, ответы между
+    процессами не передаются. snapshot() согласован только в пределах
+    слота: слоты читаются по очереди, пока процессы продолжают писать,
+    поэтому снимок может сочетать разные циклы опроса разных устройств
+    (сравнивайте SlotReading.cycle и timestamp). Адреса ws:// и wss://
+    опрашиваются через WebsocketClient, остальные считаются
+    serial-портами.
+    """
+
+    RESPONSE_TYPES = ['VOLTAGE', 'AMPERE']
+
+    def __init__(self, endpoints: list, response_types: list = None,
+                 processes: int = None, interval: float = 1.0,
+                 baudrate: int = 9600, timeout: float = 1.0,
+                 start_method: str = "spawn"):
+        """
+        endpoints: адреса устройств, номер в списке - номер слота
+        response_types: величины из MEASUREMENT_UNITS
+        processes: число процессов (по умолчанию - число CPU)
+        interval: период цикла опроса в каждом процессе, с
+        baudrate, timeout: параметры соединений
+        start_method: способ запуска процессов multiprocessing
+        """
+        if response_types is None:
+            response_types = self.RESPONSE_TYPES
+        for response_type in response_types:
+            if response_type not in MEASUREMENT_UNITS:
+                raise ValueError(
+                    f"Invalid measurement type: {response_type}. \
+Valid types are: {list(MEASUREMENT_UNITS)}"
+                )
+
+        self.endpoints = list(endpoints)
+        self.response_types = list(response_types)
+        self.processes = max(1, min(processes or os.cpu_count() or 1,
+                                    len(self.endpoints)))
+        self.options = dict(interval=interval, baudrate=baudrate,
+                            timeout=timeout)
+        self.context = multiprocessing.get_context(start_method)
+        self.slots = SharedSlots(len(self.endpoints),
+                                 len(self.response_types))
+        self.workers = []
+        self._stop = None
+
+    def start(self):
+        """
+        Запускает процессы-обработчики.
+        """
+        self._stop = self.context.Event()
+        shards = [[] for _ in range(self.processes)]
+        for slot, endpoint in enumerate(self.endpoints):
+            shards[slot % self.processes].append((slot, endpoint))
+        for index, shard in enumerate(shards):
+            process = self.context.Process(
+                target=_worker,
+                args=(shard, self.response_types, self.slots.array,
+                      self.slots.fields, self._stop, self.options),
+                name=f"sharded-collector-{index}",
+                daemon=True)
+            process.start()
+            self.workers.append(process)
+        return self
+
+    def read(self, slot: int) -> SlotReading:
+        """
+        Возвращает согласованное состояние одного слота.
+        """
+        record = self.slots.read(slot)
+        cycle, status, timestamp = record[:HEADER - 1]
+        values = None
+        if timestamp:
+            values = dict(zip(self.response_types, record[HEADER - 1:]))
+        return SlotReading(self.endpoints[slot], status, cycle,
+                           timestamp / 1e9 if timestamp else None, values)
+
+    def snapshot(self) -> dict:
+        """
+        Возвращает словарь {адрес: SlotReading} по всем слотам.
+        Каждое чтение согласовано по своему слоту, но не со
+        значениями других устройств.
+        """
+        return {reading.endpoint: reading
+                for reading in map(self.read, range(len(self.endpoints)))}
+
+    def wait(self, cycles: int = 1, timeout: float = None) -> bool:
+        """
+        Ждёт, пока каждый слот пройдёт cycles циклов опроса.
+        Возвращает False по истечении timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while any(self.slots.read(slot)[0] < cycles
+                  for slot in range(len(self.endpoints))):
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            time.sleep(min(0.01, self.options['interval']))
+        return True
+
+    def close(self):
+        """
+        Останавливает процессы-обработчики.
+        """
+        if self._stop is None:
+            return
+        self._stop.set()
+        for process in self.workers:
+            process.join(self.options['timeout'] + 5)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        # Завершённый или упавший процесс мог оставить слот недописанным
+        for slot in range(self.slots.slots):
+            self.slots.reset(slot)
+        self.workers = []
+        self._stop = None
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Останавливает процессы-обработчики.
+        """
+        self.close()
@@ -0,0 +1,211 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: telemetry_store.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Хранилище истории измерений на кольцевых буферах фиксированного
+#           размера.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import time
+from array import array
+from src.measurement import MEASUREMENT_UNITS, parse_measurement
+
+RESPONSE_TYPES_BY_UNIT = {
+    unit.decode(): response_type
+    for response_type, unit in MEASUREMENT_UNITS.items()
+}
+
+
+class RingBuffer:
+    """
+    Кольцевой буфер пар (timestamp, value).
+    Данные хранятся в двух заранее выделенных массивах array('d') и
+    array('q'), добавление выполняется за O(1), окна выдаются как
+    memoryview без копирования.
+    """
+
+    def __init__(self, capacity: int):
+        if capacity <= 0:
+            raise ValueError(
+                f"Invalid capacity: {capacity}. Capacity must be positive")
+        self.capacity = capacity
+        self.timestamps = array('d', bytes(8 * capacity))
+        self.values = array('q', bytes(8 * capacity))
+        self._next = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Объём памяти, занятый массивами буфера.
+        """
+        return (self.timestamps.itemsize + self.values.itemsize) \
+            * self.capacity
+
+    def append(self, timestamp: float, value: int):
+        """
+        Добавляет отсчёт, вытесняя самый старый при заполнении.
+        """
+        index = self._next
+        self.timestamps[index] = timestamp
+        self.values[index] = value
+        self._next = index + 1 if index + 1 < self.capacity else 0
+        if self._size < self.capacity:
+            self._size += 1
+
+    def _start(self) -> int:
+        """
+        Физический индекс самого старого отсчёта.
+        """
+        return (self._next - self._size) % self.capacity
+
+    def _timestamp_at(self, position: int) -> float:
+        """
+        Время отсчёта по логической позиции (0 - самый старый).
+        """
+        return self.timestamps[(self._start() + position) % self.capacity]
+
+    def window(self, last: int = None) -> list:
+        """
+        Возвращает последние last отсчётов (по умолчанию все) в порядке
+        поступления как список из одного-двух сегментов
+        (timestamps, values) типа memoryview.
+        """
+        count = self._size if last is None else max(0, min(last, self._size))
+        if not count:
+            return []
+
+        start = (self._next - count) % self.capacity
+        timestamps = memoryview(self.timestamps)
+        values = memoryview(self.values)
+
+        if start < self._next or self._next == 0:
+            end = start + count
+            return [(timestamps[start:end], values[start:end])]
+        return [(timestamps[start:], values[start:]),
+                (timestamps[:self._next], values[:self._next])]
+
+    def since(self, timestamp: float) -> list:
+        """
+        Возвращает окно отсчётов с временем не меньше timestamp.
+        Предполагается, что время отсчётов не убывает.
+        """
+        low, high = 0, self._size
+        while low < high:
+            middle = (low + high) // 2
+            if self._timestamp_at(middle) < timestamp:
+                low = middle + 1
+            else:
+                high = middle
+        return self.window(self._size - low)
+
+    def latest(self) -> tuple:
+        """
+        Возвращает последний отсчёт (timestamp, value) или None.
+        """
+        if not self._size:
+            return None
+        index = self._next - 1 if self._next else self.capacity - 1
+        return self.timestamps[index], self.values[index]
+
+    def clear(self):
+        """
+        Удаляет все отсчёты, не освобождая память.
+        """
+        self._next = 0
+        self._size = 0
+
+
+class TelemetryStore:
+    """
+    Класс хранилища истории измерений.
+    Для каждой пары (устройство, тип величины) хранит последние capacity
+    отсчётов в RingBuffer, поэтому объём памяти ограничен
+    capacity * 16 байт на ряд.
+    """
+
+    def __init__(self, capacity: int = 3600):
+        self.capacity = capacity
+        self._series = {}
+
+    def series(self, device_id: str, response_type: str) -> RingBuffer:
+        """
+        Возвращает буфер ряда, создавая его при первом обращении.
+        """
+        key = (device_id, response_type)
+        buffer = self._series.get(key)
+        if buffer is None:
+            if response_type not in MEASUREMENT_UNITS:
+                raise ValueError(
+                    f"Invalid measurement type: {response_type}. \
+Valid types are: {list(MEASUREMENT_UNITS)}"
+                )
+            buffer = self._series[key] = RingBuffer(self.capacity)
+        return buffer
+
+    def keys(self) -> list:
+        """
+        Возвращает список пар (устройство, тип величины).
+        """
+        return list(self._series)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Объём памяти, занятый всеми рядами.
+        """
+        return sum(buffer.nbytes for buffer in self._series.values())
+
+    def record(self, measurement):
+        """
+        Добавляет измерение Measurement в ряд его устройства.
+        """
+        self.series(measurement.device_id,
+                    RESPONSE_TYPES_BY_UNIT[measurement.unit]).append(
+            measurement.timestamp, measurement.value)
+
+    def record_all(self, measurements: dict):
+        """
+        Добавляет результат measure(): {тип ответа: Measurement}.
+        """
+        for measurement in measurements.values():
+            self.record(measurement)
+
+    def sample(self, client, response_types: list = None):
+        """
+        Опрашивает клиента (DeviceController, WebsocketClient) через
+        measure() и сохраняет измерения.
+        """
+        self.record_all(client.measure(response_types
+                                       or list(MEASUREMENT_UNITS)))
+
+    def record_poll(self, results: dict, timestamp: float = None):
+        """
+        Сохраняет результат цикла DevicePool.poll().
+        Устройства с ошибкой и величины без числового значения пропускаются.
+        """
+        if timestamp is None:
+            timestamp = time.monotonic()
+
+        for port, result in results.items():
+            if result.error is not None:
+                continue
+            for response_type, response in result.values.items():
+                unit = MEASUREMENT_UNITS.get(response_type)
+                if unit is None:
+                    continue
+                measurement = parse_measurement(response.encode(), unit,
+                                                port, timestamp)
+                if measurement is not None:
+                    self.series(port, response_type).append(
+                        timestamp, measurement.value)
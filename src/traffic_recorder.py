@@ -0,0 +1,567 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: traffic_recorder.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Запись обмена DeviceController и WebsocketClient на уровне
+#           транспорта в двоичный журнал и воспроизведение журнала через
+#           те же классы (журнал читается через mmap).
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import argparse
+import mmap
+import struct
+import threading
+import time
+import serial
+import websocket
+
+MAGIC = b"SWQATRC1"
+
+# Заголовок файла: MAGIC и время начала записи (time.time())
+FILE_HEADER = struct.Struct("<8sd")
+
+# Заголовок записи: время от начала записи (с), направление, транспорт,
+# номер адреса, длина данных
+RECORD_HEADER = struct.Struct("<dBBHI")
+
+SENT = 0
+RECEIVED = 1
+ENDPOINT = 2
+
+SERIAL = 0
+WEBSOCKET = 1
+
+TRANSPORTS = {
+    SERIAL: "serial",
+    WEBSOCKET: "websocket"
+}
+
+
+class TrafficRecorder:
+    """
+    Класс записи обмена в журнал.
+    Журнал только дописывается: каждая запись - заголовок RECORD_HEADER
+    и данные. Адрес устройства записывается один раз записью ENDPOINT,
+    остальные записи ссылаются на него по номеру. Для serial
+    записываются блоки в том виде, в каком их вернул порт, для WebSocket -
+    сообщения целиком.
+    Подключается к клиентам параметром connection_factory:
+    DeviceController(port, connection_factory=recorder.serial_factory())
+    """
+
+    def __init__(self, path: str):
+        """
+        path: путь к новому журналу
+        """
+        self.path = path
+        self.records = 0
+        self._file = open(path, "wb")
+        self._file.write(FILE_HEADER.pack(MAGIC, time.time()))
+        self._started = time.monotonic()
+        self._endpoints = {}
+        self._lock = threading.Lock()
+
+    def _endpoint_id(self, transport: int, endpoint: str) -> int:
+        """
+        Возвращает номер адреса, записывая его при первом обращении.
+        Вызывается под блокировкой.
+        """
+        key = (transport, endpoint)
+        endpoint_id = self._endpoints.get(key)
+        if endpoint_id is None:
+            endpoint_id = self._endpoints[key] = len(self._endpoints)
+            data = endpoint.encode()
+            self._file.write(RECORD_HEADER.pack(
+                time.monotonic() - self._started, ENDPOINT, transport,
+                endpoint_id, len(data)))
+            self._file.write(data)
+        return endpoint_id
+
+    def record(self, transport: int, endpoint: str, direction: int,
+               data):
+        """
+        Дописывает запись обмена. data - bytes или str.
+        """
+        if isinstance(data, str):
+            data = data.encode()
+        with self._lock:
+            endpoint_id = self._endpoint_id(transport, endpoint)
+            self._file.write(RECORD_HEADER.pack(
+                time.monotonic() - self._started, direction, transport,
+                endpoint_id, len(data)))
+            self._file.write(data)
+            self.records += 1
+
+    def serial_factory(self, factory=None):
+        """
+        Возвращает фабрику соединений DeviceController, записывающую
+        обмен открытых ею портов. factory - фабрика настоящих
+        соединений (по умолчанию serial.Serial).
+        """
+        def open_serial(port: str, **options):
+            connection = (factory or serial.Serial)(port=port, **options)
+            return RecordingSerial(connection, self, port)
+        return open_serial
+
+    def websocket_factory(self, factory=None):
+        """
+        Возвращает фабрику соединений WebsocketClient, записывающую
+        обмен. factory - фабрика настоящих соединений (по умолчанию
+        websocket.create_connection).
+        """
+        def open_websocket(url: str, **options):
+            connection = (factory or websocket.create_connection)(
+                url, **options)
+            return RecordingWebsocket(connection, self, url)
+        return open_websocket
+
+    def flush(self):
+        """
+        Сбрасывает буфер журнала на диск.
+        """
+        with self._lock:
+            self._file.flush()
+
+    def close(self):
+        """
+        Закрывает журнал.
+        """
+        with self._lock:
+            if not self._file.closed:
+                self._file.close()
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Закрывает журнал.
+        """
+        self.close()
+
+
+class RecordingSerial:
+    """
+    Обёртка serial-соединения, записывающая запись и чтение.
+    Остальные атрибуты передаются соединению.
+    """
+
+    def __init__(self, connection, recorder: TrafficRecorder, port: str):
+        self.__dict__.update(connection=connection, recorder=recorder,
+                             port=port)
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+    def __setattr__(self, name, value):
+        setattr(self.connection, name, value)
+
+    def write(self, data: bytes) -> int:
+        """
+        Пишет данные в порт и в журнал.
+        """
+        written = self.connection.write(data)
+        self.recorder.record(SERIAL, self.port, SENT, data)
+        return written
+
+    def read(self, size: int = 1) -> bytes:
+        """
+        Читает данные из порта и записывает их в журнал.
+        """
+        data = self.connection.read(size)
+        if data:
+            self.recorder.record(SERIAL, self.port, RECEIVED, data)
+        return data
+
+
+class RecordingWebsocket:
+    """
+    Обёртка WebSocket-соединения, записывающая отправленные и
+    принятые сообщения. Остальные атрибуты передаются соединению.
+    """
+
+    def __init__(self, connection, recorder: TrafficRecorder, url: str):
+        self.connection = connection
+        self.recorder = recorder
+        self.url = url
+
+    def __getattr__(self, name):
+        return getattr(self.connection, name)
+
+    def send(self, payload):
+        """
+        Отправляет сообщение и записывает его в журнал.
+        """
+        result = self.connection.send(payload)
+        self.recorder.record(WEBSOCKET, self.url, SENT, payload)
+        return result
+
+    def recv(self):
+        """
+        Принимает сообщение и записывает его в журнал.
+        """
+        message = self.connection.recv()
+        self.recorder.record(WEBSOCKET, self.url, RECEIVED, message)
+        return message
+
+
+class TrafficLog:
+    """
+    Класс чтения журнала. Файл отображается в память через mmap,
+    при открытии читаются только заголовки записей; данные
+    копируются из отображения при воспроизведении.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.created = FILE_HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"Invalid traffic log: {path}")
+
+        # {(транспорт, адрес): [(время, направление, смещение, длина)]}
+        self.streams = {}
+        names = {}
+        offset = FILE_HEADER.size
+        end = len(self._map)
+        while offset + RECORD_HEADER.size <= end:
+            timestamp, direction, transport, endpoint_id, length = \
+                RECORD_HEADER.unpack_from(self._map, offset)
+            offset += RECORD_HEADER.size
+            if offset + length > end:
+                # Недописанная последняя запись
+                break
+            if direction == ENDPOINT:
+                key = (transport, self._map[offset:offset + length].decode())
+                names[(transport, endpoint_id)] = key
+                self.streams[key] = []
+            else:
+                self.streams[names[(transport, endpoint_id)]].append(
+                    (timestamp, direction, offset, length))
+            offset += length
+
+    def endpoints(self, transport: int = None) -> list:
+        """
+        Возвращает адреса журнала (для транспорта transport или все).
+        """
+        return [endpoint for stream_transport, endpoint in self.streams
+                if transport is None or stream_transport == transport]
+
+    def payload(self, offset: int, length: int) -> bytes:
+        """
+        Возвращает данные записи.
+        """
+        return self._map[offset:offset + length]
+
+    def records(self, transport: int, endpoint: str):
+        """
+        Перебирает записи адреса как (время, направление, данные).
+        """
+        for timestamp, direction, offset, length in \
+                self.streams[(transport, endpoint)]:
+            yield timestamp, direction, self.payload(offset, length)
+
+    def summary(self) -> list:
+        """
+        Возвращает сводку по адресам: транспорт, адрес, число
+        отправленных и принятых записей, байты и длительность.
+        """
+        result = []
+        for (transport, endpoint), stream in self.streams.items():
+            sent = [length for _, direction, _, length in stream
+                    if direction == SENT]
+            received = [length for _, direction, _, length in stream
+                        if direction == RECEIVED]
+            result.append({
+                "transport": TRANSPORTS[transport],
+                "endpoint": endpoint,
+                "sent": len(sent),
+                "received": len(received),
+                "bytes_sent": sum(sent),
+                "bytes_received": sum(received),
+                "duration": (stream[-1][0] - stream[0][0]) if stream else 0.0
+            })
+        return result
+
+    def _stream(self, transport: int, endpoint: str,
+                speed: float) -> "ReplayStream":
+        """
+        Создаёт поток воспроизведения адреса.
+        """
+        if (transport, endpoint) not in self.streams:
+            return None
+        return ReplayStream(self, self.streams[(transport, endpoint)], speed)
+
+    def serial_factory(self, speed: float = 1.0, endpoint: str = None):
+        """
+        Возвращает фабрику соединений DeviceController, воспроизводящую
+        журнал. speed - множитель скорости (None - без задержек),
+        endpoint - воспроизводить этот адрес вместо запрошенного порта.
+        Переоткрытое соединение продолжает воспроизведение с того же места.
+        """
+        streams = {}
+
+        def open_serial(port: str, timeout: float = None, **options):
+            name = endpoint or port
+            if name not in streams:
+                streams[name] = self._stream(SERIAL, name, speed)
+            if streams[name] is None:
+                raise serial.SerialException(
+                    f"No recorded traffic for {name}")
+            return ReplaySerial(streams[name], port, timeout)
+        return open_serial
+
+    def websocket_factory(self, speed: float = 1.0, endpoint: str = None):
+        """
+        Возвращает фабрику соединений WebsocketClient, воспроизводящую
+        журнал. Параметры - как у serial_factory.
+        """
+        streams = {}
+
+        def open_websocket(url: str, timeout: float = None, **options):
+            name = endpoint or url
+            if name not in streams:
+                streams[name] = self._stream(WEBSOCKET, name, speed)
+            if streams[name] is None:
+                raise websocket.WebSocketException(
+                    f"No recorded traffic for {name}")
+            return ReplayWebsocket(streams[name], url, timeout)
+        return open_websocket
+
+    def close(self):
+        """
+        Закрывает журнал.
+        """
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Закрывает журнал.
+        """
+        self.close()
+
+
+class ReplayStream:
+    """
+    Воспроизведение записей одного адреса.
+    Отправки клиента сопоставляются записанным отправкам по порядку.
+    Принятая запись выдаётся только после того, как клиент повторил
+    все предшествующие ей отправки, и не раньше записанной задержки
+    от последней из них (делённой на speed).
+    """
+
+    def __init__(self, log: TrafficLog, stream: list, speed: float):
+        self.log = log
+        self.stream = stream
+        self.speed = speed
+        self.mismatches = 0
+        self._sent = 0
+        self._received = 0
+        # Момент воспроизведения каждой записанной отправки
+        self._sent_at = {}
+        self._last_sent = []
+        last = None
+        for index, (_, direction, _, _) in enumerate(stream):
+            self._last_sent.append(last)
+            if direction == SENT:
+                last = index
+
+    def sent(self, data: bytes):
+        """
+        Учитывает отправку клиента.
+        """
+        index = self._sent
+        while index < len(self.stream) and self.stream[index][1] != SENT:
+            index += 1
+        if index == len(self.stream):
+            self.mismatches += 1
+            return
+        _, _, offset, length = self.stream[index]
+        if self.log.payload(offset, length) != data:
+            self.mismatches += 1
+        self._sent_at[index] = time.monotonic()
+        self._sent = index + 1
+
+    def _next(self) -> int:
+        """
+        Возвращает индекс следующей принятой записи или None.
+        """
+        index = self._received
+        while index < len(self.stream) and self.stream[index][1] != RECEIVED:
+            index += 1
+        return index if index < len(self.stream) else None
+
+    def _due(self, index: int) -> float:
+        """
+        Возвращает момент, когда запись index становится доступной,
+        или None, если клиент ещё не повторил предшествующую отправку.
+        """
+        last = self._last_sent[index]
+        if last is None:
+            return time.monotonic()
+        if last >= self._sent:
+            return None
+        if not self.speed:
+            return self._sent_at[last]
+        delay = self.stream[index][0] - self.stream[last][0]
+        return self._sent_at[last] + delay / self.speed
+
+    def available(self) -> int:
+        """
+        Возвращает объём уже доступных принятых данных.
+        """
+        total = 0
+        index = self._received
+        now = time.monotonic()
+        while index < len(self.stream):
+            _, direction, _, length = self.stream[index]
+            if direction == RECEIVED:
+                due = self._due(index)
+                if due is None or due > now:
+                    break
+                total += length
+            index += 1
+        return total
+
+    def receive(self, timeout: float = None) -> bytes:
+        """
+        Возвращает следующую принятую запись, ожидая её не дольше
+        timeout, или None.
+        """
+        index = self._next()
+        due = None if index is None else self._due(index)
+        now = time.monotonic()
+        if due is None or (timeout is not None and due - now > timeout):
+            if timeout and self.speed:
+                time.sleep(timeout)
+            return None
+        if due > now:
+            time.sleep(due - now)
+        self._received = index + 1
+        _, _, offset, length = self.stream[index]
+        return self.log.payload(offset, length)
+
+    def discard(self):
+        """
+        Отбрасывает доступные принятые записи (сброс входного буфера).
+        """
+        now = time.monotonic()
+        while True:
+            index = self._next()
+            if index is None:
+                return
+            due = self._due(index)
+            if due is None or due > now:
+                return
+            self._received = index + 1
+
+
+class ReplaySerial:
+    """
+    Serial-соединение, воспроизводящее журнал.
+    """
+
+    def __init__(self, stream: ReplayStream, port: str,
+                 timeout: float = None):
+        self.stream = stream
+        self.port = port
+        self.timeout = timeout
+        self.is_open = True
+        self._buffer = b""
+
+    @property
+    def in_waiting(self) -> int:
+        return len(self._buffer) + self.stream.available()
+
+    def write(self, data: bytes) -> int:
+        self.stream.sent(bytes(data))
+        return len(data)
+
+    def read(self, size: int = 1) -> bytes:
+        if not self._buffer:
+            self._buffer = self.stream.receive(self.timeout) or b""
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+    def reset_input_buffer(self):
+        self._buffer = b""
+        self.stream.discard()
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+class ReplayWebsocket:
+    """
+    WebSocket-соединение, воспроизводящее журнал.
+    """
+
+    def __init__(self, stream: ReplayStream, url: str,
+                 timeout: float = None):
+        self.stream = stream
+        self.url = url
+        self.timeout = timeout
+        self.connected = True
+
+    def settimeout(self, timeout: float):
+        self.timeout = timeout
+
+    def send(self, payload):
+        if isinstance(payload, str):
+            payload = payload.encode()
+        self.stream.sent(payload)
+        return len(payload)
+
+    def recv(self) -> str:
+        message = self.stream.receive(self.timeout)
+        if message is None:
+            raise websocket.WebSocketTimeoutException(
+                "Connection timed out")
+        return message.decode()
+
+    def close(self):
+        self.connected = False
+
+
+def main(argv: list = None):
+    """
+    Сводка по журналу:
+    python -m src.traffic_recorder traffic.log
+    """
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("path")
+    args = parser.parse_args(argv)
+
+    with TrafficLog(args.path) as log:
+        for entry in log.summary():
+            print(f"{entry['transport']} {entry['endpoint']}: "
+                  f"{entry['sent']} sent ({entry['bytes_sent']} B), "
+                  f"{entry['received']} received "
+                  f"({entry['bytes_received']} B), "
+                  f"{entry['duration']:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
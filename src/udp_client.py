@@ -0,0 +1,274 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: udp_client.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Класс для работы с UDP-сервером по протоколу {'cmd', 'payload'}.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import itertools
+import select
+import socket
+import time
+from src import json_codec
+from src.websocket_client import WebsocketClient
+
+MAX_DATAGRAM_SIZE = 65535
+
+
+class UdpClient:
+    """
+    Класс UDP-клиента для взаимодействия с сервером.
+    Команды пакета отправляются датаграммами без ожидания ответов,
+    ответы сопоставляются запросам по id или по cmd, неотвеченные
+    команды отправляются повторно по таймауту.
+    """
+
+    COMMANDS = WebsocketClient.COMMANDS
+
+    RESPONSE_PATTERNS = WebsocketClient.RESPONSE_PATTERNS
+
+    REQUEST_FRAMES = {cmd: frame.encode()
+                      for cmd, frame in WebsocketClient.REQUEST_FRAMES.items()}
+
+    def __init__(self, host: str = "localhost", port: int = 8765,
+                 timeout: float = 0.5, retries: int = 3,
+                 request_ids: bool = False):
+        """
+        host, port: адрес UDP-сервера
+        timeout: таймаут ожидания ответа на одну попытку
+        retries: число повторных отправок неотвеченных команд
+        request_ids: добавлять в запросы поле id для сопоставления ответов
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.retries = retries
+        self.request_ids = request_ids
+        self.sock = None
+        self._request_counter = itertools.count(1)
+        self.open()
+
+    def open(self):
+        """
+        Создаёт сокет, привязанный к адресу сервера.
+        """
+        self.close()
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.setblocking(False)
+        self.sock.connect((self.host, self.port))
+
+    def send_command(self, cmd: str) -> dict:
+        """
+        Отправляет команду устройству и возвращает ответ (dict).
+        """
+        return self.send_commands([cmd])[0]
+
+    def send_commands(self, cmds: list) -> list:
+        """
+        Отправляет несколько команд подряд, не дожидаясь ответов,
+        и возвращает ответы в порядке отправки команд.
+        """
+        if self.sock is None:
+            raise RuntimeError("UDP socket is not open")
+
+        for cmd in cmds:
+            if not self.is_valid_command(cmd):
+                raise ValueError(
+                    f"Invalid command: {cmd}. \
+Valid commands are: {list(self.COMMANDS.values())}"
+                )
+
+        self._drain()
+
+        requests = {}
+        datagrams = {}
+        for index, cmd in enumerate(cmds):
+            request = {"cmd": cmd}
+            datagram = self.REQUEST_FRAMES[cmd]
+            if self.request_ids:
+                request["id"] = next(self._request_counter)
+                datagram = json_codec.encode_request(datagram, request["id"])
+            requests[index] = request
+            datagrams[index] = datagram
+
+        responses = [None] * len(cmds)
+        for _ in range(self.retries + 1):
+            for index in requests:
+                self._send(datagrams[index])
+            self._collect(requests, responses)
+            if not requests:
+                return responses
+
+        raise TimeoutError(
+            f"No response to {[r['cmd'] for r in requests.values()]} "
+            f"from {self.host}:{self.port} after {self.retries} retries")
+
+    def _send(self, datagram: bytes):
+        """
+        Отправляет датаграмму, дожидаясь готовности сокета при
+        переполнении буфера отправки.
+        """
+        while True:
+            try:
+                self.sock.send(datagram)
+                return
+            except BlockingIOError:
+                select.select([], [self.sock], [], self.timeout)
+
+    def _collect(self, requests: dict, responses: list):
+        """
+        Принимает ответы в течение timeout и сопоставляет их запросам.
+        Сопоставленные запросы удаляются из requests.
+        """
+        deadline = time.monotonic() + self.timeout
+        while requests:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            readable, _, _ = select.select([self.sock], [], [], remaining)
+            if not readable:
+                return
+            try:
+                response = json_codec.loads(
+                    self.sock.recv(MAX_DATAGRAM_SIZE))
+            except (BlockingIOError, ConnectionRefusedError, ValueError):
+                continue
+
+            index = self._match(requests, response)
+            if index is not None:
+                responses[index] = response
+                del requests[index]
+
+    def _match(self, requests: dict, response) -> int:
+        """
+        Возвращает индекс запроса, которому соответствует ответ.
+        Ответы без соответствия (дубликаты) отбрасываются.
+        """
+        if not isinstance(response, dict):
+            return None
+
+        if self.request_ids and 'id' in response:
+            for index, request in requests.items():
+                if request["id"] == response['id']:
+                    return index
+            return None
+
+        for index, request in requests.items():
+            if request["cmd"] == response.get('cmd'):
+                return index
+        return None
+
+    def _drain(self):
+        """
+        Отбрасывает запоздавшие ответы на предыдущие запросы.
+        """
+        while True:
+            try:
+                self.sock.recv(MAX_DATAGRAM_SIZE)
+            except (BlockingIOError, ConnectionRefusedError):
+                return
+
+    def is_valid_command(self, cmd: str) -> bool:
+        """
+        Проверяет, является ли команда допустимой
+        """
+        return cmd in self.REQUEST_FRAMES
+
+    def validate_response(self, response_type: str, response: dict) -> bool:
+        """
+        Валидирует формат ответа от UDP сервера.
+        """
+        if (
+            not isinstance(response, dict)
+            or 'cmd' not in response
+            or 'payload' not in response
+        ):
+            return False
+
+        if response['cmd'] != self.COMMANDS[response_type]:
+            return False
+
+        pattern = self.RESPONSE_PATTERNS.get(response_type)
+
+        if not pattern:
+            return False
+
+        return pattern.match(response['payload']) is not None
+
+    def get_batch(self, response_types: list) -> dict:
+        """
+        Запрашивает несколько величин одним пакетом датаграмм.
+        Возвращает словарь {тип ответа: payload}.
+        """
+        for response_type in response_types:
+            if response_type not in self.COMMANDS:
+                raise ValueError(
+                    f"Invalid response type: {response_type}. \
+Valid types are: {list(self.COMMANDS)}"
+                )
+
+        responses = self.send_commands(
+            [self.COMMANDS[response_type] for response_type in response_types])
+
+        result = {}
+        for response_type, response in zip(response_types, responses):
+            if not self.validate_response(response_type, response):
+                raise ValueError(
+                    f"Invalid {response_type.lower()} "
+                    f"response format: {response}")
+            result[response_type] = response["payload"]
+        return result
+
+    def get_voltage(self) -> str:
+        """
+        Запрашивает напряжение.
+        """
+        response = self.send_command(self.COMMANDS['VOLTAGE'])
+        if not self.validate_response('VOLTAGE', response):
+            raise ValueError(f"Invalid voltage response format: {response}")
+        return response["payload"]
+
+    def get_ampere(self) -> str:
+        """
+        Запрашивает ток.
+        """
+        response = self.send_command(self.COMMANDS['AMPERE'])
+        if not self.validate_response('AMPERE', response):
+            raise ValueError(f"Invalid ampere response format: {response}")
+        return response["payload"]
+
+    def get_serial(self) -> str:
+        """
+        Запрашивает серийный номер.
+        """
+        response = self.send_command(self.COMMANDS['SERIAL'])
+        if not self.validate_response('SERIAL', response):
+            raise ValueError(f"Invalid serial response format: {response}")
+        return response["payload"]
+
+    def close(self):
+        """
+        Закрывает сокет.
+        """
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Автоматически закрывает соединения.
+        """
+        self.close()
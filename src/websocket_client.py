@@ -12,9 +12,54 @@
 # ============================================================================
 # Импорт модулей и глобальных переменных
 # ============================================================================
+import itertools
 import json
+import logging
 import re
+import time
+from collections import deque
+from concurrent.futures import Future
 import websocket
+from src import json_codec
+from src.identity_cache import IdentityCache
+from src.measurement import MEASUREMENT_UNITS, Measurement, parse_measurement
+from src.sampler import Sampler
+
+logger = logging.getLogger(__name__)
+
+
+def frame_size(frame) -> int:
+    """
+    Возвращает размер кадра в байтах: текстовые кадры передаются
+    в UTF-8.
+    """
+    if isinstance(frame, str):
+        return len(frame.encode())
+    return len(frame)
+
+
+def match_response(response, pending: dict, pending_by_cmd: dict,
+                   request_ids: bool):
+    """
+    Возвращает id ожидающего запроса, которому предназначен ответ, или
+    None, если ответ не относится ни к одному из них (например, запоздал
+    после таймаута). Ответ с id сопоставляется только по id, ответ
+    пакета {"results": [...]} - только ожидающему пакету, ответ с cmd -
+    самому старому запросу этой команды. Самому старому запросу
+    отдаётся только ответ без cmd и только при выключенных request_ids.
+    pending - {id: (cmd, future)}, pending_by_cmd - {cmd: deque(id)},
+    пакет ожидает под cmd None.
+    """
+    if isinstance(response, dict):
+        if 'id' in response:
+            request_id = response['id']
+            return request_id if request_id in pending else None
+        if 'cmd' in response or 'results' in response:
+            ids = pending_by_cmd.get(response.get('cmd'))
+            return ids[0] if ids else None
+    if request_ids or not pending:
+        return None
+    return next(iter(pending))
 
 
 class WebsocketClient:
@@ -32,26 +77,177 @@ class WebsocketClient:
         'SERIAL': re.compile(r'^S_[A-Z0-9]+$')
     }
 
-    def __init__(self, url: str = "ws://localhost:8765", timeout: float = 2.0):
+    # Запросы сериализуются один раз при загрузке класса
+    REQUEST_FRAMES = {cmd: json.dumps({"cmd": cmd})
+                      for cmd in COMMANDS.values()}
+
+    def __init__(self, url: str = "ws://localhost:8765", timeout: float = 2.0,
+                 request_ids: bool = False, metrics=None,
+                 rtt_estimator=None, circuit_breaker=None,
+                 connection_factory=None):
         """
         url: адрес WebSocket-сервера
         timeout: таймаут на чтение ответа
+        request_ids: добавлять в запросы поле id для сопоставления ответов
+        metrics: набор метрик src.metrics.Metrics (None - не собирать)
+        rtt_estimator: оценка времени ответа
+                       src.adaptive_timeout.RttEstimator; если задана,
+                       таймаут чтения ответов берётся из неё
+        circuit_breaker: автомат защиты src.circuit_breaker.CircuitBreaker
+                         для открытия соединения и обменов
+        connection_factory: фабрика соединений вместо
+                            websocket.create_connection (например, запись
+                            или воспроизведение src.traffic_recorder)
         """
         self.url = url
         self.timeout = timeout
+        self.request_ids = request_ids
+        self.metrics = metrics
+        self.rtt = rtt_estimator
+        self.circuit_breaker = circuit_breaker
+        self.connection_factory = connection_factory
         self.ws = None
+        self._socket_timeout = None
+        self._opened = False
+        self._request_counter = itertools.count(1)
+        self._pending = {}
+        self._pending_by_cmd = {}
+        self._batch_supported = None
+        self.unmatched_responses = 0
+        self.identity = IdentityCache()
         self.open()
 
     def open(self):
         """
         Устанавливает  соединение
         """
-        self.ws = websocket.create_connection(self.url, timeout=self.timeout)
+        self.identity.invalidate()
+        self._batch_supported = None
+        self._fail_pending(RuntimeError("WebSocket connection was reopened"))
+        if self.metrics is not None and self._opened:
+            self.metrics.increment('reconnects', self.url)
+        factory = self.connection_factory or websocket.create_connection
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.check()
+            try:
+                self.ws = factory(self.url, timeout=self.timeout)
+            except self.circuit_breaker.failures:
+                self.circuit_breaker.record_failure()
+                raise
+        else:
+            self.ws = factory(self.url, timeout=self.timeout)
+        self._socket_timeout = self.timeout
+        self._opened = True
 
     def send_command(self, cmd: str) -> dict:
         """
         Отправляет команду устройству и возвращает ответ (dict).
         """
+        return self.send_commands([cmd])[0]
+
+    def send_commands(self, cmds: list) -> list:
+        """
+        Отправляет несколько команд подряд, не дожидаясь ответов,
+        и возвращает ответы в порядке отправки команд.
+        """
+        for cmd in cmds:
+            self._check_command(cmd)
+
+        if self.metrics is None and self.circuit_breaker is None:
+            return self._send_commands(cmds)
+        return self._guarded(cmds, self._send_commands, cmds)
+
+    def _send_commands(self, cmds: list) -> list:
+        """
+        Отправляет проверенные команды и дожидается ответов.
+        """
+        futures = [self.submit(cmd) for cmd in cmds]
+        self.flush()
+        return [future.result() for future in futures]
+
+    def _guarded(self, cmds: list, call, *args):
+        """
+        Выполняет обмен call(*args) через автомат защиты, если он задан.
+        """
+        if self.circuit_breaker is not None:
+            return self.circuit_breaker.call(self._tracked, cmds, call, *args)
+        return self._tracked(cmds, call, *args)
+
+    def _tracked(self, cmds: list, call, *args):
+        """
+        Выполняет обмен call(*args) с записью метрик, если они заданы.
+        """
+        if self.metrics is None:
+            return call(*args)
+        started = self.metrics.start(self.url, cmds)
+        try:
+            result = call(*args)
+        except Exception as e:
+            self.metrics.finish(self.url, cmds, started, e)
+            raise
+        self.metrics.finish(self.url, cmds, started)
+        return result
+
+    def submit(self, cmd: str) -> Future:
+        """
+        Отправляет команду без ожидания ответа.
+        Возвращает Future, который будет разрешён вызовом flush().
+        """
+        self._check_command(cmd)
+
+        request_id = next(self._request_counter)
+        frame = self.REQUEST_FRAMES[cmd]
+        if self.request_ids:
+            frame = json_codec.encode_request(frame, request_id)
+
+        future = Future()
+        self._pending[request_id] = (cmd, future)
+        self._pending_by_cmd.setdefault(cmd, deque()).append(request_id)
+        try:
+            self.ws.send(frame)
+        except Exception as e:
+            self._resolve(request_id).set_exception(e)
+            raise
+        if self.metrics is not None:
+            self.metrics.increment('bytes_sent', self.url, frame_size(frame))
+        return future
+
+    def flush(self):
+        """
+        Читает ответы до разрешения всех отправленных команд.
+        """
+        try:
+            if self.rtt is not None:
+                timeout = self.rtt.port_timeout(self._socket_timeout)
+                if timeout != self._socket_timeout:
+                    self.ws.settimeout(timeout)
+                    self._socket_timeout = timeout
+                started = time.monotonic()
+            first = True
+            while self._pending:
+                message = self.ws.recv()
+                # Время ответа - до первого сообщения, остальные ответы
+                # конвейера приходят следом
+                if self.rtt is not None and first:
+                    self.rtt.observe(time.monotonic() - started)
+                first = False
+                if self.metrics is not None:
+                    self.metrics.increment('bytes_received', self.url,
+                                           frame_size(message))
+                self._dispatch(json_codec.loads(message))
+        except Exception as e:
+            if (
+                self.rtt is not None
+                and isinstance(e, websocket.WebSocketTimeoutException)
+            ):
+                self.rtt.on_timeout()
+            self._fail_pending(e)
+            raise
+
+    def _check_command(self, cmd: str):
+        """
+        Проверяет готовность соединения и допустимость команды.
+        """
         if self.ws is None:
             raise RuntimeError("WebSocket connection is not open")
 
@@ -61,21 +257,61 @@ class WebsocketClient:
 Valid commands are: {list(self.COMMANDS.values())}"
             )
 
-        request = {"cmd": cmd}
-        self.ws.send(json.dumps(request))
-        raw_response = self.ws.recv()
-        return json.loads(raw_response)
+    def _dispatch(self, response):
+        """
+        Сопоставляет ответ ожидающему запросу (см. match_response).
+        Ответ, не относящийся ни к одному запросу, отбрасывается.
+        """
+        request_id = match_response(response, self._pending,
+                                    self._pending_by_cmd, self.request_ids)
+        if request_id is None:
+            self.unmatched_responses += 1
+            logger.debug("Dropped unmatched response from %s: %r",
+                         self.url, response)
+            return
+
+        self._resolve(request_id).set_result(response)
+
+    def _resolve(self, request_id: int) -> Future:
+        """
+        Снимает запрос с ожидания и возвращает его Future.
+        """
+        cmd, future = self._pending.pop(request_id)
+        ids = self._pending_by_cmd[cmd]
+        ids.remove(request_id)
+        if not ids:
+            del self._pending_by_cmd[cmd]
+        return future
+
+    def _fail_pending(self, error: Exception):
+        """
+        Завершает все ожидающие запросы ошибкой.
+        """
+        pending = self._pending
+        self._pending = {}
+        self._pending_by_cmd = {}
+        for _, future in pending.values():
+            future.set_exception(error)
 
     def is_valid_command(self, cmd: str) -> bool:
         """
         Проверяет, является ли команда допустимой
         """
-        return cmd in self.COMMANDS.values()
+        return cmd in self.REQUEST_FRAMES
 
     def validate_response(self, response_type: str, response: dict) -> bool:
         """
         Валидирует формат ответа от WebSocket сервера.
         """
+        valid = self._matches(response_type, response)
+        if not valid and self.metrics is not None:
+            self.metrics.increment('validation_failures', self.url)
+        return valid
+
+    def _matches(self, response_type: str, response: dict) -> bool:
+        """
+        Проверяет ответ на соответствие шаблону типа ответа.
+        """
         if (
             not isinstance(response, dict)
             or 'cmd' not in response
@@ -99,6 +335,7 @@ Valid commands are: {list(self.COMMANDS.values())}"
         """
         response = self.send_command(self.COMMANDS['VOLTAGE'])
         if not self.validate_response('VOLTAGE', response):
+            self.identity.invalidate()
             raise ValueError(f"Invalid voltage response format: {response}")
         return response["payload"]
 
@@ -108,22 +345,192 @@ Valid commands are: {list(self.COMMANDS.values())}"
         """
         response = self.send_command(self.COMMANDS['AMPERE'])
         if not self.validate_response('AMPERE', response):
+            self.identity.invalidate()
             raise ValueError(f"Invalid ampere response format: {response}")
         return response["payload"]
 
     def get_serial(self) -> str:
         """
-        Запрашивает серийный номер.
+        Запрашивает серийный номер. В пределах соединения номер
+        запрашивается у сервера один раз.
         """
+        cached_serial = self.identity.get()
+        if cached_serial is not None:
+            return cached_serial
+
         response = self.send_command(self.COMMANDS['SERIAL'])
         if not self.validate_response('SERIAL', response):
             raise ValueError(f"Invalid serial response format: {response}")
+        self.identity.set(response["payload"])
         return response["payload"]
 
+    def send_batch(self, cmds: list) -> list:
+        """
+        Отправляет команды одним кадром {"cmds": [...]} и возвращает
+        ответы из {"results": [...]} в порядке команд. Если сервер не
+        поддерживает пакетные запросы, команды отправляются по одной.
+        Поддержка определяется первым пакетным запросом соединения.
+        """
+        for cmd in cmds:
+            self._check_command(cmd)
+
+        # Пробный пакет и переход на команды по одной - один обмен
+        # для метрик и автомата защиты
+        if self.metrics is None and self.circuit_breaker is None:
+            return self._send_batch_or_commands(cmds)
+        return self._guarded(cmds, self._send_batch_or_commands, cmds)
+
+    def _send_batch_or_commands(self, cmds: list) -> list:
+        """
+        Отправляет проверенные команды пакетом, а если сервер пакеты
+        не поддерживает - по одной.
+        """
+        if len(cmds) > 1 and self._batch_supported is not False:
+            responses = self._send_batch(cmds)
+            if responses is not None:
+                return responses
+        return self._send_commands(cmds)
+
+    def _send_batch(self, cmds: list) -> list:
+        """
+        Выполняет пакетный запрос. Возвращает None, если сервер
+        не поддерживает пакетные запросы.
+        """
+        request_id = next(self._request_counter)
+        request = {"cmds": cmds}
+        if self.request_ids:
+            request["id"] = request_id
+
+        # Ответ на пакет не содержит cmd и сопоставляется по ключу None
+        future = Future()
+        self._pending[request_id] = (None, future)
+        self._pending_by_cmd.setdefault(None, deque()).append(request_id)
+        frame = json_codec.dumps(request)
+        try:
+            self.ws.send(frame)
+        except Exception as e:
+            self._resolve(request_id).set_exception(e)
+            raise
+        if self.metrics is not None:
+            self.metrics.increment('bytes_sent', self.url, frame_size(frame))
+
+        try:
+            self.flush()
+        except websocket.WebSocketTimeoutException:
+            if self._batch_supported is None:
+                self._batch_supported = False
+                return None
+            raise
+
+        response = future.result()
+        results = (response.get('results')
+                   if isinstance(response, dict) else None)
+        if not isinstance(results, list) or len(results) != len(cmds):
+            if self._batch_supported is None:
+                self._batch_supported = False
+                return None
+            raise ValueError(f"Invalid batch response format: {response}")
+
+        self._batch_supported = True
+        return results
+
+    def get_batch(self, response_types: list) -> dict:
+        """
+        Запрашивает несколько величин одним пакетным запросом.
+        Возвращает словарь {тип ответа: payload}.
+        """
+        for response_type in response_types:
+            if response_type not in self.COMMANDS:
+                raise ValueError(
+                    f"Invalid response type: {response_type}. \
+Valid types are: {list(self.COMMANDS)}"
+                )
+
+        cached_serial = self.identity.get()
+        requested = [response_type for response_type in response_types
+                     if response_type != 'SERIAL' or cached_serial is None]
+        responses = self.send_batch(
+            [self.COMMANDS[response_type] for response_type in requested])
+
+        received = {}
+        for response_type, response in zip(requested, responses):
+            if not self.validate_response(response_type, response):
+                self.identity.invalidate()
+                raise ValueError(
+                    f"Invalid {response_type.lower()} "
+                    f"response format: {response}")
+            received[response_type] = response['payload']
+
+        if 'SERIAL' in received:
+            self.identity.set(received['SERIAL'])
+        elif 'SERIAL' in response_types:
+            received['SERIAL'] = cached_serial
+        return {response_type: received[response_type]
+                for response_type in response_types}
+
+    def measure(self, response_types: list) -> dict:
+        """
+        Запрашивает величины конвейером и возвращает словарь
+        {тип ответа: Measurement}.
+        """
+        for response_type in response_types:
+            if response_type not in MEASUREMENT_UNITS:
+                raise ValueError(
+                    f"Invalid measurement type: {response_type}. \
+Valid types are: {list(MEASUREMENT_UNITS)}"
+                )
+
+        responses = self.send_commands(
+            [self.COMMANDS[response_type] for response_type in response_types])
+        timestamp = time.monotonic()
+
+        result = {}
+        for response_type, response in zip(response_types, responses):
+            measurement = None
+            if (
+                isinstance(response, dict)
+                and response.get('cmd') == self.COMMANDS[response_type]
+                and isinstance(response.get('payload'), str)
+            ):
+                measurement = parse_measurement(
+                    response['payload'].encode(),
+                    MEASUREMENT_UNITS[response_type], self.url, timestamp)
+            if measurement is None:
+                self.identity.invalidate()
+                if self.metrics is not None:
+                    self.metrics.increment('validation_failures', self.url)
+                raise ValueError(
+                    f"Invalid {response_type.lower()} "
+                    f"response format: {response}")
+            result[response_type] = measurement
+        return result
+
+    def measure_voltage(self) -> Measurement:
+        """
+        Запрашивает напряжение как Measurement.
+        """
+        return self.measure(['VOLTAGE'])['VOLTAGE']
+
+    def measure_ampere(self) -> Measurement:
+        """
+        Запрашивает ток как Measurement.
+        """
+        return self.measure(['AMPERE'])['AMPERE']
+
+    def stream(self, response_types: list, hz: float,
+               count: int = None) -> Sampler:
+        """
+        Возвращает итератор измерений с частотой hz:
+        for m in device.stream(['VOLTAGE', 'AMPERE'], hz=50).
+        Пропущенные моменты опроса учитываются в missed_deadlines.
+        """
+        return Sampler(self.measure, response_types, hz, count)
+
     def close(self):
         """
         Закрывает соединение.
         """
+        self._fail_pending(RuntimeError("WebSocket connection is closed"))
         if self.ws and self.ws.connected:
             self.ws.close()
             self.ws = None
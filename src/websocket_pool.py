@@ -0,0 +1,260 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: websocket_pool.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Пул прогретых соединений WebsocketClient с проверкой
+#           соединений и фоновым переподключением.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+import websocket
+from src.websocket_client import WebsocketClient
+
+
+class WebsocketPool:
+    """
+    Класс пула соединений для одного URL.
+    Соединения открываются и проверяются фоновым потоком: простаивающие
+    соединения периодически проверяются ping/pong, разорванные
+    переоткрываются с экспоненциальной задержкой и случайным разбросом.
+    """
+
+    def __init__(self, url: str = "ws://localhost:8765", size: int = 4,
+                 timeout: float = 2.0, health_check_interval: float = 10.0,
+                 backoff_base: float = 0.5, backoff_max: float = 30.0):
+        """
+        url: адрес WebSocket-сервера
+        size: число соединений в пуле
+        timeout: таймаут соединений и ожидания pong
+        health_check_interval: период проверки простаивающих соединений
+        backoff_base, backoff_max: параметры задержки переподключения
+        """
+        self.url = url
+        self.size = size
+        self.timeout = timeout
+        self.health_check_interval = health_check_interval
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self._idle = deque()
+        self._missing = size
+        self._failures = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self._wakeup = threading.Event()
+        self._thread = threading.Thread(target=self._maintain,
+                                        name=f"websocket-pool {url}",
+                                        daemon=True)
+        self._thread.start()
+
+    @property
+    def idle_count(self) -> int:
+        """
+        Число простаивающих соединений.
+        """
+        with self._condition:
+            return len(self._idle)
+
+    def acquire(self, timeout: float = None) -> WebsocketClient:
+        """
+        Выдаёт соединение из пула, ожидая его не дольше timeout.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("WebSocket pool is closed")
+
+                if not self._idle:
+                    remaining = (None if deadline is None
+                                 else deadline - time.monotonic())
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(
+                            f"No WebSocket connection available for "
+                            f"{self.url}")
+                    self._condition.wait(remaining)
+                    continue
+
+                client = self._idle.pop()
+                if client.ws is not None and client.ws.connected:
+                    return client
+                self._discard()
+            self._close(client)
+
+    def release(self, client: WebsocketClient, discard: bool = False):
+        """
+        Возвращает соединение в пул. Повреждённое соединение
+        (discard=True) закрывается и переоткрывается в фоне.
+        """
+        with self._condition:
+            if not (discard or self._closed or client.ws is None):
+                self._idle.append(client)
+                self._condition.notify()
+                return
+            self._discard()
+        self._close(client)
+
+    @contextmanager
+    def connection(self, timeout: float = None):
+        """
+        Контекстный менеджер выдачи соединения. Соединение, на котором
+        произошла сетевая ошибка, в пул не возвращается.
+        """
+        client = self.acquire(timeout)
+        try:
+            yield client
+        except (websocket.WebSocketException, OSError):
+            self.release(client, discard=True)
+            raise
+        except BaseException:
+            self.release(client)
+            raise
+        else:
+            self.release(client)
+
+    def _discard(self):
+        """
+        Планирует открытие замены выбывшего соединения.
+        Вызывается под self._condition.
+        """
+        if not self._closed:
+            self._missing += 1
+            self._wakeup.set()
+
+    @staticmethod
+    def _close(client: WebsocketClient):
+        """
+        Закрывает выбывшее соединение. Вызывается без блокировки:
+        close() ждёт кадр закрытия от сервера до нескольких секунд.
+        """
+        try:
+            client.close()
+        except (websocket.WebSocketException, OSError):
+            pass
+
+    def _is_alive(self, client: WebsocketClient) -> bool:
+        """
+        Проверяет соединение обменом ping/pong.
+        """
+        try:
+            client.ws.ping()
+            opcode, _ = client.ws.recv_data_frame(control_frame=True)
+        except (websocket.WebSocketException, OSError, AttributeError):
+            return False
+        return opcode == websocket.ABNF.OPCODE_PONG
+
+    def _backoff(self) -> float:
+        """
+        Задержка перед следующей попыткой подключения (full jitter).
+        """
+        ceiling = min(self.backoff_max,
+                      self.backoff_base * 2 ** (self._failures - 1))
+        return random.uniform(0, ceiling)
+
+    def _reconnect(self) -> float:
+        """
+        Открывает недостающие соединения.
+        Возвращает задержку до следующей попытки при ошибке или None.
+        """
+        while True:
+            with self._condition:
+                if self._closed or not self._missing:
+                    return None
+
+            try:
+                client = WebsocketClient(self.url, timeout=self.timeout)
+            except (websocket.WebSocketException, OSError):
+                self._failures += 1
+                return self._backoff()
+
+            self._failures = 0
+            with self._condition:
+                if self._closed:
+                    client.close()
+                    return None
+                self._missing -= 1
+                self._idle.appendleft(client)
+                self._condition.notify()
+
+    def _health_check(self):
+        """
+        Проверяет простаивающие соединения и отбрасывает мёртвые.
+        """
+        with self._condition:
+            count = len(self._idle)
+
+        for _ in range(count):
+            with self._condition:
+                if self._closed or not self._idle:
+                    return
+                client = self._idle.popleft()
+
+            alive = self._is_alive(client)
+            with self._condition:
+                if alive and not self._closed:
+                    self._idle.append(client)
+                    self._condition.notify()
+                    continue
+                self._discard()
+            self._close(client)
+
+    def _maintain(self):
+        """
+        Фоновый цикл обслуживания пула.
+        """
+        next_check = time.monotonic() + self.health_check_interval
+        retry_at = None
+        while not self._closed:
+            self._wakeup.clear()
+
+            if retry_at is None or time.monotonic() >= retry_at:
+                delay = self._reconnect()
+                retry_at = (None if delay is None
+                            else time.monotonic() + delay)
+
+            now = time.monotonic()
+            if now >= next_check:
+                self._health_check()
+                next_check = now + self.health_check_interval
+                continue
+
+            wait = next_check - now
+            if retry_at is not None:
+                wait = min(wait, max(0.0, retry_at - now))
+            self._wakeup.wait(wait)
+
+    def close(self):
+        """
+        Закрывает все соединения и останавливает фоновый поток.
+        """
+        with self._condition:
+            self._closed = True
+            clients = list(self._idle)
+            self._idle.clear()
+            self._condition.notify_all()
+        self._wakeup.set()
+        self._thread.join()
+        for client in clients:
+            client.close()
+
+    def __enter__(self):
+        """
+        Поддерживает контекстный менеджер.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """
+        Автоматически закрывает соединения.
+        """
+        self.close()
@@ -0,0 +1,332 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: ws_protocol.py
+# Родитель: Наследуемый
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Минимальная реализация протокола WebSocket (RFC 6455) поверх
+#           потоков asyncio: рукопожатие клиента и сервера, кадры,
+#           сборка фрагментированных сообщений, ping/pong и закрытие.
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import base64
+import hashlib
+import os
+import ssl
+import struct
+from urllib.parse import urlsplit
+
+GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+
+OPCODE_CONTINUATION = 0x0
+OPCODE_TEXT = 0x1
+OPCODE_BINARY = 0x2
+OPCODE_CLOSE = 0x8
+OPCODE_PING = 0x9
+OPCODE_PONG = 0xA
+
+CLOSE_NORMAL = 1000
+CLOSE_PROTOCOL_ERROR = 1002
+
+MAX_MESSAGE_SIZE = 1 << 20
+
+
+class WebsocketClosedError(ConnectionError):
+    """
+    Соединение закрыто удалённой стороной или локально.
+    """
+
+
+class WebsocketHandshakeError(ConnectionError):
+    """
+    Ошибка рукопожатия WebSocket.
+    """
+
+
+def make_key() -> str:
+    """
+    Генерирует значение заголовка Sec-WebSocket-Key.
+    """
+    return base64.b64encode(os.urandom(16)).decode()
+
+
+def accept_key(key: str) -> str:
+    """
+    Вычисляет значение Sec-WebSocket-Accept для ключа клиента.
+    """
+    digest = hashlib.sha1((key + GUID).encode()).digest()
+    return base64.b64encode(digest).decode()
+
+
+def apply_mask(payload: bytes, mask: bytes) -> bytes:
+    """
+    Накладывает (снимает) маску на полезную нагрузку кадра.
+    """
+    length = len(payload)
+    if not length:
+        return payload
+    repeated = (mask * (length // 4 + 1))[:length]
+    return (int.from_bytes(payload, 'big')
+            ^ int.from_bytes(repeated, 'big')).to_bytes(length, 'big')
+
+
+def encode_frame(opcode: int, payload: bytes = b"",
+                 mask: bool = False, fin: bool = True) -> bytes:
+    """
+    Собирает кадр WebSocket.
+    Клиент обязан маскировать кадры, сервер - нет.
+    """
+    first = (0x80 if fin else 0) | opcode
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+
+    if length < 126:
+        header = struct.pack('!BB', first, mask_bit | length)
+    elif length < 1 << 16:
+        header = struct.pack('!BBH', first, mask_bit | 126, length)
+    else:
+        header = struct.pack('!BBQ', first, mask_bit | 127, length)
+
+    if not mask:
+        return header + payload
+
+    mask_key = os.urandom(4)
+    return header + mask_key + apply_mask(payload, mask_key)
+
+
+async def read_frame(reader: asyncio.StreamReader,
+                     max_size: int = MAX_MESSAGE_SIZE) -> tuple:
+    """
+    Читает один кадр. Возвращает (fin, opcode, payload).
+    """
+    first, second = await reader.readexactly(2)
+    length = second & 0x7F
+
+    if length == 126:
+        length, = struct.unpack('!H', await reader.readexactly(2))
+    elif length == 127:
+        length, = struct.unpack('!Q', await reader.readexactly(8))
+
+    if length > max_size:
+        raise ValueError(f"Frame of {length} bytes exceeds {max_size}")
+
+    mask_key = await reader.readexactly(4) if second & 0x80 else None
+    payload = await reader.readexactly(length)
+    if mask_key is not None:
+        payload = apply_mask(payload, mask_key)
+    return bool(first & 0x80), first & 0x0F, payload
+
+
+async def _read_http_head(reader: asyncio.StreamReader) -> tuple:
+    """
+    Читает стартовую строку и заголовки HTTP.
+    Возвращает (стартовая строка, словарь заголовков в нижнем регистре).
+    """
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode('latin-1').split("\r\n")
+    headers = {}
+    for line in lines[1:]:
+        if ":" in line:
+            name, value = line.split(":", 1)
+            headers[name.strip().lower()] = value.strip()
+    return lines[0], headers
+
+
+class WebsocketConnection:
+    """
+    Установленное WebSocket-соединение поверх потоков asyncio.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter, is_client: bool,
+                 max_size: int = MAX_MESSAGE_SIZE):
+        self.reader = reader
+        self.writer = writer
+        self.is_client = is_client
+        self.max_size = max_size
+        self.closed = False
+        self._pong_waiters = []
+
+    async def _send_frame(self, opcode: int, payload: bytes):
+        """
+        Отправляет один кадр.
+        """
+        if self.closed:
+            raise WebsocketClosedError("WebSocket connection is closed")
+        self.writer.write(encode_frame(opcode, payload, mask=self.is_client))
+        await self.writer.drain()
+
+    async def send(self, message: str):
+        """
+        Отправляет текстовое сообщение.
+        """
+        await self._send_frame(OPCODE_TEXT, message.encode('utf-8'))
+
+    async def recv(self) -> str:
+        """
+        Возвращает следующее сообщение данных, отвечая на служебные кадры.
+        """
+        fragments = []
+        message_opcode = None
+        size = 0
+
+        while True:
+            try:
+                fin, opcode, payload = await read_frame(self.reader,
+                                                        self.max_size)
+            except (asyncio.IncompleteReadError, ConnectionError) as e:
+                self.closed = True
+                raise WebsocketClosedError(
+                    "WebSocket connection lost") from e
+
+            if opcode == OPCODE_PING:
+                await self._send_frame(OPCODE_PONG, payload)
+                continue
+            if opcode == OPCODE_PONG:
+                waiters, self._pong_waiters = self._pong_waiters, []
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(payload)
+                continue
+            if opcode == OPCODE_CLOSE:
+                if not self.closed:
+                    await self._send_frame(OPCODE_CLOSE, payload[:2])
+                    self.closed = True
+                raise WebsocketClosedError("WebSocket connection is closed")
+
+            if opcode != OPCODE_CONTINUATION:
+                message_opcode = opcode
+                fragments = []
+                size = 0
+            size += len(payload)
+            if size > self.max_size:
+                raise ValueError(
+                    f"Message of {size} bytes exceeds {self.max_size}")
+            fragments.append(payload)
+
+            if fin:
+                data = b"".join(fragments)
+                if message_opcode == OPCODE_TEXT:
+                    return data.decode('utf-8')
+                return data
+
+    async def ping(self, payload: bytes = b""):
+        """
+        Отправляет ping и возвращает Future, разрешаемый при получении pong.
+        Pong обрабатывается в recv().
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._pong_waiters.append(waiter)
+        await self._send_frame(OPCODE_PING, payload)
+        return waiter
+
+    async def close(self, code: int = CLOSE_NORMAL):
+        """
+        Отправляет кадр закрытия и закрывает транспорт.
+        """
+        if not self.closed:
+            try:
+                await self._send_frame(OPCODE_CLOSE, struct.pack('!H', code))
+            except ConnectionError:
+                pass
+            self.closed = True
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def connect(url: str, max_size: int = MAX_MESSAGE_SIZE):
+    """
+    Устанавливает клиентское WebSocket-соединение по адресу ws:// или wss://.
+    """
+    parts = urlsplit(url)
+    if parts.scheme not in ("ws", "wss"):
+        raise ValueError(f"Unsupported URL scheme: {url}")
+
+    secure = parts.scheme == "wss"
+    host = parts.hostname or "localhost"
+    port = parts.port or (443 if secure else 80)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+
+    reader, writer = await asyncio.open_connection(
+        host, port, ssl=ssl.create_default_context() if secure else None)
+
+    key = make_key()
+    writer.write(
+        f"GET {path} HTTP/1.1\r\n"
+        f"Host: {host}:{port}\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Key: {key}\r\n"
+        "Sec-WebSocket-Version: 13\r\n"
+        "\r\n".encode())
+    await writer.drain()
+
+    try:
+        status_line, headers = await _read_http_head(reader)
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+        writer.close()
+        raise WebsocketHandshakeError(
+            f"Handshake with {url} failed: {str(e)}") from e
+
+    status = status_line.split(" ", 2)
+    if len(status) < 2 or status[1] != "101":
+        writer.close()
+        raise WebsocketHandshakeError(
+            f"Handshake with {url} failed: {status_line}")
+
+    if headers.get("sec-websocket-accept") != accept_key(key):
+        writer.close()
+        raise WebsocketHandshakeError(
+            f"Handshake with {url} failed: invalid Sec-WebSocket-Accept")
+
+    return WebsocketConnection(reader, writer, is_client=True,
+                               max_size=max_size)
+
+
+async def accept(reader: asyncio.StreamReader, writer: asyncio.StreamWriter,
+                 max_size: int = MAX_MESSAGE_SIZE) -> tuple:
+    """
+    Выполняет серверную часть рукопожатия.
+    Возвращает (WebsocketConnection, путь запроса).
+    """
+    try:
+        request_line, headers = await _read_http_head(reader)
+    except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as e:
+        writer.close()
+        raise WebsocketHandshakeError(f"Handshake failed: {str(e)}") from e
+
+    key = headers.get("sec-websocket-key")
+    if (
+        not request_line.startswith("GET ")
+        or headers.get("upgrade", "").lower() != "websocket"
+        or not key
+    ):
+        writer.write(b"HTTP/1.1 400 Bad Request\r\n"
+                     b"Content-Length: 0\r\n\r\n")
+        await writer.drain()
+        writer.close()
+        raise WebsocketHandshakeError(
+            f"Handshake failed: not a WebSocket request: {request_line}")
+
+    writer.write(
+        "HTTP/1.1 101 Switching Protocols\r\n"
+        "Upgrade: websocket\r\n"
+        "Connection: Upgrade\r\n"
+        f"Sec-WebSocket-Accept: {accept_key(key)}\r\n"
+        "\r\n".encode())
+    await writer.drain()
+
+    path = request_line.split(" ")[1] if " " in request_line else "/"
+    return WebsocketConnection(reader, writer, is_client=False,
+                               max_size=max_size), path
@@ -0,0 +1,187 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_adaptive_timeout.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для adaptive_timeout.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import random
+import sys
+import time
+import pytest
+import serial
+import websocket
+from src.adaptive_timeout import RttEstimator
+from src.device_controller import DeviceController
+from src.device_pool import DevicePool
+from src.emulator import SerialEmulator, WebsocketEmulator
+from src.websocket_client import WebsocketClient
+
+
+class TestRttEstimator:
+    """
+    Тесты оценки времени ответа
+    """
+
+    def test_first_sample(self):
+        """
+        Тест инициализации по первому измерению
+        """
+        estimator = RttEstimator(initial=1.0, floor=0.01)
+        assert estimator.timeout == 1.0
+
+        estimator.observe(0.1)
+
+        assert estimator.srtt == pytest.approx(0.1)
+        assert estimator.rttvar == pytest.approx(0.05)
+        assert estimator.timeout == pytest.approx(0.3)
+
+    def test_smoothing(self):
+        """
+        Тест сглаживания среднего и разброса
+        """
+        estimator = RttEstimator(floor=0.001)
+        estimator.observe(0.1)
+        estimator.observe(0.2)
+
+        assert estimator.rttvar == pytest.approx(0.75 * 0.05 + 0.25 * 0.1)
+        assert estimator.srtt == pytest.approx(0.875 * 0.1 + 0.125 * 0.2)
+        assert estimator.timeout == pytest.approx(
+            estimator.srtt + 4 * estimator.rttvar)
+
+        for _ in range(200):
+            estimator.observe(0.01)
+        assert estimator.timeout == pytest.approx(0.01, abs=0.001)
+
+    def test_bounds_and_backoff(self):
+        """
+        Тест границ таймаута и удвоения после таймаута
+        """
+        estimator = RttEstimator(initial=10.0, floor=0.05, ceiling=2.0)
+        assert estimator.timeout == 2.0
+
+        estimator.observe(0.001)
+        assert estimator.timeout == 0.05
+
+        estimator.on_timeout()
+        estimator.on_timeout()
+        assert estimator.timeout == pytest.approx(0.2)
+        for _ in range(10):
+            estimator.on_timeout()
+        assert estimator.timeout == 2.0
+        assert estimator.timeouts == 12
+
+        estimator.observe(0.001)
+        assert estimator.timeout == 0.05
+
+        with pytest.raises(ValueError, match="Invalid timeout bounds"):
+            RttEstimator(floor=1.0, ceiling=0.5)
+
+    def test_port_timeout_hysteresis(self):
+        """
+        Тест: таймаут порта меняется редко при разбросе времени ответа
+        """
+        estimator = RttEstimator(initial=1.0, floor=0.005, ceiling=1.0)
+        generator = random.Random(1)
+        current = 1.0
+        changes = 0
+        for _ in range(1000):
+            timeout = estimator.port_timeout(current)
+            assert timeout >= estimator.timeout
+            if timeout != current:
+                changes += 1
+                current = timeout
+            estimator.observe(0.030 + generator.uniform(-0.002, 0.002))
+
+        assert changes <= 5
+        assert current < 0.1
+
+        # После таймаута значение растёт сразу
+        estimator.on_timeout()
+        assert estimator.port_timeout(current) >= estimator.timeout > current
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires pty")
+class TestAdaptiveSerial:
+    """
+    Тесты адаптивного таймаута DeviceController
+    """
+
+    def test_learned_timeout(self):
+        """
+        Тест таймаута, выученного по ответам эмулятора
+        """
+        estimator = RttEstimator(initial=1.0, floor=0.02, ceiling=1.0)
+        with SerialEmulator(latency=0.005) as emulator, \
+                DeviceController(emulator.port,
+                                 rtt_estimator=estimator) as device:
+            for _ in range(20):
+                device.get_voltage()
+            assert estimator.samples == 20
+            assert estimator.timeout < 0.2
+            assert device.serial_connection.timeout == \
+                estimator.port_timeout(device.serial_connection.timeout)
+            assert device.serial_connection.timeout >= estimator.timeout
+
+            # Пакет даёт одно измерение - по первой строке
+            device.get_batch(['VOLTAGE', 'AMPERE'])
+            assert estimator.samples == 21
+
+            emulator.drop_rate = 1.0
+            started = time.monotonic()
+            with pytest.raises(serial.SerialTimeoutException):
+                device.get_voltage()
+            assert time.monotonic() - started < 0.5
+            assert estimator.timeouts == 1
+
+    def test_device_pool(self):
+        """
+        Тест оценок пула, переживающих переоткрытие порта
+        """
+        with SerialEmulator() as emulator, \
+                DevicePool([emulator.port], timeout=0.5,
+                           adaptive_timeout=True) as pool:
+            pool.poll(['VOLTAGE'])
+            estimator = pool.estimators[emulator.port]
+            assert pool.devices[emulator.port].rtt is estimator
+            assert estimator.samples == 1
+            assert estimator.timeout <= 0.5
+
+            pool._drop_device(emulator.port)
+            pool.poll(['VOLTAGE'])
+            assert pool.devices[emulator.port].rtt is estimator
+            assert estimator.samples == 2
+
+
+class TestAdaptiveWebsocket:
+    """
+    Тесты адаптивного таймаута WebsocketClient
+    """
+
+    def test_learned_timeout(self):
+        """
+        Тест таймаута, выученного по ответам эмулятора
+        """
+        estimator = RttEstimator(initial=2.0, floor=0.02, ceiling=2.0)
+        with WebsocketEmulator() as emulator, \
+                WebsocketClient(emulator.url,
+                                rtt_estimator=estimator) as client:
+            for _ in range(20):
+                client.get_voltage()
+            assert estimator.samples == 20
+            client.send_commands(['GET_V', 'GET_A', 'GET_S'])
+            assert estimator.samples == 21
+
+            emulator.drop_rate = 1.0
+            started = time.monotonic()
+            with pytest.raises(websocket.WebSocketTimeoutException):
+                client.get_voltage()
+            assert time.monotonic() - started < 0.5
+            assert estimator.timeouts == 1
@@ -0,0 +1,96 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_analytics.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для analytics.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import numpy as np
+import pytest
+from src import analytics
+from src.telemetry_store import TelemetryStore
+
+
+class TestAnalytics:
+    """
+    Тесты векторной аналитики
+    """
+    def test_parse_values(self):
+        """
+        Тест извлечения чисел из ответов с заменой некорректных на NaN
+        """
+        values = analytics.parse_values(
+            ["V_12V", "V_0V", "V_12.5V", "V_12", "VOLT_12V", "V__1V", "V_V"],
+            'VOLTAGE')
+
+        np.testing.assert_array_equal(
+            values, [12, 0, np.nan, np.nan, np.nan, np.nan, np.nan])
+        np.testing.assert_array_equal(
+            analytics.parse_values([b"A_1A", b"V_1V"], 'AMPERE'), [1, np.nan])
+
+        with pytest.raises(ValueError, match="Invalid measurement type"):
+            analytics.parse_values(["S_DSA123"], 'SERIAL')
+
+    def test_history_matrix(self):
+        """
+        Тест сборки матрицы из рядов хранилища с дополнением NaN
+        """
+        store = TelemetryStore(capacity=4)
+        for i in range(6):
+            store.series("COM1", 'VOLTAGE').append(float(i), i)
+        store.series("COM2", 'VOLTAGE').append(0.0, 7)
+        store.series("COM2", 'AMPERE').append(0.0, 1)
+
+        device_ids, matrix = analytics.history_matrix(store, 'VOLTAGE', 3)
+
+        assert device_ids == ["COM1", "COM2"]
+        np.testing.assert_array_equal(matrix, [[3, 4, 5],
+                                               [np.nan, np.nan, 7]])
+
+    def test_rolling_stats(self):
+        """
+        Тест скользящих min/max/mean/std
+        """
+        matrix = np.array([[1, 2, 3, 4],
+                           [4, 4, np.nan, 4]])
+
+        stats = analytics.rolling_stats(matrix, 2)
+
+        np.testing.assert_array_equal(stats['min'], [[1, 2, 3],
+                                                     [4, np.nan, np.nan]])
+        np.testing.assert_array_equal(stats['max'], [[2, 3, 4],
+                                                     [4, np.nan, np.nan]])
+        np.testing.assert_array_equal(stats['mean'], [[1.5, 2.5, 3.5],
+                                                      [4, np.nan, np.nan]])
+        np.testing.assert_array_equal(stats['std'], [[0.5, 0.5, 0.5],
+                                                     [0, np.nan, np.nan]])
+
+        with pytest.raises(ValueError, match="Invalid window"):
+            analytics.rolling_stats(matrix, 5)
+
+    def test_out_of_range_and_alarms(self):
+        """
+        Тест выхода за диапазон с общими и индивидуальными порогами
+        """
+        matrix = np.array([[12, 12, 13],
+                           [12, 15, 16],
+                           [np.nan, 9, 12]])
+
+        np.testing.assert_array_equal(
+            analytics.out_of_range(matrix, 10, 14),
+            [[False, False, False],
+             [False, True, True],
+             [False, True, False]])
+        np.testing.assert_array_equal(
+            analytics.alarms(matrix, 10, 14), [1, 2])
+        np.testing.assert_array_equal(
+            analytics.alarms(matrix, 10, 14, min_count=2), [1])
+        np.testing.assert_array_equal(
+            analytics.alarms(matrix, [10, 10, 8], [14, 16, 14]), [])
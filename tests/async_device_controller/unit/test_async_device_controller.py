@@ -0,0 +1,270 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_async_device_controller.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Мок тесты для async_device_controller.py
+# Примечание: serial.Serial подменяется концом socketpair, второй конец
+#             обслуживается потоком-эмулятором устройства
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import socket
+import threading
+import time
+import pytest
+import serial
+from unittest.mock import patch
+from src.async_device_controller import AsyncDeviceController
+
+
+class FakeSerial:
+    """
+    Неблокирующий serial-порт поверх socketpair.
+    """
+    def __init__(self, sock):
+        self.sock = sock
+        self.sock.setblocking(False)
+        self.is_open = True
+
+    @property
+    def in_waiting(self):
+        return 0
+
+    def fileno(self):
+        return self.sock.fileno()
+
+    def read(self, size=1):
+        try:
+            return self.sock.recv(4096)
+        except BlockingIOError:
+            return b""
+
+    def write(self, data):
+        self.sock.sendall(data)
+
+    def reset_input_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+        self.sock.close()
+
+
+def run_device(sock, answers):
+    """
+    Отвечает на каждую принятую строку-команду ответом из answers.
+    """
+    buffer = b""
+    with sock:
+        while True:
+            data = sock.recv(4096)
+            if not data:
+                return
+            buffer += data
+            while b"\r\n" in buffer:
+                line, buffer = buffer.split(b"\r\n", 1)
+                answer = answers.get(line.decode())
+                if answer is not None:
+                    sock.sendall(answer)
+
+
+@pytest.fixture
+def fake_port():
+    """
+    Создаёт пару сокетов и запускает эмулятор устройства.
+    """
+    def factory(answers):
+        host_sock, device_sock = socket.socketpair()
+        threading.Thread(target=run_device,
+                         args=(device_sock, answers),
+                         daemon=True).start()
+        return FakeSerial(host_sock)
+    return factory
+
+
+ANSWERS = {
+    "GET_V": b"V_12V\r\n",
+    "GET_A": b"A_1A\r\n",
+    "GET_S": b"S_DSA123\r\n"
+}
+
+
+class TestAsyncDeviceController:
+    """
+    Тесты для класса AsyncDeviceController
+    """
+    @patch('serial.Serial')
+    def test_get_values(self, mock_serial, fake_port):
+        """
+        Тест получения напряжения, тока и серийного номера
+        """
+        mock_serial.return_value = fake_port(ANSWERS)
+
+        async def scenario():
+            async with AsyncDeviceController("COM1") as device:
+                return (await device.get_voltage(),
+                        await device.get_ampere(),
+                        await device.get_serial())
+
+        assert asyncio.run(scenario()) == ("V_12V", "A_1A", "S_DSA123")
+        mock_serial.assert_called_once_with(port="COM1",
+                                            baudrate=9600,
+                                            timeout=0)
+
+    @patch('serial.Serial')
+    def test_many_devices_gather(self, mock_serial, fake_port):
+        """
+        Тест параллельного опроса нескольких устройств в одном цикле
+        """
+        mock_serial.side_effect = [fake_port(ANSWERS) for _ in range(20)]
+
+        async def scenario():
+            devices = [AsyncDeviceController(f"/dev/ttyUSB{i}")
+                       for i in range(20)]
+            for device in devices:
+                await device.open_connection()
+            try:
+                return await asyncio.gather(
+                    *(device.get_batch(['VOLTAGE', 'AMPERE'])
+                      for device in devices))
+            finally:
+                for device in devices:
+                    device.close()
+
+        results = asyncio.run(scenario())
+
+        assert results == [{'VOLTAGE': "V_12V", 'AMPERE': "A_1A"}] * 20
+
+    @patch('serial.Serial')
+    def test_invalid_response(self, mock_serial, fake_port):
+        """
+        Тест некорректного ответа устройства
+        """
+        mock_serial.return_value = fake_port({"GET_V": b"V_12.5V\r\n"})
+
+        async def scenario():
+            async with AsyncDeviceController("COM1") as device:
+                await device.get_voltage()
+
+        with pytest.raises(ValueError,
+                           match="Invalid voltage response format"):
+            asyncio.run(scenario())
+
+    @patch('serial.Serial')
+    def test_read_timeout(self, mock_serial, fake_port):
+        """
+        Тест таймаута при отсутствии ответа
+        """
+        mock_serial.return_value = fake_port({})
+
+        async def scenario():
+            async with AsyncDeviceController("COM1", timeout=0.1) as device:
+                await device.get_serial()
+
+        with pytest.raises(serial.SerialTimeoutException,
+                           match="Read timeout occurred"):
+            asyncio.run(scenario())
+
+    @patch('serial.Serial')
+    def test_reopen_closes_previous_port(self, mock_serial, fake_port):
+        """
+        Тест повторного открытия: старый порт закрыт и снят с наблюдения
+        """
+        first, second = fake_port(ANSWERS), fake_port(ANSWERS)
+        first_fd = first.fileno()
+        mock_serial.side_effect = [first, second]
+
+        async def scenario():
+            device = AsyncDeviceController("COM1")
+            await device.open_connection()
+            await device.open_connection()
+            try:
+                watched = [key.fd for key in
+                           asyncio.get_running_loop()._selector
+                           .get_map().values()]
+                return watched, await device.get_voltage()
+            finally:
+                device.close()
+
+        watched, voltage = asyncio.run(scenario())
+
+        assert voltage == "V_12V"
+        assert not first.is_open
+        assert first_fd not in watched
+
+    @patch('serial.Serial')
+    def test_write_does_not_block_loop(self, mock_serial):
+        """
+        Тест записи при полном буфере передачи: цикл событий продолжает
+        работать, запись дописывается по готовности порта
+        """
+        host_sock, device_sock = socket.socketpair()
+        mock_serial.return_value = FakeSerial(host_sock)
+        data = b"x" * (4 << 20)
+        received = []
+
+        def drain():
+            device_sock.settimeout(5)
+            time.sleep(0.1)
+            size = 0
+            while size < len(data):
+                size += len(device_sock.recv(1 << 16))
+            received.append(size)
+
+        async def scenario():
+            ticks = 0
+
+            async def tick():
+                nonlocal ticks
+                while True:
+                    ticks += 1
+                    await asyncio.sleep(0.01)
+
+            async with AsyncDeviceController("COM1", timeout=5) as device:
+                ticker = asyncio.get_running_loop().create_task(tick())
+                await device._write(data)
+                ticker.cancel()
+            return ticks
+
+        thread = threading.Thread(target=drain)
+        thread.start()
+        ticks = asyncio.run(scenario())
+        thread.join()
+        device_sock.close()
+
+        assert received == [len(data)]
+        assert ticks >= 5
+
+    @patch('serial.Serial')
+    def test_write_timeout(self, mock_serial):
+        """
+        Тест таймаута записи в порт, который не принимает данные
+        """
+        host_sock, device_sock = socket.socketpair()
+        mock_serial.return_value = FakeSerial(host_sock)
+
+        async def scenario():
+            async with AsyncDeviceController("COM1", timeout=0.1) as device:
+                await device._write(b"x" * (4 << 20))
+
+        with device_sock:
+            with pytest.raises(serial.SerialTimeoutException,
+                               match="Write timeout occurred"):
+                asyncio.run(scenario())
+
+    def test_send_command_closed_connection(self):
+        """
+        Тест обработки ошибки при закрытом соединении
+        """
+        device = AsyncDeviceController("COM1")
+
+        with pytest.raises(RuntimeError,
+                           match="Serial connection is not open"):
+            asyncio.run(device.send_command("GET_V"))
@@ -0,0 +1,178 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_async_websocket_client.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для async_websocket_client.py
+# Примечание: Используется локальный сервер на ws_protocol.accept
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import json
+import pytest
+from src import ws_protocol
+from src.async_websocket_client import AsyncWebsocketClient
+
+PAYLOADS = {"GET_V": "V_12V", "GET_A": "A_1A", "GET_S": "S_DSA123"}
+
+
+async def start_server(payloads=None, reverse=False):
+    """
+    Запускает локальный сервер. При reverse=True сервер копит запросы
+    и отвечает на них пачкой в обратном порядке.
+    """
+    payloads = payloads or PAYLOADS
+
+    async def handle(reader, writer):
+        connection, _ = await ws_protocol.accept(reader, writer)
+        batch = []
+        try:
+            while True:
+                request = json.loads(await connection.recv())
+                response = dict(request, payload=payloads[request["cmd"]])
+                if not reverse:
+                    await connection.send(json.dumps(response))
+                    continue
+                batch.append(response)
+                if len(batch) == 3:
+                    for response in reversed(batch):
+                        await connection.send(json.dumps(response))
+                    batch = []
+        except ws_protocol.WebsocketClosedError:
+            pass
+        finally:
+            await connection.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    return server, f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+
+
+class TestAsyncWebsocketClient:
+    """
+    Тесты для класса AsyncWebsocketClient
+    """
+    def test_get_values(self):
+        """
+        Тест получения напряжения, тока и серийного номера
+        """
+        async def scenario():
+            server, url = await start_server()
+            async with server:
+                async with AsyncWebsocketClient(url) as client:
+                    return (await client.get_voltage(),
+                            await client.get_ampere(),
+                            await client.get_serial())
+
+        assert asyncio.run(scenario()) == ("V_12V", "A_1A", "S_DSA123")
+
+    def test_many_sessions_gather(self):
+        """
+        Тест опроса множества сессий в одном цикле событий
+        """
+        async def scenario():
+            server, url = await start_server()
+            async with server:
+                clients = [AsyncWebsocketClient(url) for _ in range(100)]
+                await asyncio.gather(*(client.open() for client in clients))
+                try:
+                    return await asyncio.gather(
+                        *(client.get_voltage() for client in clients))
+                finally:
+                    await asyncio.gather(
+                        *(client.close() for client in clients))
+
+        assert asyncio.run(scenario()) == ["V_12V"] * 100
+
+    def test_out_of_order_responses(self):
+        """
+        Тест сопоставления ответов, пришедших в обратном порядке
+        """
+        async def scenario():
+            server, url = await start_server(reverse=True)
+            async with server:
+                async with AsyncWebsocketClient(url) as client:
+                    return await client.send_commands(
+                        ["GET_V", "GET_A", "GET_S"])
+
+        responses = asyncio.run(scenario())
+
+        assert [response["payload"] for response in responses] == [
+            "V_12V", "A_1A", "S_DSA123"]
+
+    def test_invalid_response(self):
+        """
+        Тест некорректного ответа сервера
+        """
+        async def scenario():
+            server, url = await start_server({"GET_A": "A_1.5A"})
+            async with server:
+                async with AsyncWebsocketClient(url) as client:
+                    await client.get_ampere()
+
+        with pytest.raises(ValueError, match="Invalid ampere response format"):
+            asyncio.run(scenario())
+
+    def test_response_timeout(self):
+        """
+        Тест таймаута ожидания ответа
+        """
+        async def scenario():
+            server, url = await start_server(reverse=True)
+            async with server:
+                async with AsyncWebsocketClient(url, timeout=0.2) as client:
+                    with pytest.raises(asyncio.TimeoutError):
+                        await client.get_voltage()
+                    assert not client._pending
+
+        asyncio.run(scenario())
+
+    def test_late_response_is_dropped(self):
+        """
+        Тест: ответ на запрос, отменённый по таймауту, не достаётся
+        следующему запросу
+        """
+        async def handle(reader, writer):
+            connection, _ = await ws_protocol.accept(reader, writer)
+            try:
+                while True:
+                    request = json.loads(await connection.recv())
+                    if request["cmd"] == "GET_V":
+                        await asyncio.sleep(0.3)
+                    await connection.send(json.dumps(
+                        dict(request, payload=PAYLOADS[request["cmd"]])))
+            except ws_protocol.WebsocketClosedError:
+                pass
+            finally:
+                await connection.close()
+
+        async def scenario(request_ids):
+            server = await asyncio.start_server(handle, "127.0.0.1", 0)
+            url = f"ws://127.0.0.1:{server.sockets[0].getsockname()[1]}"
+            async with server:
+                async with AsyncWebsocketClient(
+                        url, timeout=0.1, request_ids=request_ids) as client:
+                    with pytest.raises(asyncio.TimeoutError):
+                        await client.get_voltage()
+                    # Запоздавший ответ GET_V приходит раньше ответа GET_A
+                    client.timeout = 1.0
+                    ampere = await client.get_ampere()
+                    return ampere, client.unmatched_responses
+
+        for request_ids in (True, False):
+            assert asyncio.run(scenario(request_ids)) == ("A_1A", 1)
+
+    def test_send_command_closed_connection(self):
+        """
+        Тест ошибки при закрытом соединении
+        """
+        client = AsyncWebsocketClient("ws://localhost:8765")
+
+        with pytest.raises(RuntimeError,
+                           match="WebSocket connection is not open"):
+            asyncio.run(client.send_command("GET_V"))
@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_benchmark.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для benchmark.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import json
+import pytest
+from src import benchmark
+
+
+class FakeClient:
+    """
+    Клиент, записывающий отправленные команды.
+    """
+
+    def __init__(self):
+        self.commands = []
+
+    def send_command(self, command):
+        self.commands.append(command)
+        return command
+
+
+class TestBenchmark:
+    """
+    Тесты замеров
+    """
+
+    def test_percentile(self):
+        """
+        Тест перцентилей методом ближайшего ранга
+        """
+        values = list(range(1, 101))
+
+        assert benchmark.percentile(values, 50) == 50
+        assert benchmark.percentile(values, 95) == 95
+        assert benchmark.percentile(values, 99) == 99
+        assert benchmark.percentile([7], 99) == 7
+        assert benchmark.percentile([], 50) is None
+
+    def test_summarize(self):
+        """
+        Тест сводки замера
+        """
+        summary = benchmark.summarize([0.002, 0.001, 0.003, 0.004],
+                                      wall=0.5, cpu=0.002, allocations=100)
+
+        assert summary["commands"] == 4
+        assert summary["latency_ms"]["p50"] == pytest.approx(2)
+        assert summary["latency_ms"]["max"] == pytest.approx(4)
+        assert summary["commands_per_second"] == pytest.approx(8)
+        assert summary["cpu_us_per_command"] == pytest.approx(500)
+        assert summary["alloc_bytes_per_command"] == 100
+
+    def test_run_workload(self):
+        """
+        Тест выполнения команд по кругу несколькими клиентами
+        """
+        clients = [FakeClient(), FakeClient()]
+
+        result = benchmark.run_workload(clients, ['GET_V', 'GET_A'], 10,
+                                        warmup=2)
+
+        assert result["commands"] == 20
+        assert clients[0].commands[2:6] == ['GET_V', 'GET_A'] * 2
+        assert result["alloc_bytes_per_command"] is None
+
+        result = benchmark.run_workload([FakeClient()], ['GET_V'], 10)
+        assert result["alloc_bytes_per_command"] >= 0
+
+    def test_compare(self):
+        """
+        Тест сравнения результатов
+        """
+        def report(p50, rate):
+            return {"results": [{"transport": "serial", "workload": "single",
+                                 "latency_ms": {"p50": p50},
+                                 "commands_per_second": rate}]}
+
+        lines = benchmark.compare(report(1.0, 1000), report(0.5, 2000))
+
+        assert lines == ["serial/single: p50 1.000 -> 0.500 ms (-50.0%), "
+                         "1000 -> 2000 cmd/s (+100.0%)"]
+
+    def test_main_websocket(self, tmp_path, capsys):
+        """
+        Тест полного прогона на WebSocket-эмуляторе
+        """
+        output = tmp_path / "results.json"
+
+        benchmark.main(["--output", str(output), "--iterations", "20",
+                        "--workers", "2", "--transports", "websocket"])
+
+        report = json.loads(output.read_text())
+        assert report["format_version"] == benchmark.FORMAT_VERSION
+        assert [result["workload"] for result in report["results"]] == \
+            ["single", "sequential", "concurrent"]
+        assert report["results"][2]["commands"] == 40
+        assert "websocket/single" in capsys.readouterr().out
@@ -0,0 +1,149 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_cached_reader.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для cached_reader.py
+# Примечание: Клиент и часы подменяются управляемыми объектами
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import threading
+import time
+import pytest
+from src.cached_reader import CachedReader
+
+
+class FakeClient:
+    """
+    Клиент, возвращающий V_<n>V с номером обмена и блокирующийся,
+    пока не открыт gate.
+    """
+    def __init__(self):
+        self.calls = 0
+        self.gate = threading.Event()
+        self.gate.set()
+
+    def get_voltage(self):
+        self.gate.wait()
+        self.calls += 1
+        return f"V_{self.calls}V"
+
+    def get_ampere(self):
+        raise TimeoutError("Read timeout occurred")
+
+
+class FakeClock:
+    """
+    Управляемые часы.
+    """
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def wait_for(condition, timeout=2.0):
+    """
+    Ожидает выполнения условия.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.01)
+
+
+class TestCachedReader:
+    """
+    Тесты для класса CachedReader
+    """
+    def test_fresh_value_served_from_cache(self):
+        """
+        Тест выдачи свежего значения без обмена с устройством
+        """
+        client, clock = FakeClient(), FakeClock()
+
+        with CachedReader(client, max_age=1.0, clock=clock) as reader:
+            assert reader.get_voltage() == "V_1V"
+            clock.now = 0.9
+            assert reader.get_voltage() == "V_1V"
+
+        assert client.calls == 1
+
+    def test_stale_value_revalidated_in_background(self):
+        """
+        Тест выдачи устаревшего значения с фоновым обновлением
+        """
+        client, clock = FakeClient(), FakeClock()
+
+        with CachedReader(client, max_age=1.0, stale_age=5.0,
+                          clock=clock) as reader:
+            reader.get_voltage()
+            client.gate.clear()
+            clock.now = 2.0
+
+            assert reader.get_voltage() == "V_1V"
+            client.gate.set()
+            wait_for(lambda: client.calls == 2)
+            wait_for(lambda: reader.get_voltage() == "V_2V")
+
+    def test_expired_value_waits_for_device(self):
+        """
+        Тест ожидания обмена при слишком старом значении
+        """
+        client, clock = FakeClient(), FakeClock()
+
+        with CachedReader(client, max_age=1.0, stale_age=5.0,
+                          clock=clock) as reader:
+            reader.get_voltage()
+            clock.now = 6.0
+            assert reader.get_voltage() == "V_2V"
+
+    def test_concurrent_misses_share_one_exchange(self):
+        """
+        Тест объединения одновременных промахов в один обмен
+        """
+        client = FakeClient()
+        client.gate.clear()
+        results = []
+
+        with CachedReader(client, max_age=1.0) as reader:
+            threads = [threading.Thread(
+                target=lambda: results.append(reader.get_voltage()))
+                for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)
+            client.gate.set()
+            for thread in threads:
+                thread.join()
+
+        assert results == ["V_1V"] * 10
+        assert client.calls == 1
+
+    def test_background_refresh(self):
+        """
+        Тест периодического фонового обновления
+        """
+        client = FakeClient()
+
+        with CachedReader(client, max_age=10.0,
+                          refresh_interval=0.02) as reader:
+            reader.get_voltage()
+            wait_for(lambda: client.calls >= 3)
+
+    def test_errors(self):
+        """
+        Тест ошибок обмена и неизвестной величины
+        """
+        with CachedReader(FakeClient()) as reader:
+            with pytest.raises(TimeoutError):
+                reader.get_ampere()
+            with pytest.raises(ValueError, match="Invalid response type"):
+                reader.get('SERIAL')
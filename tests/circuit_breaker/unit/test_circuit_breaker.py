@@ -0,0 +1,270 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_circuit_breaker.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для circuit_breaker.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import sys
+import time
+import pytest
+import serial
+import websocket
+from unittest.mock import Mock, patch
+from src.circuit_breaker import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker,
+                                 CircuitOpenError)
+from src.device_controller import DeviceController
+from src.device_pool import DevicePool
+from src.emulator import SerialEmulator
+from src.websocket_client import WebsocketClient
+
+
+class FakeClock:
+    """
+    Управляемые часы для тестов.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fail():
+    raise serial.SerialTimeoutException("Read timeout occurred")
+
+
+class TestCircuitBreaker:
+    """
+    Тесты автомата защиты
+    """
+
+    def test_trips_after_threshold(self):
+        """
+        Тест размыкания после серии сбоев и быстрого отказа
+        """
+        breaker = CircuitBreaker("dev", failure_threshold=3,
+                                 clock=FakeClock())
+        for _ in range(3):
+            with pytest.raises(serial.SerialTimeoutException):
+                breaker.call(fail)
+
+        assert breaker.state == OPEN
+        function = Mock()
+        with pytest.raises(CircuitOpenError, match="dev is open"):
+            breaker.call(function)
+        function.assert_not_called()
+
+    def test_success_resets_failures(self):
+        """
+        Тест сброса счётчика сбоев успешным обменом
+        """
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+        with pytest.raises(serial.SerialTimeoutException):
+            breaker.call(fail)
+        assert breaker.call(lambda: "V_12V") == "V_12V"
+        with pytest.raises(serial.SerialTimeoutException):
+            breaker.call(fail)
+
+        assert breaker.state == CLOSED
+        assert breaker.consecutive_failures == 1
+
+    def test_other_errors_are_not_failures(self):
+        """
+        Тест: ошибка формата ответа означает, что устройство отвечает
+        """
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+
+        def invalid():
+            raise ValueError("Invalid response")
+
+        with pytest.raises(ValueError):
+            breaker.call(invalid)
+        assert breaker.state == CLOSED
+
+    def test_half_open_probe(self):
+        """
+        Тест пробного обмена после recovery_timeout
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10,
+                                 clock=clock)
+        with pytest.raises(serial.SerialTimeoutException):
+            breaker.call(fail)
+
+        clock.now = 9.0
+        assert breaker.snapshot()["retry_in"] == pytest.approx(1.0)
+        clock.now = 10.0
+        assert breaker.state == HALF_OPEN
+
+        # Неудачная проба снова размыкает автомат
+        with pytest.raises(serial.SerialTimeoutException):
+            breaker.call(fail)
+        assert breaker.state == OPEN
+        assert breaker.trips == 2
+
+        clock.now = 20.0
+        assert breaker.call(lambda: "ok") == "ok"
+        assert breaker.state == CLOSED
+
+    def test_probe_limit(self):
+        """
+        Тест ограничения числа одновременных проб
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=1,
+                                 clock=clock)
+        breaker.record_failure()
+        clock.now = 1.0
+
+        breaker.before_call()
+        with pytest.raises(CircuitOpenError, match="half_open"):
+            breaker.before_call()
+        # check() пробу не занимает
+        breaker.check()
+
+    def test_listeners_and_snapshot(self):
+        """
+        Тест уведомлений о смене состояния и снимка состояния
+        """
+        clock = FakeClock()
+        breaker = CircuitBreaker("dev", failure_threshold=1,
+                                 recovery_timeout=5, clock=clock)
+        changes = []
+        breaker.add_listener(
+            lambda b, old, new: changes.append((b.name, old, new)))
+
+        breaker.record_failure()
+        clock.now = 5.0
+        breaker.snapshot()
+        breaker.reset()
+
+        assert changes == [("dev", CLOSED, OPEN), ("dev", OPEN, HALF_OPEN),
+                           ("dev", HALF_OPEN, CLOSED)]
+        assert breaker.snapshot() == {
+            "name": "dev",
+            "state": CLOSED,
+            "consecutive_failures": 0,
+            "trips": 1,
+            "retry_in": 0.0
+        }
+
+
+class TestClients:
+    """
+    Тесты автомата защиты в клиентах
+    """
+
+    @patch('serial.Serial')
+    def test_device_controller_fails_fast(self, mock_serial):
+        """
+        Тест: разомкнутый автомат не ждёт таймаута порта
+        """
+        mock_serial_instance = Mock()
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b""
+        mock_serial.return_value = mock_serial_instance
+        breaker = CircuitBreaker("COM1", failure_threshold=2)
+
+        device = DeviceController("COM1", circuit_breaker=breaker)
+        for _ in range(2):
+            with pytest.raises(serial.SerialTimeoutException):
+                device.get_voltage()
+        writes = mock_serial_instance.write.call_count
+
+        with pytest.raises(CircuitOpenError):
+            device.get_voltage()
+        assert mock_serial_instance.write.call_count == writes
+
+    @patch('serial.Serial')
+    def test_device_controller_open(self, mock_serial):
+        """
+        Тест учёта ошибок открытия порта
+        """
+        mock_serial.side_effect = serial.SerialException("no such device")
+        breaker = CircuitBreaker("COM1", failure_threshold=1)
+
+        with pytest.raises(serial.SerialException):
+            DeviceController("COM1", circuit_breaker=breaker)
+        with pytest.raises(CircuitOpenError):
+            DeviceController("COM1", circuit_breaker=breaker)
+        assert mock_serial.call_count == 1
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_websocket_client_open(self, mock_create_connection):
+        """
+        Тест учёта ошибок create_connection
+        """
+        mock_create_connection.side_effect = ConnectionRefusedError()
+        breaker = CircuitBreaker("ws", failure_threshold=2)
+
+        for _ in range(2):
+            with pytest.raises(ConnectionRefusedError):
+                WebsocketClient(circuit_breaker=breaker)
+        with pytest.raises(CircuitOpenError):
+            WebsocketClient(circuit_breaker=breaker)
+        assert mock_create_connection.call_count == 2
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_websocket_client_timeouts(self, mock_create_connection):
+        """
+        Тест размыкания по таймаутам ответов
+        """
+        mock_ws = Mock()
+        mock_ws.recv.side_effect = websocket.WebSocketTimeoutException()
+        mock_create_connection.return_value = mock_ws
+        breaker = CircuitBreaker("ws", failure_threshold=1)
+        client = WebsocketClient(circuit_breaker=breaker)
+        client.open()
+
+        with pytest.raises(websocket.WebSocketTimeoutException):
+            client.send_command('GET_V')
+        sent = mock_ws.send.call_count
+        with pytest.raises(CircuitOpenError):
+            client.send_command('GET_V')
+        assert mock_ws.send.call_count == sent
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires pty")
+class TestDevicePoolEmulator:
+    """
+    Тесты автоматов защиты пула на эмуляторе
+    """
+
+    def test_quarantine_and_recovery(self):
+        """
+        Тест пропуска неотвечающего устройства и возврата после пробы
+        """
+        with SerialEmulator(drop_rate=1.0) as emulator, \
+                DevicePool([emulator.port], timeout=0.1,
+                           failure_threshold=2,
+                           recovery_timeout=0.2) as pool:
+            for _ in range(2):
+                result = pool.poll()[emulator.port]
+                assert isinstance(result.error,
+                                  serial.SerialTimeoutException)
+
+            started = time.perf_counter()
+            result = pool.poll()[emulator.port]
+            assert isinstance(result.error, CircuitOpenError)
+            assert time.perf_counter() - started < 0.1
+            assert pool.circuit_states()[emulator.port]["state"] == OPEN
+
+            emulator.drop_rate = 0.0
+            time.sleep(0.2)
+            requests = emulator.requests
+            result = pool.poll()[emulator.port]
+
+            assert result.error is None
+            assert result.values["SERIAL"] == "S_ABC123"
+            # Пробная команда и затем полный опрос
+            assert emulator.requests - requests == 4
+            assert pool.circuit_states()[emulator.port]["state"] == CLOSED
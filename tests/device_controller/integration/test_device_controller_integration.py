@@ -13,9 +13,11 @@
 # ============================================================================
 # Импорт модулей и глобальных переменных
 # ============================================================================
+import sys
 import pytest
 from unittest.mock import Mock, patch
 from src.device_controller import DeviceController
+from src.emulator import SerialEmulator
 
 
 # ============================================================================
@@ -44,7 +46,7 @@ class TestDeviceControllerIntegration:
 
         device = DeviceController(SERIAL_PORT)
 
-        mock_serial.assert_called_once_with(SERIAL_PORT,
+        mock_serial.assert_called_once_with(port=SERIAL_PORT,
                                             baudrate=BAUDRATE,
                                             timeout=TIMEOUT)
         assert device.serial_connection.is_open
@@ -57,16 +59,17 @@ class TestDeviceControllerIntegration:
         mock_serial_instance = Mock()
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
-        mock_serial_instance.readline.return_value = f"{RESULT_GET_V}\r\n"
+        mock_serial_instance.read.return_value = (
+            f"{RESULT_GET_V}\r\n".encode())
 
         device = DeviceController(SERIAL_PORT)
         result = device.get_voltage()
 
-        mock_serial.assert_called_once_with(SERIAL_PORT,
+        mock_serial.assert_called_once_with(port=SERIAL_PORT,
                                             baudrate=BAUDRATE,
                                             timeout=TIMEOUT)
         mock_serial_instance.write.assert_called_once_with(b"GET_V\r\n")
-        mock_serial_instance.readline.assert_called_once()
+        mock_serial_instance.read.assert_called_once()
 
         assert result == RESULT_GET_V
 
@@ -78,16 +81,17 @@ class TestDeviceControllerIntegration:
         mock_serial_instance = Mock()
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
-        mock_serial_instance.readline.return_value = f"{RESULT_GET_A}\r\n"
+        mock_serial_instance.read.return_value = (
+            f"{RESULT_GET_A}\r\n".encode())
 
         device = DeviceController(SERIAL_PORT)
         result = device.get_ampere()
 
-        mock_serial.assert_called_once_with(SERIAL_PORT,
+        mock_serial.assert_called_once_with(port=SERIAL_PORT,
                                             baudrate=BAUDRATE,
                                             timeout=TIMEOUT)
         mock_serial_instance.write.assert_called_once_with(b"GET_A\r\n")
-        mock_serial_instance.readline.assert_called_once()
+        mock_serial_instance.read.assert_called_once()
 
         assert result == RESULT_GET_A
 
@@ -99,16 +103,17 @@ class TestDeviceControllerIntegration:
         mock_serial_instance = Mock()
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
-        mock_serial_instance.readline.return_value = f"{RESULT_GET_S}\r\n"
+        mock_serial_instance.read.return_value = (
+            f"{RESULT_GET_S}\r\n".encode())
 
         device = DeviceController(SERIAL_PORT)
         result = device.get_serial()
 
-        mock_serial.assert_called_once_with(SERIAL_PORT,
+        mock_serial.assert_called_once_with(port=SERIAL_PORT,
                                             baudrate=BAUDRATE,
                                             timeout=TIMEOUT)
         mock_serial_instance.write.assert_called_once_with(b"GET_S\r\n")
-        mock_serial_instance.readline.assert_called_once()
+        mock_serial_instance.read.assert_called_once()
 
         assert result == RESULT_GET_S
 
@@ -121,10 +126,10 @@ class TestDeviceControllerIntegration:
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
 
-        mock_serial_instance.readline.side_effect = [
-            f"{RESULT_GET_V}\r\n",
-            f"{RESULT_GET_A}\r\n",
-            f"{RESULT_GET_S}\r\n"
+        mock_serial_instance.read.side_effect = [
+            f"{RESULT_GET_V}\r\n".encode(),
+            f"{RESULT_GET_A}\r\n".encode(),
+            f"{RESULT_GET_S}\r\n".encode()
         ]
 
         device = DeviceController(SERIAL_PORT)
@@ -150,7 +155,7 @@ class TestDeviceControllerIntegration:
         mock_serial_instance = Mock()
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
-        mock_serial_instance.readline.return_value = b"INVALID_RESPONSE\r\n"
+        mock_serial_instance.read.return_value = b"INVALID_RESPONSE\r\n"
 
         device = DeviceController(SERIAL_PORT)
 
@@ -159,4 +164,41 @@ class TestDeviceControllerIntegration:
             device.get_voltage()
 
         mock_serial_instance.write.assert_called_once_with(b"GET_V\r\n")
-        mock_serial_instance.readline.assert_called_once()
+        mock_serial_instance.read.assert_called_once()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires pty")
+class TestDeviceControllerEmulator:
+    """
+    Интеграционные тесты DeviceController с эмулятором устройства
+    на псевдотерминале
+    """
+
+    def test_commands_over_pty(self):
+        """
+        Тест команд через настоящий serial-порт эмулятора
+        """
+        with SerialEmulator(baudrate=BAUDRATE) as emulator, \
+                DeviceController(emulator.port, BAUDRATE, TIMEOUT) as device:
+            assert device.get_voltage() == RESULT_GET_V
+            assert device.get_ampere() == RESULT_GET_A
+            assert device.get_serial() == RESULT_GET_S
+            assert device.get_batch(['VOLTAGE', 'AMPERE']) == \
+                {'VOLTAGE': RESULT_GET_V, 'AMPERE': RESULT_GET_A}
+
+        assert emulator.requests == 5
+
+    def test_timeout_and_malformed_replies(self):
+        """
+        Тест потерянного и искажённого ответа
+        """
+        with SerialEmulator(drop_rate=1.0) as emulator, \
+                DeviceController(emulator.port, timeout=0.1) as device:
+            with pytest.raises(Exception, match="Read timeout occurred"):
+                device.get_voltage()
+
+        with SerialEmulator(malformed_rate=1.0, seed=1) as emulator, \
+                DeviceController(emulator.port, timeout=0.5) as device:
+            with pytest.raises(ValueError,
+                               match="Invalid voltage response format"):
+                device.get_voltage()
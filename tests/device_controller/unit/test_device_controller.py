@@ -13,6 +13,8 @@
 # ============================================================================
 # Импорт модулей и глобальных переменных
 # ============================================================================
+import threading
+import time
 import pytest
 from unittest.mock import Mock, patch
 from src.device_controller import DeviceController
@@ -38,7 +40,7 @@ class TestDeviceController:
             mock_serial_instance = Mock()
             mock_serial.return_value = mock_serial_instance
             mock_serial_instance.is_open = True
-            mock_serial_instance.readline.return_value = response
+            mock_serial_instance.read.return_value = response
 
             device = DeviceController("COM1")
 
@@ -68,7 +70,7 @@ class TestDeviceController:
             mock_serial_instance = Mock()
             mock_serial.return_value = mock_serial_instance
             mock_serial_instance.is_open = True
-            mock_serial_instance.readline.return_value = response
+            mock_serial_instance.read.return_value = response
 
             device = DeviceController("COM1")
 
@@ -100,7 +102,7 @@ class TestDeviceController:
             mock_serial_instance = Mock()
             mock_serial.return_value = mock_serial_instance
             mock_serial_instance.is_open = True
-            mock_serial_instance.readline.return_value = response
+            mock_serial_instance.read.return_value = response
 
             device = DeviceController("COM1")
 
@@ -119,7 +121,7 @@ class TestDeviceController:
         mock_serial_instance = Mock()
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
-        mock_serial_instance.readline.return_value = b"TEST_RESPONSE\n"
+        mock_serial_instance.read.return_value = b"TEST_RESPONSE\n"
 
         device = DeviceController("COM1")
         with pytest.raises(ValueError) as exc_info:
@@ -139,7 +141,7 @@ TEST_CMD. Valid commands are: ['GET_V', 'GET_A', 'GET_S']"
         mock_serial_instance = Mock()
         mock_serial.return_value = mock_serial_instance
         mock_serial_instance.is_open = True
-        mock_serial_instance.readline.return_value = b"  RESPONSE  \r\n"
+        mock_serial_instance.read.return_value = b"  RESPONSE  \r\n"
 
         device = DeviceController("COM1")
         with pytest.raises(ValueError) as exc_info:
@@ -169,3 +171,229 @@ CMD. Valid commands are: ['GET_V', 'GET_A', 'GET_S']"
         with pytest.raises(RuntimeError,
                            match="Serial connection is not open"):
             device.send_command("TEST_CMD")
+
+    @patch('serial.Serial')
+    def test_get_batch_single_write(self, mock_serial):
+        """
+        Тест пакетного запроса: одна запись, ответы по порядку
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.side_effect = [
+            b"V_12V\r\n",
+            b"A_1A\r\n",
+            b"S_DSA123\r\n"
+        ]
+
+        device = DeviceController("COM1")
+        result = device.get_batch(['VOLTAGE', 'AMPERE', 'SERIAL'])
+
+        mock_serial_instance.write.assert_called_once_with(
+            b"GET_V\r\nGET_A\r\nGET_S\r\n")
+        assert result == {
+            'VOLTAGE': "V_12V",
+            'AMPERE': "A_1A",
+            'SERIAL': "S_DSA123"
+        }
+
+    @patch('serial.Serial')
+    def test_get_batch_invalid_response(self, mock_serial):
+        """
+        Тест пакетного запроса с некорректным ответом
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.side_effect = [
+            b"V_12V\r\n",
+            b"A_1.5A\r\n"
+        ]
+
+        device = DeviceController("COM1")
+
+        with pytest.raises(ValueError,
+                           match="Invalid ampere response format"):
+            device.get_batch(['VOLTAGE', 'AMPERE'])
+
+    @patch('serial.Serial')
+    def test_get_batch_invalid_type(self, mock_serial):
+        """
+        Тест пакетного запроса с неизвестным типом ответа
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+
+        device = DeviceController("COM1")
+
+        with pytest.raises(ValueError, match="Invalid response type: TEMP"):
+            device.get_batch(['VOLTAGE', 'TEMP'])
+
+        mock_serial_instance.write.assert_not_called()
+
+    @patch('serial.Serial')
+    def test_measure(self, mock_serial):
+        """
+        Тест получения измерений в виде Measurement
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"V_12V\r\nA_3A\r\n"
+
+        device = DeviceController("COM1")
+        result = device.measure(['VOLTAGE', 'AMPERE'])
+
+        mock_serial_instance.write.assert_called_once_with(
+            b"GET_V\r\nGET_A\r\n")
+        assert (result['VOLTAGE'].value, result['VOLTAGE'].unit) == (12, "V")
+        assert (result['AMPERE'].value, result['AMPERE'].unit) == (3, "A")
+        assert result['VOLTAGE'].device_id == "COM1"
+        assert result['VOLTAGE'].timestamp == result['AMPERE'].timestamp
+
+    @patch('serial.Serial')
+    def test_measure_invalid(self, mock_serial):
+        """
+        Тест ошибок получения измерений
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"V_12.5V\r\n"
+
+        device = DeviceController("COM1")
+
+        with pytest.raises(ValueError,
+                           match="Invalid voltage response format: V_12.5V"):
+            device.measure_voltage()
+
+        with pytest.raises(ValueError,
+                           match="Invalid measurement type: SERIAL"):
+            device.measure(['SERIAL'])
+
+    @patch('serial.Serial')
+    def test_serial_number_cached(self, mock_serial):
+        """
+        Тест кэширования серийного номера в пределах соединения
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"S_DSA123\r\n"
+
+        device = DeviceController("COM1")
+
+        assert device.get_serial() == "S_DSA123"
+        assert device.get_serial() == "S_DSA123"
+        mock_serial_instance.write.assert_called_once_with(b"GET_S\r\n")
+
+        mock_serial_instance.read.return_value = b"V_12V\r\nA_1A\r\n"
+        result = device.get_batch(['VOLTAGE', 'SERIAL', 'AMPERE'])
+
+        mock_serial_instance.write.assert_called_with(b"GET_V\r\nGET_A\r\n")
+        assert list(result.items()) == [('VOLTAGE', "V_12V"),
+                                        ('SERIAL', "S_DSA123"),
+                                        ('AMPERE', "A_1A")]
+
+    @patch('serial.Serial')
+    def test_serial_number_cache_invalidation(self, mock_serial):
+        """
+        Тест сброса кэша при переподключении и при чужом ответе
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"S_DSA123\r\n"
+
+        device = DeviceController("COM1")
+        device.get_serial()
+        device.open_connection()
+        device.get_serial()
+
+        assert mock_serial_instance.write.call_count == 2
+
+        mock_serial_instance.read.return_value = b"X_12\r\n"
+        with pytest.raises(ValueError):
+            device.get_voltage()
+
+        mock_serial_instance.read.return_value = b"S_XYZ789\r\n"
+        assert device.get_serial() == "S_XYZ789"
+
+    @patch('serial.Serial')
+    def test_concurrent_send_command(self, mock_serial):
+        """
+        Тест отсутствия чередования обменов из разных потоков
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        events = []
+
+        def write(data):
+            events.append("write")
+            time.sleep(0.001)
+
+        def read(size):
+            events.append("read")
+            return b"V_12V\r\n"
+
+        mock_serial_instance.write.side_effect = write
+        mock_serial_instance.read.side_effect = read
+
+        device = DeviceController("COM1")
+        threads = [threading.Thread(
+            target=lambda: [device.get_voltage() for _ in range(20)])
+            for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert events == ["write", "read"] * 80
+
+    @patch('serial.Serial')
+    def test_request_frames_are_precomputed(self, mock_serial):
+        """
+        Тест отправки заранее закодированных кадров запросов
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"V_12V\r\n"
+
+        device = DeviceController("COM1")
+        device.get_voltage()
+
+        frame = mock_serial_instance.write.call_args[0][0]
+        assert frame is DeviceController.REQUEST_FRAMES['GET_V']
+        assert frame == b"GET_V\r\n"
+
+    @patch('serial.Serial')
+    def test_validate_response_bytes(self, mock_serial):
+        """
+        Тест проверки ответа в bytes и в str по одним правилам
+        """
+        mock_serial.return_value = Mock(is_open=True)
+        device = DeviceController("COM1")
+
+        for response, valid in [("V_12V", True), ("V_12.5V", False),
+                                ("A_1A", False), ("V_١V", False)]:
+            assert device.validate_response(
+                'VOLTAGE', response.encode()) is valid
+        assert device.validate_response('SERIAL', b"S_DSA123")
+        assert not device.validate_response('UNKNOWN', b"V_12V")
+
+    @patch('serial.Serial')
+    def test_invalid_utf8_response(self, mock_serial):
+        """
+        Тест ответа, не являющегося корректным UTF-8
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"V_\xff12V\r\n"
+
+        device = DeviceController("COM1")
+        with pytest.raises(ValueError, match="Invalid voltage response"):
+            device.get_voltage()
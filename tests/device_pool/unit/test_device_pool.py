@@ -0,0 +1,107 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_device_pool.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Мок тесты для device_pool.py
+# Примечание: Используется unittest.mock для эмуляции поведения serial.Serial
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import time
+import serial
+from unittest.mock import Mock, patch
+from src.device_pool import DevicePool
+
+
+def make_port(response=b"V_12V\r\nA_1A\r\nS_DSA123\r\n", delay=0.0):
+    """
+    Создаёт мок serial-порта, отвечающий одним блоком с задержкой.
+    """
+    def read(size):
+        time.sleep(delay)
+        return response
+
+    mock_serial_instance = Mock()
+    mock_serial_instance.is_open = True
+    mock_serial_instance.read.side_effect = read
+    return mock_serial_instance
+
+
+class TestDevicePool:
+    """
+    Тесты для класса DevicePool
+    """
+    @patch('serial.Serial')
+    def test_poll_aggregates_results(self, mock_serial):
+        """
+        Тест сбора результатов всех устройств за цикл
+        """
+        ports = {
+            "/dev/ttyUSB0": make_port(),
+            "/dev/ttyUSB1": make_port(b"V_1.5V\r\nA_1A\r\nS_DSA123\r\n"),
+            "/dev/ttyUSB2": make_port(b""),
+        }
+
+        def open_port(port, **kwargs):
+            if port not in ports:
+                raise serial.SerialException("no such device")
+            return ports[port]
+
+        mock_serial.side_effect = open_port
+
+        with DevicePool(list(ports) + ["/dev/ttyUSB3"]) as pool:
+            results = pool.poll()
+
+        assert list(results) == list(ports) + ["/dev/ttyUSB3"]
+        assert results["/dev/ttyUSB0"].values == {
+            'VOLTAGE': "V_12V",
+            'AMPERE': "A_1A",
+            'SERIAL': "S_DSA123"
+        }
+        assert results["/dev/ttyUSB0"].error is None
+        assert isinstance(results["/dev/ttyUSB1"].error, ValueError)
+        assert isinstance(results["/dev/ttyUSB2"].error,
+                          serial.SerialTimeoutException)
+        assert isinstance(results["/dev/ttyUSB3"].error,
+                          serial.SerialException)
+        assert results["/dev/ttyUSB3"].values is None
+
+    @patch('serial.Serial')
+    def test_poll_is_concurrent(self, mock_serial):
+        """
+        Тест параллельного опроса: длительность цикла не равна сумме
+        задержек всех устройств
+        """
+        mock_serial.side_effect = lambda port, **kwargs: make_port(
+            b"V_12V\r\nA_1A\r\n", delay=0.2)
+
+        ports = [f"/dev/ttyUSB{i}" for i in range(10)]
+        with DevicePool(ports, max_workers=10) as pool:
+            started = time.monotonic()
+            results = pool.poll(['VOLTAGE', 'AMPERE'])
+            elapsed = time.monotonic() - started
+
+        assert all(result.error is None for result in results.values())
+        assert elapsed < 1.0
+
+    @patch('serial.Serial')
+    def test_failed_port_reopened_next_cycle(self, mock_serial):
+        """
+        Тест повторного открытия порта после ошибки открытия
+        """
+        mock_serial.side_effect = [serial.SerialException("busy"),
+                                   make_port()]
+
+        with DevicePool(["COM1"]) as pool:
+            first = pool.poll()
+            second = pool.poll()
+
+        assert first["COM1"].error is not None
+        assert second["COM1"].error is None
+        assert mock_serial.call_count == 2
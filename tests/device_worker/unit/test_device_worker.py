@@ -0,0 +1,136 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_device_worker.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Мок тесты для device_worker.py
+# Примечание: Используется unittest.mock для эмуляции поведения serial.Serial
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import threading
+import time
+import pytest
+import serial
+from unittest.mock import Mock, patch
+from src.device_controller import DeviceController
+from src.device_worker import DeviceWorker
+
+ANSWERS = {b"GET_V": b"V_12V\r\n", b"GET_A": b"A_1A\r\n",
+           b"GET_S": b"S_DSA123\r\n"}
+
+
+def make_port(gate=None):
+    """
+    Создаёт мок порта, отвечающий на записанные команды. Если задан
+    gate, ответ выдаётся только после его открытия.
+    """
+    mock_serial_instance = Mock()
+    mock_serial_instance.is_open = True
+    written = []
+
+    def write(data):
+        written.append(data)
+        answer = b"".join(ANSWERS[line] for line in data.split(b"\r\n")
+                          if line)
+        mock_serial_instance.read.return_value = answer
+
+    def read(size):
+        if gate is not None:
+            gate.wait()
+        return mock_serial_instance.read.return_value
+
+    mock_serial_instance.write.side_effect = write
+    mock_serial_instance.read.side_effect = read
+    mock_serial_instance.read.return_value = b""
+    mock_serial_instance.written = written
+    return mock_serial_instance
+
+
+class TestDeviceWorker:
+    """
+    Тесты для класса DeviceWorker
+    """
+    @patch('serial.Serial')
+    def test_get_values(self, mock_serial):
+        """
+        Тест получения величин через поток ввода-вывода
+        """
+        mock_serial.return_value = make_port()
+
+        with DeviceWorker(DeviceController("COM1")) as worker:
+            assert worker.get_voltage() == "V_12V"
+            assert worker.get_ampere() == "A_1A"
+            assert worker.get_serial() == "S_DSA123"
+            assert worker.get_serial() == "S_DSA123"
+
+        assert len(mock_serial.return_value.written) == 3
+
+    @patch('serial.Serial')
+    def test_identical_requests_coalesced(self, mock_serial):
+        """
+        Тест объединения одновременных одинаковых запросов
+        """
+        gate = threading.Event()
+        port = make_port(gate)
+        mock_serial.return_value = port
+        results = []
+
+        with DeviceWorker(DeviceController("COM1")) as worker:
+            threads = [threading.Thread(
+                target=lambda: results.append(worker.get_voltage()))
+                for _ in range(10)]
+            for thread in threads:
+                thread.start()
+            time.sleep(0.05)
+            gate.set()
+            for thread in threads:
+                thread.join()
+
+        assert results == ["V_12V"] * 10
+        assert port.written == [b"GET_V\r\n"]
+
+    @patch('serial.Serial')
+    def test_queued_commands_batched(self, mock_serial):
+        """
+        Тест отправки накопившихся разных команд одним пакетом
+        """
+        gate = threading.Event()
+        port = make_port(gate)
+        mock_serial.return_value = port
+
+        with DeviceWorker(DeviceController("COM1")) as worker:
+            first = worker.submit("GET_S")
+            time.sleep(0.05)
+            voltage = worker.submit("GET_V")
+            ampere = worker.submit("GET_A")
+            gate.set()
+
+            assert first.result(1) == "S_DSA123"
+            assert voltage.result(1) == "V_12V"
+            assert ampere.result(1) == "A_1A"
+
+        assert port.written == [b"GET_S\r\n", b"GET_V\r\nGET_A\r\n"]
+
+    @patch('serial.Serial')
+    def test_errors_delivered_to_futures(self, mock_serial):
+        """
+        Тест передачи ошибки обмена всем ожидающим
+        """
+        port = make_port()
+        port.read.side_effect = lambda size: b""
+        mock_serial.return_value = port
+
+        with DeviceWorker(DeviceController("COM1", timeout=0.01)) as worker:
+            with pytest.raises(serial.SerialTimeoutException):
+                worker.get_voltage()
+            with pytest.raises(ValueError, match="Invalid command"):
+                worker.submit("GET_X")
+
+        with pytest.raises(RuntimeError, match="Device worker is closed"):
+            worker.submit("GET_V")
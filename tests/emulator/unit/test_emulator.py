@@ -0,0 +1,170 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_emulator.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для emulator.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import sys
+import time
+import pytest
+import websocket
+from src.device_controller import DeviceController
+from src.emulator import (RESPONSES, DeviceEmulator, SerialEmulator,
+                          WebsocketEmulator)
+from src.websocket_client import WebsocketClient
+
+
+class TestDeviceEmulator:
+    """
+    Тесты общей логики эмулятора
+    """
+
+    def test_respond(self):
+        """
+        Тест ответов на команды
+        """
+        emulator = DeviceEmulator()
+
+        assert [emulator.respond(cmd) for cmd in RESPONSES] == \
+            list(RESPONSES.values())
+        assert emulator.respond("GET_X") == "ERROR"
+        assert emulator.requests == 4
+
+    def test_drop_and_malformed_rates(self):
+        """
+        Тест доли потерянных и искажённых ответов
+        """
+        emulator = DeviceEmulator(drop_rate=0.25, malformed_rate=0.5, seed=7)
+        responses = [emulator.respond("GET_V") for _ in range(2000)]
+
+        assert responses.count(None) == emulator.dropped
+        assert 400 < emulator.dropped < 600
+        assert 0.4 < emulator.malformed / (2000 - emulator.dropped) < 0.6
+        assert all(DeviceController.RESPONSE_PATTERNS['VOLTAGE'].match(r)
+                   is None for r in responses
+                   if r is not None and r != "V_12V")
+
+    def test_malformed_responses_fail_validation(self):
+        """
+        Тест: каждый искажённый ответ не проходит проверку формата
+        """
+        emulator = DeviceEmulator(malformed_rate=1.0, seed=3)
+        for response_type, cmd in DeviceController.COMMANDS.items():
+            pattern = DeviceController.RESPONSE_PATTERNS[response_type]
+            responses = {emulator.respond(cmd) for _ in range(200)}
+
+            assert len(responses) == 4
+            assert all(pattern.match(r) is None for r in responses)
+        assert emulator.malformed == 600
+
+    def test_delay(self):
+        """
+        Тест задержки с разбросом
+        """
+        emulator = DeviceEmulator(latency=0.01, jitter=0.005, seed=1)
+        delays = [emulator.delay() for _ in range(100)]
+
+        assert all(0.01 <= delay <= 0.015 for delay in delays)
+        assert len(set(delays)) > 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires pty")
+class TestSerialEmulator:
+    """
+    Тесты serial-эмулятора
+    """
+
+    def test_baud_throttling(self):
+        """
+        Тест ограничения скорости передачи ответа
+        """
+        with SerialEmulator(baudrate=1200) as emulator, \
+                DeviceController(emulator.port, timeout=1.0) as device:
+            started = time.monotonic()
+            assert device.get_serial() == "S_ABC123"
+            elapsed = time.monotonic() - started
+
+        # 10 байт ответа по 10 бит при 1200 бод
+        assert elapsed >= 10 * 10 / 1200
+
+    def test_latency(self):
+        """
+        Тест задержки ответа
+        """
+        with SerialEmulator(latency=0.05) as emulator, \
+                DeviceController(emulator.port, timeout=1.0) as device:
+            started = time.monotonic()
+            device.get_batch(['VOLTAGE', 'AMPERE'])
+            elapsed = time.monotonic() - started
+
+        assert elapsed >= 0.1
+
+
+class TestWebsocketEmulator:
+    """
+    Тесты WebSocket-эмулятора
+    """
+
+    def test_request_ids_and_batch(self):
+        """
+        Тест возврата id и пакетных запросов
+        """
+        with WebsocketEmulator() as emulator, \
+                WebsocketClient(emulator.url, request_ids=True) as client:
+            responses = client.send_commands(["GET_V", "GET_V"])
+            values = client.get_batch(['VOLTAGE', 'AMPERE', 'SERIAL'])
+
+        assert [response["id"] for response in responses] == [1, 2]
+        assert values == {'VOLTAGE': "V_12V", 'AMPERE': "A_5A",
+                          'SERIAL': "S_ABC123"}
+        assert emulator.connections == 1
+
+    def test_batch_disabled(self):
+        """
+        Тест перехода клиента на одиночные команды
+        """
+        with WebsocketEmulator(batch=False) as emulator, \
+                WebsocketClient(emulator.url) as client:
+            assert client.get_batch(['VOLTAGE', 'AMPERE']) == \
+                {'VOLTAGE': "V_12V", 'AMPERE': "A_5A"}
+            assert client._batch_supported is False
+
+    def test_dropped_reply_times_out(self):
+        """
+        Тест потерянного ответа
+        """
+        with WebsocketEmulator(drop_rate=1.0) as emulator, \
+                WebsocketClient(emulator.url, timeout=0.1) as client:
+            with pytest.raises(websocket.WebSocketTimeoutException):
+                client.get_voltage()
+
+    def test_stop_closes_open_connections(self):
+        """
+        Тест остановки с открытыми соединениями, в том числе во время
+        задержки ответа
+        """
+        emulator = WebsocketEmulator(latency=0.2).start()
+        idle = WebsocketClient(emulator.url)
+        busy = WebsocketClient(emulator.url)
+        busy.submit("GET_V")
+        time.sleep(0.05)
+
+        emulator.stop()
+
+        assert not emulator._clients
+        # Сервер прислал кадр закрытия
+        try:
+            message = idle.ws.recv()
+        except websocket.WebSocketException:
+            message = None
+        assert not message
+        idle.close()
+        busy.close()
@@ -0,0 +1,359 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_gateway.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для gateway.py
+# Примечание: Шлюз запускается в отдельном потоке, клиенты - настоящие
+#             WebsocketClient
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import struct
+import threading
+import time
+import pytest
+import websocket
+from src import json_codec, ws_protocol
+from src.gateway import Gateway
+from src.websocket_client import WebsocketClient
+
+
+class FakeDevice:
+    """
+    Устройство с интерфейсом send_commands, записывающее обмены.
+    Пока gate не открыт, обмены блокируются.
+    """
+
+    COMMANDS = {'VOLTAGE': "GET_V", 'AMPERE': "GET_A", 'SERIAL': "GET_S"}
+    PAYLOADS = {"GET_V": "V_12V", "GET_A": "A_1A", "GET_S": "S_DSA123"}
+
+    def __init__(self):
+        self.calls = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.started = threading.Event()
+        self.error = None
+        self.rejected = set()
+        self.replies = dict(self.PAYLOADS)
+        self.closed = False
+
+    def is_valid_command(self, command):
+        return command in self.PAYLOADS
+
+    def validate_response(self, response_type, response):
+        return response == self.PAYLOADS[self.COMMANDS[response_type]]
+
+    def send_commands(self, commands):
+        self.calls.append(list(commands))
+        self.started.set()
+        self.gate.wait(5)
+        if self.error is not None:
+            raise self.error
+        for command in commands:
+            if command in self.rejected:
+                raise ValueError(f"Invalid command: {command}")
+        return [self.replies[command] for command in commands]
+
+    def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def gateway_factory():
+    """
+    Запускает шлюз в отдельном потоке. Возвращает функцию,
+    создающую шлюз и возвращающую его URL.
+    """
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    gateways = []
+
+    def start(backends, cache_ttl=0.2):
+        gateway = Gateway(backends, port=0, cache_ttl=cache_ttl)
+        asyncio.run_coroutine_threadsafe(gateway.start(), loop).result(5)
+        gateways.append(gateway)
+        return f"ws://127.0.0.1:{gateway.port}"
+
+    yield start
+
+    for gateway in gateways:
+        asyncio.run_coroutine_threadsafe(gateway.close(), loop).result(5)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+
+class TestGateway:
+    """
+    Тесты шлюза
+    """
+
+    def test_websocket_client_through_gateway(self, gateway_factory):
+        """
+        Тест запросов WebsocketClient через шлюз
+        """
+        url = gateway_factory({"dev0": FakeDevice()})
+
+        with WebsocketClient(url + "/dev0") as client:
+            assert client.get_voltage() == "V_12V"
+            assert client.get_ampere() == "A_1A"
+            assert client.get_serial() == "S_DSA123"
+
+    def test_single_backend_on_root_path(self, gateway_factory):
+        """
+        Тест доступа к единственному устройству по корневому пути
+        """
+        url = gateway_factory({"dev0": FakeDevice()})
+
+        with WebsocketClient(url) as client:
+            assert client.get_voltage() == "V_12V"
+
+    def test_request_ids_are_echoed(self, gateway_factory):
+        """
+        Тест возврата id запроса в ответе
+        """
+        url = gateway_factory({"dev0": FakeDevice()})
+
+        with WebsocketClient(url, request_ids=True) as client:
+            responses = client.send_commands(["GET_V", "GET_A"])
+
+        assert [response["id"] for response in responses] == [1, 2]
+        assert [response["payload"] for response in responses] == \
+            ["V_12V", "A_1A"]
+
+    def test_concurrent_clients_share_exchange(self, gateway_factory):
+        """
+        Тест объединения одинаковых запросов разных клиентов
+        """
+        device = FakeDevice()
+        url = gateway_factory({"dev0": device}, cache_ttl=0)
+        clients = [WebsocketClient(url) for _ in range(8)]
+        results = []
+
+        device.gate.clear()
+        threads = [threading.Thread(
+            target=lambda c=client: results.append(c.get_voltage()))
+            for client in clients]
+        for thread in threads:
+            thread.start()
+        assert device.started.wait(5)
+        time.sleep(0.2)
+        device.gate.set()
+        for thread in threads:
+            thread.join()
+        for client in clients:
+            client.close()
+
+        assert results == ["V_12V"] * 8
+        assert len(device.calls) <= 2
+        assert all(call == ["GET_V"] for call in device.calls)
+
+    def test_waiting_requests_are_batched(self, gateway_factory):
+        """
+        Тест отправки накопившихся запросов одним пакетом
+        """
+        device = FakeDevice()
+        url = gateway_factory({"dev0": device}, cache_ttl=0)
+
+        with WebsocketClient(url) as first, WebsocketClient(url) as second:
+            device.gate.clear()
+            thread = threading.Thread(target=first.get_serial)
+            thread.start()
+            assert device.started.wait(5)
+            batch = threading.Thread(
+                target=second.send_commands, args=(["GET_V", "GET_A"],))
+            batch.start()
+            time.sleep(0.2)
+            device.gate.set()
+            thread.join()
+            batch.join()
+
+        assert device.calls[0] == ["GET_S"]
+        assert sorted(device.calls[1]) == ["GET_A", "GET_V"]
+
+    def test_batch_request(self, gateway_factory):
+        """
+        Тест пакетного запроса через шлюз
+        """
+        device = FakeDevice()
+        url = gateway_factory({"dev0": device})
+
+        with WebsocketClient(url) as client:
+            values = client.get_batch(['VOLTAGE', 'AMPERE', 'SERIAL'])
+            assert client._batch_supported is True
+
+        assert values == {'VOLTAGE': "V_12V", 'AMPERE': "A_1A",
+                          'SERIAL': "S_DSA123"}
+        assert len(device.calls) == 1
+        assert sorted(device.calls[0]) == ["GET_A", "GET_S", "GET_V"]
+
+    def test_cache_ttl(self, gateway_factory):
+        """
+        Тест ответа из кэша в пределах cache_ttl
+        """
+        device = FakeDevice()
+        url = gateway_factory({"dev0": device}, cache_ttl=0.2)
+
+        with WebsocketClient(url) as client:
+            assert client.get_voltage() == "V_12V"
+            assert client.get_voltage() == "V_12V"
+            assert len(device.calls) == 1
+            time.sleep(0.25)
+            assert client.get_voltage() == "V_12V"
+            assert len(device.calls) == 2
+
+    def test_backend_error_is_reported(self, gateway_factory):
+        """
+        Тест передачи ошибки устройства клиенту
+        """
+        device = FakeDevice()
+        device.error = TimeoutError("Read timeout occurred")
+        url = gateway_factory({"dev0": device})
+
+        with WebsocketClient(url) as client:
+            response = client.send_command("GET_V")
+            with pytest.raises(ValueError, match="Invalid voltage"):
+                client.get_voltage()
+
+        assert response == {"cmd": "GET_V",
+                            "error": "TimeoutError: Read timeout occurred"}
+
+    def test_invalid_response_is_not_cached(self, gateway_factory):
+        """
+        Тест: ответ, не прошедший проверку, не кэшируется и не
+        достаётся как payload
+        """
+        device = FakeDevice()
+        device.replies["GET_V"] = "ERROR"
+        url = gateway_factory({"dev0": device}, cache_ttl=10)
+
+        with WebsocketClient(url) as client:
+            response = client.send_command("GET_V")
+            device.replies["GET_V"] = "V_12V"
+            assert client.get_voltage() == "V_12V"
+            assert client.get_voltage() == "V_12V"
+
+        assert response == {
+            "cmd": "GET_V",
+            "error": "ValueError: Invalid voltage response format: ERROR"}
+        assert len(device.calls) == 2
+
+    def test_invalid_command_does_not_fail_others(self, gateway_factory):
+        """
+        Тест: неверная команда одного клиента не попадает в пакет и
+        не влияет на ответы другим клиентам
+        """
+        device = FakeDevice()
+        url = gateway_factory({"dev0": device}, cache_ttl=0)
+        raw = websocket.create_connection(url, timeout=5)
+
+        with WebsocketClient(url) as first, WebsocketClient(url) as second:
+            device.gate.clear()
+            thread = threading.Thread(target=first.get_serial)
+            thread.start()
+            assert device.started.wait(5)
+            results = []
+            valid = threading.Thread(
+                target=lambda: results.append(second.get_voltage()))
+            valid.start()
+            raw.send(json_codec.dumps({"cmd": "BOGUS"}))
+            time.sleep(0.2)
+            device.gate.set()
+            thread.join()
+            valid.join()
+            response = json_codec.loads(raw.recv())
+        raw.close()
+
+        assert response == {"cmd": "BOGUS", "error": "Invalid command: BOGUS"}
+        assert results == ["V_12V"]
+        assert all("BOGUS" not in call for call in device.calls)
+
+    def test_rejected_batch_is_split(self, gateway_factory):
+        """
+        Тест повторения отклонённого пакета по одной команде
+        """
+        device = FakeDevice()
+        device.rejected = {"GET_A"}
+        url = gateway_factory({"dev0": device}, cache_ttl=0)
+
+        with WebsocketClient(url) as first, WebsocketClient(url) as second, \
+                WebsocketClient(url) as third:
+            device.gate.clear()
+            thread = threading.Thread(target=first.get_serial)
+            thread.start()
+            assert device.started.wait(5)
+            results = {}
+            clients = [
+                threading.Thread(target=lambda: results.update(
+                    voltage=second.send_command("GET_V"))),
+                threading.Thread(target=lambda: results.update(
+                    ampere=third.send_command("GET_A")))
+            ]
+            for client in clients:
+                client.start()
+            time.sleep(0.2)
+            device.gate.set()
+            thread.join()
+            for client in clients:
+                client.join()
+
+        assert results["voltage"] == {"cmd": "GET_V", "payload": "V_12V"}
+        assert results["ampere"] == {
+            "cmd": "GET_A", "error": "ValueError: Invalid command: GET_A"}
+        assert sorted(device.calls[1]) == ["GET_A", "GET_V"]
+        assert sorted(device.calls[2:]) == [["GET_A"], ["GET_V"]]
+
+    def test_protocol_error_closes_connection(self, gateway_factory):
+        """
+        Тест закрытия соединения с кодом ошибки протокола при слишком
+        большом кадре и тексте не в UTF-8
+        """
+        url = gateway_factory({"dev0": FakeDevice()})
+        oversized = (b"\x81\xff"
+                     + struct.pack("!Q", ws_protocol.MAX_MESSAGE_SIZE + 1))
+        for send in (lambda raw: raw.sock.sendall(oversized),
+                     lambda raw: raw.send(
+                         b"\xff", opcode=websocket.ABNF.OPCODE_TEXT)):
+            raw = websocket.create_connection(url, timeout=5)
+            send(raw)
+            opcode, payload = raw.recv_data(control_frame=True)
+            raw.close()
+
+            assert opcode == websocket.ABNF.OPCODE_CLOSE
+            assert struct.unpack("!H", payload[:2])[0] == \
+                ws_protocol.CLOSE_PROTOCOL_ERROR
+
+        with WebsocketClient(url) as client:
+            assert client.get_voltage() == "V_12V"
+
+    def test_unknown_device(self, gateway_factory):
+        """
+        Тест запроса к несуществующему устройству
+        """
+        url = gateway_factory({"dev0": FakeDevice(), "dev1": FakeDevice()})
+
+        with WebsocketClient(url + "/dev2") as client:
+            assert client.send_command("GET_V") == \
+                {"cmd": "GET_V", "error": "Unknown device"}
+
+    def test_close_closes_backends(self, gateway_factory):
+        """
+        Тест закрытия соединений с устройствами при остановке шлюза
+        """
+        device = FakeDevice()
+        loop = asyncio.new_event_loop()
+        gateway = Gateway({"dev0": device}, port=0)
+        loop.run_until_complete(gateway.start())
+        loop.run_until_complete(gateway.close())
+        loop.close()
+
+        assert device.closed
+        assert gateway.server is None
@@ -0,0 +1,47 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_json_codec.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для json_codec.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import json
+from src import json_codec
+from src.udp_client import UdpClient
+from src.websocket_client import WebsocketClient
+
+
+class TestJsonCodec:
+    """
+    Тесты разбора и сериализации JSON
+    """
+
+    def test_roundtrip(self):
+        """
+        Тест совместимости с модулем json
+        """
+        response = {"cmd": "GET_V", "payload": "V_12V", "id": 7}
+
+        assert json_codec.BACKEND in ("json", "orjson")
+        assert json_codec.loads(json_codec.dumps(response)) == response
+        assert json_codec.loads(json.dumps(response).encode()) == response
+
+    def test_encode_request(self):
+        """
+        Тест добавления id к заранее сериализованному запросу
+        """
+        frame = WebsocketClient.REQUEST_FRAMES['GET_V']
+
+        assert json.loads(frame) == {"cmd": "GET_V"}
+        assert json.loads(json_codec.encode_request(frame, 12)) == \
+            {"cmd": "GET_V", "id": 12}
+        assert json.loads(json_codec.encode_request(
+            UdpClient.REQUEST_FRAMES['GET_S'], 3)) == \
+            {"cmd": "GET_S", "id": 3}
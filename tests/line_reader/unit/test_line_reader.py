@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_line_reader.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Мок тесты для line_reader.py
+# Примечание: Используется unittest.mock для эмуляции поведения serial.Serial
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import time
+from unittest.mock import Mock
+from src.line_reader import LineReader
+
+
+class TestLineReader:
+    """
+    Тесты для класса LineReader
+    """
+    def test_split_chunk_into_lines(self):
+        """
+        Тест нарезки одного блока на несколько строк
+        """
+        port = Mock()
+        port.in_waiting = 20
+        port.read.return_value = b"V_12V\r\nA_1A\r\nS_DS"
+
+        reader = LineReader()
+
+        assert reader.read_line(port) == b"V_12V\r\n"
+        assert reader.read_line(port) == b"A_1A\r\n"
+        assert reader.pending() == 4
+        port.read.assert_called_once_with(20)
+
+    def test_leftover_joined_with_next_chunk(self):
+        """
+        Тест склейки остатка с последующим блоком
+        """
+        port = Mock()
+        port.in_waiting = 0
+        port.read.side_effect = [b"S_DS", b"A123\r", b"\n"]
+
+        reader = LineReader()
+
+        assert reader.read_line(port) == b"S_DSA123\r\n"
+        assert reader.pending() == 0
+        port.read.assert_called_with(1)
+
+    def test_timeout_returns_partial(self):
+        """
+        Тест возврата неполного остатка по таймауту
+        """
+        port = Mock()
+        port.in_waiting = 0
+        port.read.side_effect = [b"V_1", b"", b""]
+
+        reader = LineReader()
+
+        assert reader.read_line(port) == b"V_1"
+        assert reader.read_line(port) == b""
+
+    def test_timeout_bounds_partial_line(self):
+        """
+        Тест: строка, пришедшая частями, не ждёт дольше timeout, а
+        таймаут порта восстанавливается
+        """
+        class SlowPort:
+            in_waiting = 0
+            timeout = 0.2
+
+            def __init__(self):
+                self.chunks = [(0.15, b"V_1")]
+                self.timeouts = []
+
+            def read(self, size=1):
+                self.timeouts.append(self.timeout)
+                delay, chunk = (self.chunks.pop(0) if self.chunks
+                                else (self.timeout, b""))
+                time.sleep(delay)
+                return chunk
+
+        port = SlowPort()
+        reader = LineReader()
+
+        started = time.monotonic()
+        assert reader.read_line(port, timeout=0.2) == b"V_1"
+        assert time.monotonic() - started < 0.27
+        assert port.timeouts[0] == 0.2
+        assert port.timeouts[1] < 0.06
+        assert port.timeout == 0.2
+
+    def test_clear(self):
+        """
+        Тест сброса буфера
+        """
+        reader = LineReader()
+        reader.feed(b"V_12V\r\nA_")
+        reader.clear()
+
+        assert reader.pending() == 0
+        assert reader.next_line() is None
+
+    def test_buffer_compaction(self):
+        """
+        Тест повторного использования буфера при длинном потоке
+        """
+        reader = LineReader()
+        for _ in range(1000):
+            reader.feed(b"V_12V\r\nA_")
+            assert reader.next_line() == b"V_12V\r\n"
+            reader.feed(b"1A\r\n")
+            assert reader.next_line() == b"A_1A\r\n"
+
+        assert reader.pending() == 0
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_measurement.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для measurement.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import pytest
+from src.measurement import Measurement, parse_measurement
+
+
+class TestMeasurement:
+    """
+    Тесты разбора измерений
+    """
+    @pytest.mark.parametrize("data, unit, value", [
+        (b"V_12V", b"V", 12),
+        (b"V_0V", b"V", 0),
+        (b"A_1A", b"A", 1),
+        (b"A_250A", b"A", 250),
+    ])
+    def test_valid_formats(self, data, unit, value):
+        """
+        Тест разбора корректных ответов
+        """
+        measurement = parse_measurement(data, unit, "COM1", 5.0)
+
+        assert measurement.value == value
+        assert measurement.unit == unit.decode()
+        assert measurement.device_id == "COM1"
+        assert measurement.timestamp == 5.0
+
+    @pytest.mark.parametrize("data, unit", [
+        (b"V_12.5V", b"V"),
+        (b"V_12", b"V"),
+        (b"VOLT_12V", b"V"),
+        (b"V_V", b"V"),
+        (b"V_ 12V", b"V"),
+        (b"V_1_2V", b"V"),
+        (b"V_-1V", b"V"),
+        (b"A_12V", b"A"),
+        (b"V_12V", b"A"),
+        (b"", b"V"),
+    ])
+    def test_invalid_formats(self, data, unit):
+        """
+        Тест отказа в разборе некорректных ответов
+        """
+        assert parse_measurement(data, unit, "COM1") is None
+
+    def test_slots(self):
+        """
+        Тест отсутствия __dict__ у записи измерения
+        """
+        measurement = Measurement(12, "V", "COM1", 1.0)
+
+        with pytest.raises(AttributeError):
+            measurement.extra = 1
+        assert repr(measurement) == ("Measurement(value=12, unit='V', "
+                                     "device_id='COM1', timestamp=1.0)")
@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_metrics.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для metrics.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import socket
+import socketserver
+import pytest
+import serial
+from unittest.mock import Mock, patch
+from src.device_controller import DeviceController
+from src.emulator import WebsocketEmulator
+from src.metrics import Histogram, Metrics, PrometheusExporter
+from src.websocket_client import WebsocketClient
+
+
+def scrape(address) -> str:
+    """
+    Запрашивает метрики у экспортёра и возвращает ответ.
+    """
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.connect(address)
+        sock.sendall(b"GET /metrics HTTP/1.0\r\n\r\n")
+        chunks = []
+        while True:
+            chunk = sock.recv(4096)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    return b"".join(chunks).decode()
+
+
+class TestMetrics:
+    """
+    Тесты метрик
+    """
+
+    def test_histogram(self):
+        """
+        Тест распределения значений по корзинам
+        """
+        histogram = Histogram((0.1, 1.0))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        assert histogram.cumulative() == [(0.1, 2), (1.0, 3),
+                                          (float('inf'), 4)]
+        assert histogram.count == 4
+        assert histogram.sum == pytest.approx(2.65)
+
+    def test_hooks_and_counters(self):
+        """
+        Тест хуков и классификации ошибок
+        """
+        metrics = Metrics()
+        events = []
+        metrics.add_pre_hook(lambda device, commands: events.append(
+            ("pre", device, commands)))
+        metrics.add_post_hook(lambda device, commands, elapsed, error:
+                              events.append(("post", device, error)))
+
+        started = metrics.start("COM1", ["GET_V"])
+        metrics.finish("COM1", ["GET_V"], started)
+        timeout = serial.SerialTimeoutException("Read timeout occurred")
+        metrics.finish("COM1", ["GET_V"], metrics.start("COM1", ["GET_V"]),
+                       timeout)
+        metrics.finish("COM1", ["GET_V"], metrics.start("COM1", ["GET_V"]),
+                       OSError("gone"))
+
+        assert events[:2] == [("pre", "COM1", ["GET_V"]),
+                              ("post", "COM1", None)]
+        assert events[3] == ("post", "COM1", timeout)
+        assert metrics.get('timeouts', "COM1") == 1
+        assert metrics.get('errors', "COM1") == 1
+        assert metrics.histogram("COM1", "GET_V").count == 3
+        with pytest.raises(ValueError, match="Invalid counter"):
+            metrics.increment('unknown', "COM1")
+
+    def test_render(self):
+        """
+        Тест текстового формата Prometheus
+        """
+        metrics = Metrics(buckets=(0.5,))
+        metrics.finish('dev "1"', ["GET_V"], metrics.start('dev "1"', []))
+        metrics.increment('bytes_sent', "COM1", 7)
+
+        text = metrics.render()
+
+        assert "# TYPE sw_qa_command_duration_seconds histogram" in text
+        assert ('sw_qa_command_duration_seconds_bucket{device="dev \\"1\\"",'
+                'cmd="GET_V",le="+Inf"} 1') in text
+        assert 'sw_qa_bytes_sent_total{device="COM1"} 7' in text
+        assert "# TYPE sw_qa_reconnects_total counter" in text
+        assert text.endswith("\n")
+
+    def test_exporter_file(self, tmp_path):
+        """
+        Тест записи метрик в файл
+        """
+        metrics = Metrics()
+        metrics.increment('reconnects', "COM1")
+        path = tmp_path / "sw_qa.prom"
+
+        PrometheusExporter(metrics).write(str(path))
+
+        assert path.read_text() == metrics.render()
+        assert list(tmp_path.iterdir()) == [path]
+
+    @pytest.mark.parametrize("unix", [False, True])
+    def test_exporter_socket(self, tmp_path, unix):
+        """
+        Тест отдачи метрик по TCP и unix-сокету
+        """
+        metrics = Metrics()
+        metrics.increment('timeouts', "COM1", 3)
+        address = str(tmp_path / "metrics.sock") if unix \
+            else ("127.0.0.1", 0)
+
+        with PrometheusExporter(metrics) as exporter:
+            response = scrape(exporter.serve(address))
+
+        assert response.startswith("HTTP/1.0 200 OK")
+        assert 'sw_qa_timeouts_total{device="COM1"} 3' in response
+        # Стандартные классы серверов не меняются
+        assert not socketserver.ThreadingTCPServer.allow_reuse_address
+        assert not socketserver.ThreadingUnixStreamServer.allow_reuse_address
+
+    @patch('serial.Serial')
+    def test_device_controller_metrics(self, mock_serial):
+        """
+        Тест метрик DeviceController
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.in_waiting = 0
+        mock_serial_instance.read.side_effect = [b"V_12V\r\n",
+                                                 b"V_1.5V\r\n", b""]
+        metrics = Metrics()
+
+        device = DeviceController("COM1", timeout=0.01, metrics=metrics)
+        device.get_voltage()
+        with pytest.raises(ValueError):
+            device.get_voltage()
+        with pytest.raises(serial.SerialTimeoutException):
+            device.get_voltage()
+        device.open_connection()
+
+        assert metrics.histogram("COM1", "GET_V").count == 3
+        assert metrics.get('bytes_sent', "COM1") == 21
+        assert metrics.get('bytes_received', "COM1") == 15
+        assert metrics.get('validation_failures', "COM1") == 1
+        assert metrics.get('timeouts', "COM1") == 1
+        assert metrics.get('reconnects', "COM1") == 1
+
+    def test_websocket_client_metrics(self):
+        """
+        Тест метрик WebsocketClient
+        """
+        metrics = Metrics()
+        with WebsocketEmulator(malformed_rate=1.0, seed=1) as emulator, \
+                WebsocketClient(emulator.url, metrics=metrics) as client:
+            with pytest.raises(ValueError):
+                client.get_voltage()
+            emulator.malformed_rate = 0.0
+            client.open()
+            client.get_batch(['VOLTAGE', 'AMPERE'])
+
+        url = emulator.url
+        assert metrics.histogram(url, "GET_V").count == 2
+        assert metrics.histogram(url, "GET_A").count == 1
+        assert metrics.get('bytes_sent', url) > 0
+        assert metrics.get('bytes_received', url) > 0
+        assert metrics.get('validation_failures', url) == 1
+        assert metrics.get('reconnects', url) == 1
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_websocket_bytes_are_utf8(self, mock_create_connection):
+        """
+        Тест: принятые байты считаются в UTF-8, а не в символах
+        """
+        mock_ws = Mock()
+        mock_ws.recv.return_value = \
+            '{"cmd": "GET_V", "payload": "V_12V", "note": "ё"}'
+        mock_create_connection.return_value = mock_ws
+        metrics = Metrics()
+
+        client = WebsocketClient(metrics=metrics)
+        client.get_voltage()
+
+        assert metrics.get('bytes_received', client.url) == \
+            len(mock_ws.recv.return_value.encode())
+
+    def test_batch_fallback_recorded_once(self):
+        """
+        Тест: пробный пакет и переход на команды по одной дают одно
+        наблюдение на вызов
+        """
+        metrics = Metrics()
+        with WebsocketEmulator(batch=False) as emulator, \
+                WebsocketClient(emulator.url, metrics=metrics) as client:
+            assert client.get_batch(['VOLTAGE', 'AMPERE']) == {
+                'VOLTAGE': "V_12V", 'AMPERE': "A_5A"}
+            client.get_batch(['VOLTAGE', 'AMPERE'])
+
+        assert client._batch_supported is False
+        assert metrics.histogram(emulator.url, "GET_V").count == 2
+        assert metrics.histogram(emulator.url, "GET_A").count == 2
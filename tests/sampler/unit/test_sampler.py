@@ -0,0 +1,108 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_sampler.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для sampler.py
+# Примечание: Время подменяется управляемыми часами
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import pytest
+from unittest.mock import Mock, patch
+from src.device_controller import DeviceController
+from src.measurement import Measurement
+from src.sampler import Sampler
+
+
+class FakeClock:
+    """
+    Управляемые часы: sleep сдвигает время, опрос длится latency секунд.
+    """
+    def __init__(self, latencies):
+        self.now = 100.0
+        self.latencies = iter(latencies)
+        self.requests = []
+
+    def clock(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+
+    def measure(self, response_types):
+        self.requests.append(self.now)
+        self.now += next(self.latencies)
+        return {response_type: Measurement(1, response_type[0], "COM1",
+                                           self.now)
+                for response_type in response_types}
+
+
+class TestSampler:
+    """
+    Тесты для класса Sampler
+    """
+    def test_fixed_rate_compensates_latency(self):
+        """
+        Тест опроса по абсолютному расписанию при задержке обмена
+        """
+        fake = FakeClock([0.003, 0.015, 0.001, 0.019])
+        sampler = Sampler(fake.measure, ['VOLTAGE', 'AMPERE'], hz=50,
+                          count=4, clock=fake.clock, sleep=fake.sleep)
+
+        samples = list(sampler)
+
+        assert len(samples) == 8
+        assert [s.unit for s in samples[:2]] == ['V', 'A']
+        assert fake.requests == pytest.approx([100.0, 100.02, 100.04,
+                                               100.06])
+        assert sampler.missed_deadlines == 0
+
+    def test_missed_deadlines_reported(self):
+        """
+        Тест учёта пропущенных моментов опроса без догоняющих запросов
+        """
+        fake = FakeClock([0.001, 0.055, 0.001, 0.001])
+        sampler = Sampler(fake.measure, ['VOLTAGE'], hz=50, count=4,
+                          clock=fake.clock, sleep=fake.sleep)
+
+        list(sampler)
+
+        assert fake.requests == pytest.approx([100.0, 100.02, 100.075,
+                                               100.08])
+        assert sampler.missed_deadlines == 1
+        assert sampler.max_lateness == pytest.approx(0.035)
+
+    def test_invalid_arguments(self):
+        """
+        Тест проверки параметров
+        """
+        with pytest.raises(ValueError, match="Invalid rate"):
+            Sampler(Mock(), ['VOLTAGE'], hz=0)
+
+        with pytest.raises(ValueError,
+                           match="Invalid measurement type: SERIAL"):
+            Sampler(Mock(), ['SERIAL'], hz=10)
+
+    @patch('serial.Serial')
+    def test_device_stream(self, mock_serial):
+        """
+        Тест потокового опроса устройства
+        """
+        mock_serial_instance = Mock()
+        mock_serial.return_value = mock_serial_instance
+        mock_serial_instance.is_open = True
+        mock_serial_instance.read.return_value = b"V_12V\r\nA_1A\r\n"
+
+        device = DeviceController("COM1")
+        samples = [(m.value, m.unit)
+                   for m in device.stream(['VOLTAGE', 'AMPERE'],
+                                          hz=1000, count=3)]
+
+        assert samples == [(12, "V"), (1, "A")] * 3
+        assert mock_serial_instance.write.call_count == 3
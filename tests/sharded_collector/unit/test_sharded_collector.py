@@ -0,0 +1,158 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_sharded_collector.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для sharded_collector.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import sys
+import threading
+import time
+import pytest
+from src.emulator import SerialEmulator, WebsocketEmulator
+from src.sharded_collector import (EMPTY, ERROR, INVALID, OK,
+                                   SharedSlots, ShardedCollector)
+
+
+class TestSharedSlots:
+    """
+    Тесты таблицы слотов
+    """
+
+    def test_write_and_read(self):
+        """
+        Тест записи и чтения слота
+        """
+        slots = SharedSlots(2, 2)
+        assert slots.read(1) == [0, EMPTY, 0, 0, 0]
+
+        slots.write(1, 1, OK, 10, [12, 5])
+        slots.write(1, 2, INVALID)
+
+        assert slots.read(1) == [2, INVALID, 10, 12, 5]
+        assert slots.read(0) == [0, EMPTY, 0, 0, 0]
+
+    def test_read_waits_for_writer(self):
+        """
+        Тест: чтение не возвращает запись, которую пишут в этот момент
+        """
+        slots = SharedSlots(1, 1)
+        slots.array[0] += 1
+        slots.array[1] = 7
+
+        def finish():
+            time.sleep(0.05)
+            slots.array[4] = 42
+            slots.array[0] += 1
+
+        thread = threading.Thread(target=finish)
+        thread.start()
+        record = slots.read(0)
+        thread.join()
+
+        assert record == [7, EMPTY, 0, 42]
+
+    def test_read_interrupted_write(self):
+        """
+        Тест: недописанный слот не подвешивает чтение, а reset()
+        помечает его ошибкой и отбрасывает значения
+        """
+        slots = SharedSlots(1, 1)
+        slots.write(0, 3, OK, 10, [12])
+        slots.READ_TIMEOUT = 0.1
+        slots.array[0] += 1
+
+        started = time.monotonic()
+        with pytest.raises(TimeoutError, match="Slot 0"):
+            slots.read(0)
+        assert time.monotonic() - started < 1.0
+
+        slots.reset(0)
+        assert slots.read(0) == [3, ERROR, 0, 12]
+        slots.reset(0)
+        assert slots.read(0) == [3, ERROR, 0, 12]
+
+    def test_concurrent_writes_are_consistent(self):
+        """
+        Тест согласованности чтения при непрерывной записи
+        """
+        slots = SharedSlots(1, 3)
+        stop = threading.Event()
+
+        def writer():
+            cycle = 0
+            while not stop.is_set():
+                cycle += 1
+                slots.write(0, cycle, OK, cycle, [cycle] * 3)
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(2000):
+                cycle, _, timestamp, *values = slots.read(0)
+                assert timestamp == cycle
+                assert values == [cycle] * 3 or cycle == 0
+        finally:
+            stop.set()
+            thread.join()
+
+
+class TestShardedCollector:
+    """
+    Тесты сборщика
+    """
+
+    def test_invalid_response_type(self):
+        """
+        Тест проверки типов величин
+        """
+        with pytest.raises(ValueError, match="Invalid measurement type"):
+            ShardedCollector(["/dev/ttyUSB0"], ['SERIAL'])
+
+    def test_close_resets_interrupted_slots(self):
+        """
+        Тест: после остановки процессов недописанные слоты читаются
+        """
+        collector = ShardedCollector(["/dev/ttyUSB0"])
+        collector._stop = collector.context.Event()
+        collector.slots.array[0] += 1
+
+        collector.close()
+
+        reading = collector.read(0)
+        assert reading.status == ERROR
+        assert reading.values is None
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="requires pty")
+    def test_collect_from_emulators(self):
+        """
+        Тест сбора с serial- и WebSocket-устройств несколькими процессами
+        """
+        with SerialEmulator() as first, \
+                SerialEmulator(malformed_rate=1.0) as malformed, \
+                WebsocketEmulator() as ws:
+            endpoints = [first.port, ws.url, malformed.port,
+                         "/dev/nonexistent"]
+            with ShardedCollector(endpoints, processes=2, interval=0.01,
+                                  timeout=0.5) as collector:
+                assert len(collector.workers) == 2
+                assert collector.wait(cycles=3, timeout=20)
+                snapshot = collector.snapshot()
+
+        assert list(snapshot) == endpoints
+        for endpoint in (first.port, ws.url):
+            reading = snapshot[endpoint]
+            assert reading.status == OK
+            assert reading.cycle >= 3
+            assert reading.values == {'VOLTAGE': 12, 'AMPERE': 5}
+            assert reading.timestamp <= time.monotonic()
+        assert snapshot[malformed.port].status == INVALID
+        assert snapshot[malformed.port].values is None
+        assert snapshot["/dev/nonexistent"].status == ERROR
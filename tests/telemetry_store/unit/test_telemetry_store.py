@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_telemetry_store.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для telemetry_store.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import pytest
+from unittest.mock import Mock
+from src.device_pool import PollResult
+from src.measurement import Measurement
+from src.telemetry_store import RingBuffer, TelemetryStore
+
+
+def flatten(segments):
+    """
+    Собирает сегменты окна в списки для сравнения.
+    """
+    timestamps = [t for segment, _ in segments for t in segment]
+    values = [v for _, segment in segments for v in segment]
+    return timestamps, values
+
+
+class TestRingBuffer:
+    """
+    Тесты для класса RingBuffer
+    """
+    def test_window_before_wrap(self):
+        """
+        Тест окна до заполнения буфера
+        """
+        buffer = RingBuffer(5)
+        for i in range(3):
+            buffer.append(float(i), i * 10)
+
+        assert len(buffer) == 3
+        assert flatten(buffer.window()) == ([0.0, 1.0, 2.0], [0, 10, 20])
+        assert flatten(buffer.window(2)) == ([1.0, 2.0], [10, 20])
+
+    def test_window_after_wrap(self):
+        """
+        Тест вытеснения старых отсчётов и окна из двух сегментов
+        """
+        buffer = RingBuffer(4)
+        for i in range(7):
+            buffer.append(float(i), i)
+
+        assert len(buffer) == 4
+        assert len(buffer.window()) == 2
+        assert flatten(buffer.window()) == ([3.0, 4.0, 5.0, 6.0],
+                                            [3, 4, 5, 6])
+        assert flatten(buffer.window(1)) == ([6.0], [6])
+        assert buffer.latest() == (6.0, 6)
+
+    def test_window_without_copy(self):
+        """
+        Тест выдачи окна как представления общих массивов
+        """
+        buffer = RingBuffer(4)
+        buffer.append(1.0, 1)
+        (timestamps, values), = buffer.window()
+
+        buffer.values[0] = 42
+
+        assert isinstance(values, memoryview)
+        assert values[0] == 42
+
+    def test_since(self):
+        """
+        Тест окна по времени
+        """
+        buffer = RingBuffer(4)
+        for i in range(6):
+            buffer.append(float(i), i)
+
+        assert flatten(buffer.since(3.5)) == ([4.0, 5.0], [4, 5])
+        assert flatten(buffer.since(0.0))[1] == [2, 3, 4, 5]
+        assert buffer.since(10.0) == []
+
+    def test_fixed_memory(self):
+        """
+        Тест неизменного объёма памяти при добавлении
+        """
+        buffer = RingBuffer(1000)
+        nbytes = buffer.nbytes
+        for i in range(5000):
+            buffer.append(float(i), i)
+
+        assert buffer.nbytes == nbytes == 16000
+        assert len(buffer.timestamps) == 1000
+
+    def test_invalid_capacity(self):
+        """
+        Тест проверки размера буфера
+        """
+        with pytest.raises(ValueError, match="Invalid capacity"):
+            RingBuffer(0)
+
+
+class TestTelemetryStore:
+    """
+    Тесты для класса TelemetryStore
+    """
+    def test_sample_client(self):
+        """
+        Тест сохранения результатов measure()
+        """
+        client = Mock()
+        client.measure.return_value = {
+            'VOLTAGE': Measurement(12, "V", "COM1", 1.0),
+            'AMPERE': Measurement(2, "A", "COM1", 1.0)
+        }
+
+        store = TelemetryStore(capacity=10)
+        store.sample(client)
+
+        client.measure.assert_called_once_with(['VOLTAGE', 'AMPERE'])
+        assert store.series("COM1", 'VOLTAGE').latest() == (1.0, 12)
+        assert store.series("COM1", 'AMPERE').latest() == (1.0, 2)
+        assert store.nbytes == 2 * 10 * 16
+
+    def test_record_poll(self):
+        """
+        Тест сохранения результата цикла DevicePool.poll()
+        """
+        results = {
+            "COM1": PollResult("COM1", {'VOLTAGE': "V_12V",
+                                        'SERIAL': "S_DSA123"}, None),
+            "COM2": PollResult("COM2", None, TimeoutError())
+        }
+
+        store = TelemetryStore(capacity=10)
+        store.record_poll(results, timestamp=5.0)
+
+        assert store.keys() == [("COM1", 'VOLTAGE')]
+        assert store.series("COM1", 'VOLTAGE').latest() == (5.0, 12)
+
+    def test_invalid_series(self):
+        """
+        Тест отказа в создании ряда для нечисловой величины
+        """
+        with pytest.raises(ValueError,
+                           match="Invalid measurement type: SERIAL"):
+            TelemetryStore().series("COM1", 'SERIAL')
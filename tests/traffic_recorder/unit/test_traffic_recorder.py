@@ -0,0 +1,180 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_traffic_recorder.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для traffic_recorder.py
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import sys
+import time
+import pytest
+import serial
+import websocket
+from src.device_controller import DeviceController
+from src.emulator import SerialEmulator, WebsocketEmulator
+from src.traffic_recorder import (RECEIVED, SENT, SERIAL, WEBSOCKET,
+                                  TrafficLog, TrafficRecorder)
+from src.websocket_client import WebsocketClient
+
+
+def record_serial(path, **options):
+    """
+    Записывает обмен DeviceController с serial-эмулятором.
+    Возвращает путь к порту эмулятора.
+    """
+    with SerialEmulator(**options) as emulator, \
+            TrafficRecorder(path) as recorder, \
+            DeviceController(emulator.port, timeout=0.2,
+                             connection_factory=recorder.serial_factory()
+                             ) as device:
+        assert device.get_batch(['VOLTAGE', 'AMPERE']) == {
+            'VOLTAGE': "V_12V", 'AMPERE': "A_5A"}
+        assert device.get_voltage() == "V_12V"
+        emulator.drop_rate = 1.0
+        with pytest.raises(serial.SerialTimeoutException):
+            device.get_ampere()
+        return emulator.port
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="requires pty")
+class TestSerialReplay:
+    """
+    Тесты записи и воспроизведения serial-обмена
+    """
+
+    def test_record(self, tmp_path):
+        """
+        Тест содержимого журнала
+        """
+        path = tmp_path / "traffic.log"
+        port = record_serial(path)
+
+        with TrafficLog(path) as log:
+            assert log.endpoints() == [port]
+            records = list(log.records(SERIAL, port))
+            assert [(direction, payload) for _, direction, payload
+                    in records if direction == SENT] == [
+                (SENT, b"GET_V\r\nGET_A\r\n"), (SENT, b"GET_V\r\n"),
+                (SENT, b"GET_A\r\n")]
+            assert b"".join(payload for _, direction, payload in records
+                            if direction == RECEIVED) == \
+                b"V_12V\r\nA_5A\r\nV_12V\r\n"
+            timestamps = [timestamp for timestamp, _, _ in records]
+            assert timestamps == sorted(timestamps)
+
+            summary, = log.summary()
+            assert summary["transport"] == "serial"
+            assert summary["sent"] == 3
+            assert summary["bytes_received"] == 20
+
+    def test_replay_maximum_speed(self, tmp_path):
+        """
+        Тест воспроизведения через DeviceController без задержек
+        """
+        path = tmp_path / "traffic.log"
+        port = record_serial(path, latency=0.05)
+
+        with TrafficLog(path) as log:
+            factory = log.serial_factory(speed=None)
+            device = DeviceController(port, timeout=0.2,
+                                      connection_factory=factory)
+            started = time.perf_counter()
+            assert device.get_batch(['VOLTAGE', 'AMPERE']) == {
+                'VOLTAGE': "V_12V", 'AMPERE': "A_5A"}
+            assert device.get_voltage() == "V_12V"
+            assert time.perf_counter() - started < 0.05
+            with pytest.raises(serial.SerialTimeoutException):
+                device.get_ampere()
+            assert device.serial_connection.stream.mismatches == 0
+            device.close()
+
+    def test_replay_original_speed(self, tmp_path):
+        """
+        Тест воспроизведения с записанной задержкой ответа
+        """
+        path = tmp_path / "traffic.log"
+        port = record_serial(path, latency=0.05)
+
+        with TrafficLog(path) as log:
+            device = DeviceController(
+                "/dev/replay", timeout=0.2,
+                connection_factory=log.serial_factory(endpoint=port))
+            started = time.perf_counter()
+            assert device.get_voltage() == "V_12V"
+            assert time.perf_counter() - started >= 0.04
+            device.close()
+
+    def test_unknown_port(self, tmp_path):
+        """
+        Тест открытия порта, которого нет в журнале
+        """
+        path = tmp_path / "traffic.log"
+        record_serial(path)
+
+        with TrafficLog(path) as log:
+            with pytest.raises(serial.SerialException,
+                               match="No recorded traffic"):
+                DeviceController("/dev/ttyUSB9",
+                                 connection_factory=log.serial_factory())
+
+
+class TestWebsocketReplay:
+    """
+    Тесты записи и воспроизведения WebSocket-обмена
+    """
+
+    def test_record_and_replay(self, tmp_path):
+        """
+        Тест воспроизведения конвейерного и пакетного обмена
+        """
+        path = tmp_path / "traffic.log"
+        with WebsocketEmulator() as emulator, \
+                TrafficRecorder(path) as recorder:
+            url = emulator.url
+            with WebsocketClient(
+                    url, request_ids=True,
+                    connection_factory=recorder.websocket_factory()
+            ) as client:
+                recorded = [client.send_commands(['GET_V', 'GET_A']),
+                            client.get_batch(['VOLTAGE', 'SERIAL'])]
+
+        with TrafficLog(path) as log:
+            assert log.endpoints(WEBSOCKET) == [url]
+            assert log.endpoints(SERIAL) == []
+            with WebsocketClient(
+                    url, timeout=0.1, request_ids=True,
+                    connection_factory=log.websocket_factory(speed=None)
+            ) as client:
+                replayed = [client.send_commands(['GET_V', 'GET_A']),
+                            client.get_batch(['VOLTAGE', 'SERIAL'])]
+                assert client.ws.stream.mismatches == 0
+                with pytest.raises(websocket.WebSocketTimeoutException):
+                    client.send_command('GET_V')
+
+        assert replayed == recorded
+
+    def test_invalid_log(self, tmp_path):
+        """
+        Тест отказа открыть файл другого формата и недописанной записи
+        """
+        path = tmp_path / "traffic.log"
+        path.write_bytes(b"not a traffic log")
+        with pytest.raises(ValueError, match="Invalid traffic log"):
+            TrafficLog(path)
+
+        with TrafficRecorder(path) as recorder:
+            recorder.record(WEBSOCKET, "ws://device", SENT, '{"cmd":"GET_V"}')
+            recorder.record(WEBSOCKET, "ws://device", RECEIVED, "x" * 100)
+        path.write_bytes(path.read_bytes()[:-10])
+
+        with TrafficLog(path) as log:
+            assert [payload for _, _, payload
+                    in log.records(WEBSOCKET, "ws://device")] == \
+                [b'{"cmd":"GET_V"}']
@@ -0,0 +1,152 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_udp_client.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для udp_client.py
+# Примечание: Используется локальный UDP-сервер в отдельном потоке
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import json
+import socket
+import threading
+import pytest
+from src.udp_client import UdpClient
+
+PAYLOADS = {"GET_V": "V_12V", "GET_A": "A_1A", "GET_S": "S_DSA123"}
+
+
+class UdpServer:
+    """
+    Локальный UDP-сервер. Может отбрасывать первые drop датаграмм и
+    отвечать на пачку из batch запросов в обратном порядке.
+    """
+    def __init__(self, payloads=None, drop=0, batch=1):
+        self.payloads = payloads or PAYLOADS
+        self.drop = drop
+        self.batch = batch
+        self.received = 0
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(("127.0.0.1", 0))
+        self.port = self.sock.getsockname()[1]
+        self.thread = threading.Thread(target=self.serve, daemon=True)
+        self.thread.start()
+
+    def serve(self):
+        queued = []
+        while True:
+            try:
+                data, address = self.sock.recvfrom(65535)
+            except OSError:
+                return
+            self.received += 1
+            if self.received <= self.drop:
+                continue
+            request = json.loads(data)
+            queued.append(dict(request,
+                               payload=self.payloads[request["cmd"]]))
+            if len(queued) == self.batch:
+                for response in reversed(queued):
+                    self.sock.sendto(json.dumps(response).encode(), address)
+                queued = []
+
+    def close(self):
+        self.sock.close()
+
+
+@pytest.fixture
+def udp_server():
+    servers = []
+
+    def factory(**kwargs):
+        server = UdpServer(**kwargs)
+        servers.append(server)
+        return server
+
+    yield factory
+    for server in servers:
+        server.close()
+
+
+class TestUdpClient:
+    """
+    Тесты для класса UdpClient
+    """
+    def test_get_values(self, udp_server):
+        """
+        Тест получения напряжения, тока и серийного номера
+        """
+        server = udp_server()
+
+        with UdpClient("127.0.0.1", server.port) as client:
+            assert client.get_voltage() == "V_12V"
+            assert client.get_ampere() == "A_1A"
+            assert client.get_serial() == "S_DSA123"
+
+    def test_batch_out_of_order(self, udp_server):
+        """
+        Тест пакетного запроса с ответами в обратном порядке
+        """
+        server = udp_server(batch=3)
+
+        with UdpClient("127.0.0.1", server.port) as client:
+            result = client.get_batch(['VOLTAGE', 'AMPERE', 'SERIAL'])
+
+        assert result == {'VOLTAGE': "V_12V",
+                          'AMPERE': "A_1A",
+                          'SERIAL': "S_DSA123"}
+
+    def test_retransmit_on_timeout(self, udp_server):
+        """
+        Тест повторной отправки потерянной датаграммы
+        """
+        server = udp_server(drop=1)
+
+        with UdpClient("127.0.0.1", server.port, timeout=0.1,
+                       request_ids=True) as client:
+            assert client.get_voltage() == "V_12V"
+
+        assert server.received == 2
+
+    def test_no_response(self, udp_server):
+        """
+        Тест исчерпания повторных отправок
+        """
+        server = udp_server(drop=10)
+
+        with UdpClient("127.0.0.1", server.port, timeout=0.05,
+                       retries=2) as client:
+            with pytest.raises(TimeoutError, match="after 2 retries"):
+                client.get_serial()
+
+        assert server.received == 3
+
+    def test_invalid_response(self, udp_server):
+        """
+        Тест некорректного ответа сервера
+        """
+        server = udp_server(payloads={"GET_V": "V_12.5V"})
+
+        with UdpClient("127.0.0.1", server.port) as client:
+            with pytest.raises(ValueError,
+                               match="Invalid voltage response format"):
+                client.get_voltage()
+
+    def test_send_command_invalid(self, udp_server):
+        """
+        Тест отправки недопустимой команды
+        """
+        server = udp_server()
+
+        with UdpClient("127.0.0.1", server.port) as client:
+            with pytest.raises(ValueError, match="Invalid command: GET_X"):
+                client.send_command("GET_X")
+
+        with pytest.raises(RuntimeError, match="UDP socket is not open"):
+            client.send_command("GET_V")
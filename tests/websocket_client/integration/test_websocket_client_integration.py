@@ -6,6 +6,8 @@
 # Версия:   1
 # Дата:     24.09.2025
 # Описание: Интеграционные тесты для websocket_client.py с реальным сервером
+# Примечание: Если WEBSOCKET_SERVER_URL не задан, запускается эмулятор
+#             из src/emulator.py
 # ============================================================================
 
 
@@ -15,13 +17,13 @@
 import pytest
 import time
 import os
+from src.emulator import WebsocketEmulator
 from src.websocket_client import WebsocketClient
 
 
 # ============================================================================
 # Объявление переменных для тестирования
 # ============================================================================
-URL = "ws://localhost:8765"
 TIMEOUT = 0.1
 RESULT_GET_V = "V_12V"
 RESULT_GET_A = "A_5A"
@@ -34,7 +36,13 @@ class TestWebsocketClientIntegration:
     """
     @pytest.fixture
     def server_url(self):
-        return os.getenv('WEBSOCKET_SERVER_URL', URL)
+        url = os.getenv('WEBSOCKET_SERVER_URL')
+        if url:
+            yield url
+            return
+
+        with WebsocketEmulator() as emulator:
+            yield emulator.url
 
     def test_connection_establishment(self, server_url):
         """
@@ -15,9 +15,21 @@
 import pytest
 import json
 from unittest.mock import Mock, patch
+import websocket
+from src.emulator import WebsocketEmulator
 from src.websocket_client import WebsocketClient
 
 
+class SlowBatchEmulator(WebsocketEmulator):
+    """
+    Эмулятор, отвечающий на пакетные запросы с задержкой.
+    """
+
+    def _reply(self, request):
+        self.latency = 0.3 if 'cmds' in request else 0.0
+        return super()._reply(request)
+
+
 class TestWebsocketClient:
     """
     Тесты для класса WebsocketClient
@@ -146,3 +158,253 @@ class TestWebsocketClient:
         with pytest.raises(RuntimeError,
                            match="WebSocket connection is not open"):
             client.send_command(str("GET_V"))
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_send_commands_pipelined(self, mock_create_connection):
+        """
+        Тест конвейерной отправки: все запросы уходят до чтения ответов,
+        ответы в другом порядке сопоставляются по cmd
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        events = []
+        responses = iter([
+            {"cmd": "GET_S", "payload": "S_DSA123"},
+            {"cmd": "GET_V", "payload": "V_12V"},
+            {"cmd": "GET_A", "payload": "A_1A"}
+        ])
+        mock_ws.send.side_effect = lambda data: events.append("send")
+
+        def recv():
+            events.append("recv")
+            return json.dumps(next(responses))
+
+        mock_ws.recv.side_effect = recv
+
+        client = WebsocketClient("ws://localhost:8765")
+        result = client.send_commands(["GET_V", "GET_A", "GET_S"])
+
+        assert events == ["send"] * 3 + ["recv"] * 3
+        assert [response["payload"] for response in result] == [
+            "V_12V", "A_1A", "S_DSA123"]
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_send_commands_matched_by_id(self, mock_create_connection):
+        """
+        Тест сопоставления ответов на одинаковые команды по id
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        sent = []
+        mock_ws.send.side_effect = lambda data: sent.append(json.loads(data))
+
+        client = WebsocketClient("ws://localhost:8765", request_ids=True)
+        first = client.submit("GET_V")
+        second = client.submit("GET_V")
+
+        mock_ws.recv.side_effect = [
+            json.dumps({"cmd": "GET_V", "payload": "V_2V",
+                        "id": sent[1]["id"]}),
+            json.dumps({"cmd": "GET_V", "payload": "V_1V",
+                        "id": sent[0]["id"]})
+        ]
+        client.flush()
+
+        assert sent[0]["id"] != sent[1]["id"]
+        assert first.result()["payload"] == "V_1V"
+        assert second.result()["payload"] == "V_2V"
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_pipelined_timeout_fails_pending(self, mock_create_connection):
+        """
+        Тест завершения всех ожидающих запросов ошибкой чтения
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        mock_ws.recv.side_effect = [
+            json.dumps({"cmd": "GET_V", "payload": "V_12V"}),
+            TimeoutError("timed out")
+        ]
+
+        client = WebsocketClient("ws://localhost:8765")
+        voltage = client.submit("GET_V")
+        ampere = client.submit("GET_A")
+
+        with pytest.raises(TimeoutError):
+            client.flush()
+
+        assert voltage.result()["payload"] == "V_12V"
+        with pytest.raises(TimeoutError):
+            ampere.result()
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_late_response_is_dropped(self, mock_create_connection):
+        """
+        Тест: ответ, пришедший после таймаута, не достаётся следующему
+        запросу
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        mock_ws.recv.side_effect = [
+            websocket.WebSocketTimeoutException("timed out"),
+            json.dumps({"cmd": "GET_V", "payload": "V_12V", "id": 1}),
+            json.dumps({"cmd": "GET_A", "payload": "A_1A", "id": 2}),
+            websocket.WebSocketTimeoutException("timed out"),
+            json.dumps({"cmd": "GET_V", "payload": "V_12V"}),
+            json.dumps({"cmd": "GET_S", "payload": "S_DSA123"})
+        ]
+
+        client = WebsocketClient("ws://localhost:8765", request_ids=True)
+        with pytest.raises(websocket.WebSocketTimeoutException):
+            client.get_voltage()
+        assert client.get_ampere() == "A_1A"
+
+        # Без request_ids запоздавший ответ отбрасывается по cmd
+        client.request_ids = False
+        with pytest.raises(websocket.WebSocketTimeoutException):
+            client.get_voltage()
+        assert client.get_serial() == "S_DSA123"
+        assert client.unmatched_responses == 2
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_measure(self, mock_create_connection):
+        """
+        Тест получения измерений в виде Measurement
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        mock_ws.recv.side_effect = [
+            json.dumps({"cmd": "GET_V", "payload": "V_12V"}),
+            json.dumps({"cmd": "GET_A", "payload": "A_2A"}),
+            json.dumps({"cmd": "GET_A", "payload": "A_2.5A"})
+        ]
+
+        client = WebsocketClient("ws://localhost:8765")
+        voltage = client.measure_voltage()
+        ampere = client.measure_ampere()
+
+        assert (voltage.value, voltage.unit) == (12, "V")
+        assert (ampere.value, ampere.unit) == (2, "A")
+        assert voltage.device_id == "ws://localhost:8765"
+        with pytest.raises(ValueError,
+                           match="Invalid ampere response format"):
+            client.measure_ampere()
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_serial_number_cached(self, mock_create_connection):
+        """
+        Тест кэширования серийного номера и сброса кэша при переподключении
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        mock_ws.recv.return_value = json.dumps({"cmd": "GET_S",
+                                                "payload": "S_DSA123"})
+
+        client = WebsocketClient("ws://localhost:8765")
+
+        assert client.get_serial() == "S_DSA123"
+        assert client.get_serial() == "S_DSA123"
+        assert mock_ws.send.call_count == 1
+
+        client.open()
+        client.get_serial()
+
+        assert mock_ws.send.call_count == 2
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_get_batch_single_frame(self, mock_create_connection):
+        """
+        Тест пакетного запроса одним кадром
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        sent = []
+        mock_ws.send.side_effect = lambda data: sent.append(json.loads(data))
+        mock_ws.recv.return_value = json.dumps({"results": [
+            {"cmd": "GET_V", "payload": "V_12V"},
+            {"cmd": "GET_A", "payload": "A_1A"},
+            {"cmd": "GET_S", "payload": "S_DSA123"}
+        ]})
+
+        client = WebsocketClient("ws://localhost:8765")
+        values = client.get_batch(['VOLTAGE', 'AMPERE', 'SERIAL'])
+
+        assert values == {'VOLTAGE': "V_12V", 'AMPERE': "A_1A",
+                          'SERIAL': "S_DSA123"}
+        assert sent == [{"cmds": ["GET_V", "GET_A", "GET_S"]}]
+        assert client.identity.get() == "S_DSA123"
+
+        mock_ws.recv.return_value = json.dumps({"results": [
+            {"cmd": "GET_V", "payload": "V_12V"},
+            {"cmd": "GET_A", "payload": "A_1.5A"}
+        ]})
+        with pytest.raises(ValueError,
+                           match="Invalid ampere response format"):
+            client.get_batch(['VOLTAGE', 'AMPERE', 'SERIAL'])
+        assert sent[1] == {"cmds": ["GET_V", "GET_A"]}
+        assert client.identity.get() is None
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_get_batch_fallback(self, mock_create_connection):
+        """
+        Тест перехода на одиночные команды при отсутствии поддержки пакетов
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        sent = []
+        mock_ws.send.side_effect = lambda data: sent.append(json.loads(data))
+        responses = [
+            json.dumps({"cmd": "GET_V", "payload": "V_12V"}),
+            json.dumps({"cmd": "GET_A", "payload": "A_1A"})
+        ]
+        mock_ws.recv.side_effect = [
+            json.dumps({"cmd": None, "error": "Invalid request"})
+        ] + responses * 2
+
+        client = WebsocketClient("ws://localhost:8765")
+        first = client.get_batch(['VOLTAGE', 'AMPERE'])
+        second = client.get_batch(['VOLTAGE', 'AMPERE'])
+
+        assert first == second == {'VOLTAGE': "V_12V", 'AMPERE': "A_1A"}
+        assert sent == [{"cmds": ["GET_V", "GET_A"]}] + \
+            [{"cmd": "GET_V"}, {"cmd": "GET_A"}] * 2
+
+        mock_ws.recv.side_effect = [json.dumps({"results": [
+            {"cmd": "GET_V", "payload": "V_12V"},
+            {"cmd": "GET_A", "payload": "A_1A"}
+        ]})]
+        client.open()
+        assert client.get_batch(['VOLTAGE', 'AMPERE'])['AMPERE'] == "A_1A"
+        assert sent[-1] == {"cmds": ["GET_V", "GET_A"]}
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_get_batch_fallback_on_timeout(self, mock_create_connection):
+        """
+        Тест перехода на одиночные команды, если сервер не ответил на пакет
+        """
+        mock_ws = Mock()
+        mock_create_connection.return_value = mock_ws
+        mock_ws.recv.side_effect = [
+            websocket.WebSocketTimeoutException("timed out"),
+            json.dumps({"cmd": "GET_V", "payload": "V_12V"}),
+            json.dumps({"cmd": "GET_A", "payload": "A_1A"})
+        ]
+
+        client = WebsocketClient("ws://localhost:8765")
+
+        assert client.get_batch(['VOLTAGE', 'AMPERE']) == \
+            {'VOLTAGE': "V_12V", 'AMPERE': "A_1A"}
+        assert client._batch_supported is False
+
+    def test_late_batch_response_after_fallback(self):
+        """
+        Тест: запоздавший ответ на пакет после перехода на одиночные
+        команды отбрасывается
+        """
+        with SlowBatchEmulator() as emulator, \
+                WebsocketClient(emulator.url, timeout=0.2) as client:
+            assert client.get_batch(['VOLTAGE', 'AMPERE']) == \
+                {'VOLTAGE': "V_12V", 'AMPERE': "A_5A"}
+            assert client._batch_supported is False
+            assert client.unmatched_responses == 1
+            assert client.get_voltage() == "V_12V"
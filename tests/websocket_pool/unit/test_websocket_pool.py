@@ -0,0 +1,186 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_websocket_pool.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Мок тесты для websocket_pool.py
+# Примечание: Используется unittest.mock для эмуляции поведения websocket
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import json
+import threading
+import time
+import pytest
+import websocket
+from unittest.mock import Mock, patch
+from src.websocket_pool import WebsocketPool
+
+
+def make_ws(alive=True):
+    """
+    Создаёт мок соединения, отвечающего на GET_V и на ping.
+    """
+    mock_ws = Mock()
+    mock_ws.connected = True
+    mock_ws.recv.return_value = json.dumps({"cmd": "GET_V",
+                                            "payload": "V_12V"})
+    if alive:
+        mock_ws.recv_data_frame.return_value = (websocket.ABNF.OPCODE_PONG,
+                                                Mock())
+    else:
+        mock_ws.recv_data_frame.side_effect = \
+            websocket.WebSocketTimeoutException("timed out")
+    return mock_ws
+
+
+def wait_for(condition, timeout=2.0):
+    """
+    Ожидает выполнения условия.
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition not met"
+        time.sleep(0.01)
+
+
+class TestWebsocketPool:
+    """
+    Тесты для класса WebsocketPool
+    """
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_connections_reused(self, mock_create_connection):
+        """
+        Тест повторного использования прогретых соединений
+        """
+        mock_create_connection.side_effect = lambda url, timeout: make_ws()
+
+        with WebsocketPool("ws://localhost:8765", size=2) as pool:
+            wait_for(lambda: pool.idle_count == 2)
+            for _ in range(10):
+                with pool.connection(timeout=1.0) as client:
+                    assert client.get_voltage() == "V_12V"
+
+        assert mock_create_connection.call_count == 2
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_broken_connection_replaced(self, mock_create_connection):
+        """
+        Тест замены соединения после сетевой ошибки
+        """
+        broken = make_ws()
+        broken.recv.side_effect = websocket.WebSocketConnectionClosedException
+        mock_create_connection.side_effect = [broken, make_ws()]
+
+        with WebsocketPool("ws://localhost:8765", size=1) as pool:
+            with pytest.raises(websocket.WebSocketConnectionClosedException):
+                with pool.connection(timeout=1.0) as client:
+                    client.get_voltage()
+
+            with pool.connection(timeout=1.0) as client:
+                assert client.get_voltage() == "V_12V"
+
+        assert mock_create_connection.call_count == 2
+
+    @patch('src.websocket_pool.random.uniform', lambda low, high: high)
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_reconnect_with_backoff(self, mock_create_connection):
+        """
+        Тест переподключения с экспоненциальной задержкой
+        """
+        attempts = []
+
+        def connect(url, timeout):
+            attempts.append(time.monotonic())
+            if len(attempts) < 4:
+                raise ConnectionRefusedError("refused")
+            return make_ws()
+
+        mock_create_connection.side_effect = connect
+
+        with WebsocketPool("ws://localhost:8765", size=1,
+                           backoff_base=0.05) as pool:
+            with pool.connection(timeout=2.0) as client:
+                assert client.get_voltage() == "V_12V"
+
+        delays = [b - a for a, b in zip(attempts, attempts[1:])]
+        assert delays[0] >= 0.05
+        assert delays[1] >= 0.1
+        assert delays[2] >= 0.2
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_health_check_drops_dead(self, mock_create_connection):
+        """
+        Тест отбраковки соединения, не ответившего на ping
+        """
+        dead = make_ws(alive=False)
+        mock_create_connection.side_effect = [dead, make_ws()]
+
+        with WebsocketPool("ws://localhost:8765", size=1,
+                           health_check_interval=0.05) as pool:
+            wait_for(lambda: mock_create_connection.call_count == 2)
+            with pool.connection(timeout=1.0) as client:
+                assert client.ws is not dead
+
+        dead.ping.assert_called()
+        dead.close.assert_called_once()
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_acquire_timeout(self, mock_create_connection):
+        """
+        Тест ожидания соединения при недоступном сервере
+        """
+        mock_create_connection.side_effect = ConnectionRefusedError
+
+        with WebsocketPool("ws://localhost:8765", size=1) as pool:
+            with pytest.raises(TimeoutError,
+                               match="No WebSocket connection available"):
+                pool.acquire(timeout=0.1)
+
+    @patch('src.websocket_client.websocket.create_connection')
+    def test_close_outside_lock(self, mock_create_connection):
+        """
+        Тест: медленное закрытие отбракованного соединения не блокирует
+        остальных потребителей пула
+        """
+        closing = threading.Event()
+        unblock = threading.Event()
+        slow = make_ws()
+        slow.close.side_effect = lambda *args, **kwargs: (
+            closing.set(), unblock.wait(2.0))
+        connections = [slow, make_ws()]
+
+        def connect(url, timeout):
+            # Замена ждёт конца теста, чтобы не менять idle_count
+            if not connections:
+                unblock.wait(2.0)
+                return make_ws()
+            return connections.pop(0)
+
+        mock_create_connection.side_effect = connect
+
+        with WebsocketPool("ws://localhost:8765", size=2) as pool:
+            wait_for(lambda: pool.idle_count == 2)
+            first = pool.acquire(timeout=1.0)
+            second = pool.acquire(timeout=1.0)
+            broken, healthy = ((first, second) if first.ws is slow
+                               else (second, first))
+            thread = threading.Thread(target=pool.release,
+                                      args=(broken, True))
+            thread.start()
+            try:
+                assert closing.wait(1.0)
+                started = time.monotonic()
+                pool.release(healthy)
+                assert pool.idle_count == 1
+                with pool.connection(timeout=1.0) as client:
+                    assert client.get_voltage() == "V_12V"
+                assert time.monotonic() - started < 0.5
+            finally:
+                unblock.set()
+                thread.join()
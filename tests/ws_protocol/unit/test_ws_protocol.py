@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# ============================================================================
+# Название: test_ws_protocol.py
+# Родитель: Pytest
+# Автор:    Григорий Пахомов
+# Версия:   1
+# Дата:     16.10.2026
+# Описание: Тесты для ws_protocol.py
+# Примечание: Совместимость проверяется клиентом websocket-client против
+#             сервера на ws_protocol.accept в отдельном потоке
+# ============================================================================
+
+
+# ============================================================================
+# Импорт модулей и глобальных переменных
+# ============================================================================
+import asyncio
+import json
+import threading
+import pytest
+from src import ws_protocol
+from src.websocket_client import WebsocketClient
+
+
+def read_encoded(data: bytes) -> tuple:
+    """
+    Разбирает закодированный кадр через read_frame.
+    """
+    async def scenario():
+        reader = asyncio.StreamReader()
+        reader.feed_data(data)
+        reader.feed_eof()
+        return await ws_protocol.read_frame(reader)
+    return asyncio.run(scenario())
+
+
+@pytest.fixture
+def echo_server():
+    """
+    Запускает в отдельном потоке сервер, отвечающий на {"cmd": ...}
+    ответом {"cmd": ..., "payload": ...}. Возвращает URL сервера.
+    """
+    loop = asyncio.new_event_loop()
+    payloads = {"GET_V": "V_12V", "GET_A": "A_1A", "GET_S": "S_DSA123"}
+
+    async def handle(reader, writer):
+        connection, _ = await ws_protocol.accept(reader, writer)
+        try:
+            while True:
+                request = json.loads(await connection.recv())
+                await connection.send(json.dumps(
+                    {"cmd": request["cmd"],
+                     "payload": payloads[request["cmd"]]}))
+        except ws_protocol.WebsocketClosedError:
+            pass
+        finally:
+            await connection.close()
+
+    server = loop.run_until_complete(
+        asyncio.start_server(handle, "127.0.0.1", 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+
+    yield f"ws://127.0.0.1:{port}"
+
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    server.close()
+    loop.close()
+
+
+class TestWsProtocol:
+    """
+    Тесты для модуля ws_protocol
+    """
+    def test_accept_key(self):
+        """
+        Тест вычисления Sec-WebSocket-Accept по примеру из RFC 6455
+        """
+        assert (ws_protocol.accept_key("dGhlIHNhbXBsZSBub25jZQ==")
+                == "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=")
+
+    @pytest.mark.parametrize("size", [0, 5, 125, 126, 65535, 65536])
+    def test_frame_roundtrip(self, size):
+        """
+        Тест кодирования и разбора кадров разной длины с маской и без
+        """
+        payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        for mask in (False, True):
+            frame = ws_protocol.encode_frame(ws_protocol.OPCODE_BINARY,
+                                             payload, mask=mask)
+            assert read_encoded(frame) == (True, ws_protocol.OPCODE_BINARY,
+                                           payload)
+
+    def test_frame_size_limit(self):
+        """
+        Тест отказа от кадра больше допустимого размера
+        """
+        frame = ws_protocol.encode_frame(ws_protocol.OPCODE_TEXT, b"x" * 200)
+
+        async def scenario():
+            reader = asyncio.StreamReader()
+            reader.feed_data(frame)
+            return await ws_protocol.read_frame(reader, max_size=100)
+
+        with pytest.raises(ValueError, match="exceeds"):
+            asyncio.run(scenario())
+
+    def test_interop_with_websocket_client(self, echo_server):
+        """
+        Тест совместимости серверной части с websocket-client
+        """
+        with WebsocketClient(echo_server) as client:
+            assert client.get_voltage() == "V_12V"
+            assert client.get_ampere() == "A_1A"
+            assert client.get_serial() == "S_DSA123"
+            client.ws.ping(b"probe")
+            assert client.get_voltage() == "V_12V"